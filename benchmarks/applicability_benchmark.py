@@ -0,0 +1,151 @@
+"""Benchmark measuring the runtime of Operator.is_applicable and Operator.apply on generated states with many facts."""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from pddl_plus_parser.lisp_parsers import DomainParser, ProblemParser
+from pddl_plus_parser.models import Domain, Operator, Problem, State
+
+BENCHMARK_DOMAIN = """(define (domain logistics-benchmark)
+(:requirements :strips :typing :negative-preconditions :numeric-fluents)
+(:types crate depot - object)
+(:predicates (at ?c - crate ?d - depot) (clear ?d - depot) (connected ?from - depot ?to - depot))
+(:functions (weight ?c - crate) (capacity ?d - depot))
+(:action move
+    :parameters (?c - crate ?from - depot ?to - depot)
+    :precondition (and (at ?c ?from) (clear ?to) (connected ?from ?to) (not (at ?c ?to))
+                       (<= (weight ?c) (capacity ?to)))
+    :effect (and (not (at ?c ?from)) (at ?c ?to) (decrease (capacity ?to) (weight ?c))))
+)
+"""
+
+
+def generate_problem(num_crates: int, num_depots: int) -> str:
+    """Generates a problem in which every crate is located in a depot and all the depots are connected.
+
+    :param num_crates: the number of crates in the problem.
+    :param num_depots: the number of depots in the problem.
+    :return: the string representing the problem.
+    """
+    crates = " ".join(f"crate{i}" for i in range(num_crates))
+    depots = " ".join(f"depot{i}" for i in range(num_depots))
+    facts = [f"(at crate{i} depot{i % num_depots})" for i in range(num_crates)]
+    facts.extend(f"(clear depot{i})" for i in range(num_depots))
+    facts.extend(
+        f"(connected depot{i} depot{j})" for i in range(num_depots) for j in range(num_depots) if i != j
+    )
+    facts.extend(f"(= (weight crate{i}) {i % 10 + 1})" for i in range(num_crates))
+    facts.extend(f"(= (capacity depot{i}) 100)" for i in range(num_depots))
+    return (
+        f"(define (problem logistics-benchmark-problem) (:domain logistics-benchmark)\n"
+        f"(:objects {crates} - crate {depots} - depot)\n"
+        f"(:init {' '.join(facts)})\n"
+        f"(:goal (and (at crate0 depot1))))\n"
+    )
+
+
+def parse_benchmark_problem(num_crates: int, num_depots: int) -> Tuple[Domain, Problem]:
+    """Parses the benchmark domain and a generated problem.
+
+    :param num_crates: the number of crates in the problem.
+    :param num_depots: the number of depots in the problem.
+    :return: the parsed domain and problem.
+    """
+    domain = DomainParser(domain_str=BENCHMARK_DOMAIN).parse_domain()
+    with tempfile.TemporaryDirectory() as working_directory:
+        problem_path = Path(working_directory) / "problem.pddl"
+        problem_path.write_text(generate_problem(num_crates, num_depots))
+        problem = ProblemParser(problem_path=problem_path, domain=domain).parse_problem()
+
+    return domain, problem
+
+
+def create_operators(domain: Domain, problem: Problem, num_operators: int) -> List[Operator]:
+    """Creates grounded operators of the move action, some of which are applicable in the initial state.
+
+    :param domain: the benchmark domain.
+    :param problem: the benchmark problem.
+    :param num_operators: the number of operators to create.
+    :return: the grounded operators.
+    """
+    num_depots = len([obj for obj in problem.objects.values() if obj.type.name == "depot"])
+    num_crates = len(problem.objects) - num_depots
+    operators = []
+    for index in range(num_operators):
+        crate_index = index % num_crates
+        from_depot = crate_index % num_depots if index % 2 == 0 else (crate_index + 1) % num_depots
+        to_depot = (from_depot + 1) % num_depots
+        operator = Operator(
+            action=domain.actions["move"],
+            domain=domain,
+            grounded_action_call=[f"crate{crate_index}", f"depot{from_depot}", f"depot{to_depot}"],
+            problem_objects=problem.objects,
+        )
+        operator.ground()
+        operators.append(operator)
+
+    return operators
+
+
+def measure_applicability(operators: List[Operator], state: State, num_repetitions: int) -> Tuple[float, int]:
+    """Measures the runtime of checking the applicability of the operators in the state.
+
+    :param operators: the grounded operators to check.
+    :param state: the state to check the operators in.
+    :param num_repetitions: the number of times to check every operator.
+    :return: the runtime in seconds and the number of applicable operators.
+    """
+    num_applicable = 0
+    start_time = time.perf_counter()
+    for _ in range(num_repetitions):
+        num_applicable = sum(1 for operator in operators if operator.is_applicable(state))
+
+    return time.perf_counter() - start_time, num_applicable
+
+
+def measure_application(operators: List[Operator], state: State, num_repetitions: int) -> float:
+    """Measures the runtime of applying the applicable operators on the state.
+
+    :param operators: the grounded operators to apply.
+    :param state: the state to apply the operators on.
+    :param num_repetitions: the number of times to apply every operator.
+    :return: the runtime in seconds.
+    """
+    applicable_operators = [operator for operator in operators if operator.is_applicable(state)]
+    start_time = time.perf_counter()
+    for _ in range(num_repetitions):
+        for operator in applicable_operators:
+            operator.apply(state, skip_validation=True)
+
+    return time.perf_counter() - start_time
+
+
+def main() -> None:
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--num_crates", type=int, default=2000)
+    args_parser.add_argument("--num_depots", type=int, default=20)
+    args_parser.add_argument("--num_operators", type=int, default=500)
+    args_parser.add_argument("--num_repetitions", type=int, default=5)
+    args = args_parser.parse_args()
+
+    domain, problem = parse_benchmark_problem(args.num_crates, args.num_depots)
+    state = State(predicates=problem.initial_state_predicates, fluents=problem.initial_state_fluents, is_init=True)
+    num_facts = sum(len(predicates) for predicates in state.state_predicates.values())
+    operators = create_operators(domain, problem, args.num_operators)
+    runtime, num_applicable = measure_applicability(operators, state, args.num_repetitions)
+    print(
+        f"Checked {len(operators)} operators {args.num_repetitions} times on a state with {num_facts} facts "
+        f"({num_applicable} applicable): {runtime:.3f} seconds, "
+        f"{runtime / (len(operators) * args.num_repetitions) * 1e6:.1f} microseconds per check"
+    )
+    runtime = measure_application(operators, state, args.num_repetitions)
+    print(
+        f"Applied {num_applicable} operators {args.num_repetitions} times: {runtime:.3f} seconds, "
+        f"{runtime / (max(num_applicable, 1) * args.num_repetitions) * 1e3:.2f} milliseconds per application"
+    )
+
+
+if __name__ == "__main__":
+    main()
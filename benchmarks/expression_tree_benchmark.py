@@ -0,0 +1,110 @@
+"""Benchmark measuring the memory and runtime of creating, copying and grounding numeric expression trees."""
+import argparse
+import time
+import tracemalloc
+from typing import Dict, List, Tuple
+
+from pddl_plus_parser.lisp_parsers import DomainParser, PDDLTokenizer
+from pddl_plus_parser.models import Domain, NumericalExpressionTree, construct_expression_tree
+from pddl_plus_parser.models.grounding_utils import ground_numeric_calculation_tree
+
+BENCHMARK_DOMAIN = """(define (domain expressions-benchmark)
+(:requirements :typing :numeric-fluents)
+(:types crate depot - object)
+(:functions (weight ?c - crate) (capacity ?d - depot) (distance ?from - depot ?to - depot) (fuel-cost))
+)
+"""
+
+BENCHMARK_EXPRESSION = (
+    "(<= (+ (* (weight ?c) (distance ?from ?to)) (+ (* (fuel-cost) (- (capacity ?from) (weight ?c))) "
+    "(/ (+ (distance ?to ?from) 12.5) (- (capacity ?to) 3)))) (* 2 (capacity ?to)))"
+)
+
+
+def create_lifted_tree(domain: Domain) -> NumericalExpressionTree:
+    """Parses the benchmark expression into a lifted expression tree.
+
+    :param domain: the benchmark domain.
+    :return: the lifted expression tree.
+    """
+    return NumericalExpressionTree(
+        construct_expression_tree(PDDLTokenizer(pddl_str=BENCHMARK_EXPRESSION).parse(), domain.functions)
+    )
+
+
+def create_parameter_maps(num_groundings: int) -> List[Dict[str, str]]:
+    """Creates the parameter maps of the groundings of the benchmark expression.
+
+    :param num_groundings: the number of groundings to create.
+    :return: the mappings between the expression's parameters and the objects.
+    """
+    return [
+        {"?c": f"crate{index}", "?from": f"depot{index % 20}", "?to": f"depot{(index + 1) % 20}"}
+        for index in range(num_groundings)
+    ]
+
+
+def measure_grounding(
+    lifted_tree: NumericalExpressionTree, domain: Domain, parameter_maps: List[Dict[str, str]]
+) -> Tuple[float, int]:
+    """Measures the runtime and the memory of grounding the lifted expression tree with every parameter map.
+
+    Note: the memory is measured in a separate run since tracing the allocations slows down the grounding.
+
+    :param lifted_tree: the lifted expression tree.
+    :param domain: the benchmark domain.
+    :param parameter_maps: the mappings between the expression's parameters and the objects.
+    :return: the runtime in seconds and the memory, in bytes, allocated for the grounded trees.
+    """
+    start_time = time.perf_counter()
+    for parameters_map in parameter_maps:
+        ground_numeric_calculation_tree(lifted_tree, parameters_map, domain)
+
+    runtime = time.perf_counter() - start_time
+    tracemalloc.start()
+    grounded_trees = [
+        ground_numeric_calculation_tree(lifted_tree, parameters_map, domain) for parameters_map in parameter_maps
+    ]
+    allocated_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del grounded_trees
+    return runtime, allocated_memory
+
+
+def measure_copy(lifted_tree: NumericalExpressionTree, num_copies: int) -> float:
+    """Measures the runtime of copying the expression tree.
+
+    :param lifted_tree: the expression tree to copy.
+    :param num_copies: the number of copies to create.
+    :return: the runtime in seconds.
+    """
+    start_time = time.perf_counter()
+    for _ in range(num_copies):
+        lifted_tree.__copy__()
+
+    return time.perf_counter() - start_time
+
+
+def main() -> None:
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--num_groundings", type=int, default=20000)
+    args = args_parser.parse_args()
+
+    domain = DomainParser(domain_str=BENCHMARK_DOMAIN).parse_domain()
+    lifted_tree = create_lifted_tree(domain)
+    num_nodes = len(list(lifted_tree))
+    runtime, allocated_memory = measure_grounding(lifted_tree, domain, create_parameter_maps(args.num_groundings))
+    print(
+        f"Grounded an expression with {num_nodes} nodes {args.num_groundings} times: {runtime:.3f} seconds, "
+        f"{runtime / args.num_groundings * 1e6:.1f} microseconds and "
+        f"{allocated_memory / args.num_groundings:.0f} bytes per grounded tree"
+    )
+    runtime = measure_copy(lifted_tree, args.num_groundings)
+    print(
+        f"Copied the expression {args.num_groundings} times: {runtime:.3f} seconds, "
+        f"{runtime / args.num_groundings * 1e6:.1f} microseconds per copy"
+    )
+
+
+if __name__ == "__main__":
+    main()
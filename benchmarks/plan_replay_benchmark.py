@@ -0,0 +1,68 @@
+"""Benchmark measuring the runtime of replaying a plan with the library's debug logging enabled and disabled."""
+import argparse
+import logging
+import time
+from typing import List
+
+from benchmarks.applicability_benchmark import parse_benchmark_problem
+from pddl_plus_parser import set_library_log_level
+from pddl_plus_parser.exporters import TrajectoryExporter
+from pddl_plus_parser.models import Domain, Problem
+
+
+def create_plan(num_actions: int, num_depots: int) -> List[str]:
+    """Creates a plan in which every action moves a different crate to the next depot.
+
+    :param num_actions: the number of actions in the plan.
+    :param num_depots: the number of depots in the problem.
+    :return: the action calls of the plan.
+    """
+    return [
+        f"(move crate{index} depot{index % num_depots} depot{(index + 1) % num_depots})" for index in range(num_actions)
+    ]
+
+
+def measure_replay(domain: Domain, problem: Problem, plan: List[str], num_repetitions: int) -> float:
+    """Measures the runtime of replaying the plan from the initial state of the problem.
+
+    :param domain: the benchmark domain.
+    :param problem: the benchmark problem.
+    :param plan: the action calls of the plan.
+    :param num_repetitions: the number of times to replay the plan.
+    :return: the runtime in seconds.
+    """
+    start_time = time.perf_counter()
+    for _ in range(num_repetitions):
+        TrajectoryExporter(domain).parse_plan(problem, action_sequence=plan)
+
+    return time.perf_counter() - start_time
+
+
+def main() -> None:
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--num_crates", type=int, default=2000)
+    args_parser.add_argument("--num_depots", type=int, default=20)
+    args_parser.add_argument("--num_actions", type=int, default=200)
+    args_parser.add_argument("--num_repetitions", type=int, default=5)
+    args = args_parser.parse_args()
+
+    # Simulates an application that logs everything but discards the records, so only the logging overhead is measured.
+    root_logger = logging.getLogger()
+    root_logger.addHandler(logging.NullHandler())
+    root_logger.setLevel(logging.DEBUG)
+
+    domain, problem = parse_benchmark_problem(args.num_crates, args.num_depots)
+    plan = create_plan(args.num_actions, args.num_depots)
+    num_replayed_actions = args.num_actions * args.num_repetitions
+    for level in [logging.DEBUG, logging.WARNING]:
+        set_library_log_level(level)
+        runtime = measure_replay(domain, problem, plan, args.num_repetitions)
+        print(
+            f"Replayed a plan with {args.num_actions} actions {args.num_repetitions} times with the library's log "
+            f"level set to {logging.getLevelName(level)}: {runtime:.3f} seconds, "
+            f"{runtime / num_replayed_actions * 1e3:.2f} milliseconds per action"
+        )
+
+
+if __name__ == "__main__":
+    main()
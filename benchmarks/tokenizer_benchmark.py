@@ -0,0 +1,70 @@
+"""Benchmark comparing the regular and the streaming tokenization modes on large generated trajectory files."""
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Tuple
+
+from pddl_plus_parser.lisp_parsers import PDDLTokenizer
+
+
+def generate_trajectory_file(output_path: Path, num_steps: int, facts_per_state: int) -> None:
+    """Generates a synthetic trajectory file that has the same structure as the exported trajectories.
+
+    :param output_path: the path to write the trajectory to.
+    :param num_steps: the number of operators in the trajectory.
+    :param facts_per_state: the number of facts and fluents in every state.
+    """
+    with open(output_path, "wt") as trajectory_file:
+        trajectory_file.write("(")
+        for step in range(num_steps + 1):
+            label = ":init" if step == 0 else ":state"
+            fluents = " ".join(f"(= (load_limit truck{i}) {step + i}.0)" for i in range(facts_per_state))
+            facts = " ".join(f"(at crate{i} depot{(step + i) % 7})" for i in range(facts_per_state))
+            trajectory_file.write(f"({label} {fluents} {facts})\n")
+            if step < num_steps:
+                trajectory_file.write(f"(operator: (drive truck{step} depot{step % 7} depot{(step + 1) % 7}))\n")
+
+        trajectory_file.write(")")
+
+
+def measure_parse(file_path: Path, streaming: bool) -> Tuple[float, int]:
+    """Parses the file and measures the runtime and the peak memory of the process.
+
+    :param file_path: the path to the file to parse.
+    :param streaming: whether to use the streaming tokenization mode.
+    :return: the runtime in seconds and the peak memory in bytes.
+    """
+    start_time = time.perf_counter()
+    PDDLTokenizer(file_path=file_path, streaming=streaming).parse()
+    runtime = time.perf_counter() - start_time
+
+    # Memory tracing slows down the execution, so the peak memory is measured in a separate run.
+    tracemalloc.start()
+    PDDLTokenizer(file_path=file_path, streaming=streaming).parse()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return runtime, peak_memory
+
+
+def main() -> None:
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--num_steps", type=int, default=2000)
+    args_parser.add_argument("--facts_per_state", type=int, default=100)
+    args = args_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as working_directory:
+        trajectory_path = Path(working_directory) / "generated.trajectory"
+        generate_trajectory_file(trajectory_path, args.num_steps, args.facts_per_state)
+        print(f"Generated trajectory of size {trajectory_path.stat().st_size / 2 ** 20:.1f} MB")
+        for streaming in [False, True]:
+            runtime, peak_memory = measure_parse(trajectory_path, streaming)
+            print(
+                f"{'streaming' if streaming else 'regular'}: runtime - {runtime:.3f} seconds, "
+                f"peak memory - {peak_memory / 2 ** 20:.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
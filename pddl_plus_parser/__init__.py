@@ -0,0 +1,5 @@
+from .logging_utils import set_library_log_level, configure_library_logging_from_environment
+
+__version__ = "3.17.0"
+
+configure_library_logging_from_environment()
@@ -3,3 +3,5 @@ from .numeric_trajectory_exporter import TrajectoryExporter, TrajectoryTriplet
 from .enhsp_output_parser import ENHSPParser
 from .domain_exporter import DomainExporter
 from .problem_exporter import ProblemExporter
+from .columnar_trajectory_exporter import ColumnarTrajectory, ColumnarTrajectoryExporter, MISSING_PARAMETER_CODE
+from .trajectory_dataset import TrajectoryDataset
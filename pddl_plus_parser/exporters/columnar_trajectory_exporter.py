@@ -0,0 +1,329 @@
+"""Module that exports trajectories to a columnar layout of NumPy arrays."""
+import logging
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from pddl_plus_parser.models import Observation, State, create_fluents_matrix
+from .numeric_trajectory_exporter import TrajectoryTriplet
+
+# The code of a missing action parameter in the padded action parameters matrix.
+MISSING_PARAMETER_CODE = -1
+VOCABULARY_ARRAYS = ["fluent_names", "fact_names", "action_names", "object_names"]
+DATA_ARRAYS = [
+    "previous_fluents",
+    "next_fluents",
+    "previous_facts",
+    "next_facts",
+    "actions",
+    "action_parameters",
+    "is_successful",
+]
+
+
+def _load_memory_mapped_npz(npz_path: Path) -> Dict[str, np.ndarray]:
+    """Loads the arrays of an npz file as read-only memory maps of the file.
+
+    Note: only arrays that are stored uncompressed can be memory mapped, compressed arrays are read into memory.
+
+    :param npz_path: the path to the npz file.
+    :return: mapping between the names of the arrays and the arrays.
+    """
+    arrays = {}
+    with zipfile.ZipFile(npz_path) as npz_file, open(npz_path, "rb") as raw_file:
+        for member in npz_file.infolist():
+            array_name = member.filename[: -len(".npy")]
+            if member.compress_type != zipfile.ZIP_STORED:
+                with npz_file.open(member) as member_file:
+                    arrays[array_name] = np.lib.format.read_array(member_file, allow_pickle=False)
+
+                continue
+
+            # The local file header has a fixed size of 30 bytes followed by the file name and the extra field.
+            raw_file.seek(member.header_offset + 26)
+            file_name_length, extra_field_length = np.frombuffer(raw_file.read(4), dtype="<u2")
+            raw_file.seek(member.header_offset + 30 + int(file_name_length) + int(extra_field_length))
+            version = np.lib.format.read_magic(raw_file)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(raw_file)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(raw_file)
+
+            if int(np.prod(shape)) == 0:
+                arrays[array_name] = np.empty(shape, dtype=dtype)
+                continue
+
+            arrays[array_name] = np.memmap(
+                npz_path,
+                dtype=dtype,
+                mode="r",
+                offset=raw_file.tell(),
+                shape=shape,
+                order="F" if fortran_order else "C",
+            )
+
+    return arrays
+
+
+class ColumnarTrajectory:
+    """Columnar representation of the transitions of a trajectory.
+
+    Note: the rows of the arrays are the transitions of the trajectory and the columns are defined by the sorted
+        vocabularies, i.e., the column of a fluent is its index in fluent_names. Fluents that are missing from a state
+        have NaN values and action parameters are padded with MISSING_PARAMETER_CODE.
+    """
+
+    fluent_names: List[str]
+    fact_names: List[str]
+    action_names: List[str]
+    object_names: List[str]
+    # Matrices of shape (transitions x fluents) with the values of the fluents before and after the actions.
+    previous_fluents: np.ndarray
+    next_fluents: np.ndarray
+    # Boolean matrices of shape (transitions x facts) indicating which facts hold before and after the actions.
+    previous_facts: np.ndarray
+    next_facts: np.ndarray
+    # The index of the name of the action in action_names for every transition.
+    actions: np.ndarray
+    # Matrix of shape (transitions x maximal arity) with the indexes of the action parameters in object_names.
+    action_parameters: np.ndarray
+    is_successful: np.ndarray
+
+    def __init__(
+        self,
+        fluent_names: List[str],
+        fact_names: List[str],
+        action_names: List[str],
+        object_names: List[str],
+        previous_fluents: np.ndarray,
+        next_fluents: np.ndarray,
+        previous_facts: np.ndarray,
+        next_facts: np.ndarray,
+        actions: np.ndarray,
+        action_parameters: np.ndarray,
+        is_successful: np.ndarray,
+    ):
+        self.fluent_names = fluent_names
+        self.fact_names = fact_names
+        self.action_names = action_names
+        self.object_names = object_names
+        self.previous_fluents = previous_fluents
+        self.next_fluents = next_fluents
+        self.previous_facts = previous_facts
+        self.next_facts = next_facts
+        self.actions = actions
+        self.action_parameters = action_parameters
+        self.is_successful = is_successful
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def get_action_call(self, transition_index: int) -> Tuple[str, List[str]]:
+        """Decodes the action call of a transition.
+
+        :param transition_index: the index of the transition.
+        :return: the name of the action and its parameters.
+        """
+        parameters = [
+            self.object_names[object_code]
+            for object_code in self.action_parameters[transition_index]
+            if object_code != MISSING_PARAMETER_CODE
+        ]
+        return self.action_names[self.actions[transition_index]], parameters
+
+    def save(self, output_path: Path, compress: bool = False) -> None:
+        """Saves the arrays of the trajectory to an npz file.
+
+        :param output_path: the path to the output npz file.
+        :param compress: whether to compress the arrays, compressed arrays cannot be loaded as memory maps.
+        """
+        save_function = np.savez_compressed if compress else np.savez
+        with open(output_path, "wb") as output_file:
+            save_function(
+                output_file,
+                **{
+                    vocabulary_name: np.array(getattr(self, vocabulary_name), dtype=np.str_)
+                    for vocabulary_name in VOCABULARY_ARRAYS
+                },
+                **{array_name: getattr(self, array_name) for array_name in DATA_ARRAYS},
+            )
+
+    @classmethod
+    def load(cls, input_path: Path, memory_map: bool = True) -> "ColumnarTrajectory":
+        """Loads a trajectory that was saved to an npz file.
+
+        :param input_path: the path to the npz file.
+        :param memory_map: whether to memory map the arrays instead of reading them into memory.
+        :return: the loaded columnar trajectory.
+        """
+        if memory_map:
+            arrays = _load_memory_mapped_npz(input_path)
+
+        else:
+            with np.load(input_path, allow_pickle=False) as npz_file:
+                arrays = {array_name: npz_file[array_name] for array_name in npz_file.files}
+
+        return cls(
+            **{vocabulary_name: arrays[vocabulary_name].tolist() for vocabulary_name in VOCABULARY_ARRAYS},
+            **{array_name: arrays[array_name] for array_name in DATA_ARRAYS},
+        )
+
+
+class ColumnarTrajectoryExporter:
+    """Exports observations and trajectory triplets to columnar NumPy arrays.
+
+    Note: vocabularies that are not given are created from the exported data, sorted so that the columns are stable.
+        Give the vocabularies explicitly to export multiple trajectories with the same columns.
+    """
+
+    fluent_names: Optional[List[str]]
+    fact_names: Optional[List[str]]
+    action_names: Optional[List[str]]
+    object_names: Optional[List[str]]
+    logger: logging.Logger
+
+    def __init__(
+        self,
+        fluent_names: Optional[List[str]] = None,
+        fact_names: Optional[List[str]] = None,
+        action_names: Optional[List[str]] = None,
+        object_names: Optional[List[str]] = None,
+    ):
+        self.fluent_names = fluent_names
+        self.fact_names = fact_names
+        self.action_names = action_names
+        self.object_names = object_names
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def _get_state_facts(state: State) -> List[str]:
+        """Returns the untyped representations of the facts of the state.
+
+        :param state: the state to extract the facts from.
+        :return: the representations of the facts that hold in the state.
+        """
+        return [
+            predicate.untyped_representation
+            for predicates in state.state_predicates.values()
+            for predicate in predicates
+        ]
+
+    @staticmethod
+    def _create_columns(
+        given_vocabulary: Optional[List[str]], observed_names: Iterable[str], vocabulary_name: str
+    ) -> Tuple[List[str], Dict[str, int]]:
+        """Creates the vocabulary of the columns and validates that every observed name has a column.
+
+        :param given_vocabulary: the vocabulary given by the user, if any.
+        :param observed_names: the names observed in the exported data.
+        :param vocabulary_name: the name of the vocabulary used in the error message.
+        :return: the vocabulary and the mapping between the names and their columns.
+        """
+        observed_names = set(observed_names)
+        vocabulary = sorted(observed_names) if given_vocabulary is None else list(given_vocabulary)
+        columns = {name: column for column, name in enumerate(vocabulary)}
+        missing_names = observed_names.difference(columns)
+        if len(missing_names) > 0:
+            raise ValueError(
+                f"The {vocabulary_name} vocabulary is missing the following names - {sorted(missing_names)}"
+            )
+
+        return vocabulary, columns
+
+    def _create_facts_matrix(self, states_facts: List[List[str]], fact_columns: Dict[str, int]) -> np.ndarray:
+        """Creates the boolean matrix of the facts that hold in every state.
+
+        :param states_facts: the facts of every state.
+        :param fact_columns: mapping between the facts and their columns.
+        :return: a boolean matrix of shape (states x facts).
+        """
+        facts_matrix = np.zeros((len(states_facts), len(fact_columns)), dtype=np.bool_)
+        for row, state_facts in enumerate(states_facts):
+            facts_matrix[row, [fact_columns[fact] for fact in state_facts]] = True
+
+        return facts_matrix
+
+    def _export(
+        self,
+        previous_states: List[State],
+        action_calls: List[Tuple[str, List[str]]],
+        next_states: List[State],
+        is_successful: List[bool],
+    ) -> ColumnarTrajectory:
+        """Exports the transitions of a trajectory to a columnar trajectory.
+
+        :param previous_states: the states before every action.
+        :param action_calls: the names and the parameters of the actions.
+        :param next_states: the states after every action.
+        :param is_successful: whether every transition was successful.
+        :return: the columnar trajectory.
+        """
+        self.logger.debug("Exporting %d transitions to columnar arrays.", len(action_calls))
+        previous_states_facts = [self._get_state_facts(state) for state in previous_states]
+        next_states_facts = [self._get_state_facts(state) for state in next_states]
+        fluent_names, _ = self._create_columns(
+            self.fluent_names,
+            (fluent_name for state in [*previous_states, *next_states] for fluent_name in state.state_fluents),
+            "fluents",
+        )
+        fact_names, fact_columns = self._create_columns(
+            self.fact_names,
+            (fact for state_facts in [*previous_states_facts, *next_states_facts] for fact in state_facts),
+            "facts",
+        )
+        action_names, action_columns = self._create_columns(
+            self.action_names, (action_name for action_name, _ in action_calls), "actions"
+        )
+        object_names, object_columns = self._create_columns(
+            self.object_names, (object_name for _, parameters in action_calls for object_name in parameters), "objects"
+        )
+
+        max_arity = max((len(parameters) for _, parameters in action_calls), default=0)
+        action_parameters = np.full((len(action_calls), max_arity), MISSING_PARAMETER_CODE, dtype=np.int32)
+        for row, (_, parameters) in enumerate(action_calls):
+            action_parameters[row, : len(parameters)] = [object_columns[object_name] for object_name in parameters]
+
+        return ColumnarTrajectory(
+            fluent_names=fluent_names,
+            fact_names=fact_names,
+            action_names=action_names,
+            object_names=object_names,
+            previous_fluents=create_fluents_matrix(previous_states, fluent_names),
+            next_fluents=create_fluents_matrix(next_states, fluent_names),
+            previous_facts=self._create_facts_matrix(previous_states_facts, fact_columns),
+            next_facts=self._create_facts_matrix(next_states_facts, fact_columns),
+            actions=np.array([action_columns[action_name] for action_name, _ in action_calls], dtype=np.int32),
+            action_parameters=action_parameters,
+            is_successful=np.array(is_successful, dtype=np.bool_),
+        )
+
+    def export_observation(self, observation: Observation) -> ColumnarTrajectory:
+        """Exports the components of a single agent observation to a columnar trajectory.
+
+        :param observation: the observation to export.
+        :return: the columnar trajectory.
+        """
+        return self._export(
+            previous_states=[component.previous_state for component in observation.components],
+            action_calls=[
+                (component.grounded_action_call.name, component.grounded_action_call.parameters)
+                for component in observation.components
+            ],
+            next_states=[component.next_state for component in observation.components],
+            is_successful=[component.is_successful for component in observation.components],
+        )
+
+    def export_triplets(self, triplets: List[TrajectoryTriplet]) -> ColumnarTrajectory:
+        """Exports trajectory triplets to a columnar trajectory.
+
+        :param triplets: the triplets created from a plan.
+        :return: the columnar trajectory.
+        """
+        return self._export(
+            previous_states=[triplet.previous_state for triplet in triplets],
+            action_calls=[(triplet.operator.name, triplet.operator.grounded_call_objects) for triplet in triplets],
+            next_states=[triplet.next_state for triplet in triplets],
+            is_successful=[True] * len(triplets),
+        )
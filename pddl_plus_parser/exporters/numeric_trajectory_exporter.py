@@ -11,6 +11,8 @@ from pddl_plus_parser.models import (
     State,
     ActionCall,
     PDDLObject,
+    OperatorCache,
+    DEFAULT_OPERATOR_CACHE_SIZE,
 )
 
 
@@ -50,11 +52,20 @@ class TrajectoryExporter:
 
     domain: Domain
     allow_invalid_actions: bool
+    operator_cache_size: Optional[int]
+    operator_cache: Optional[OperatorCache]
     logger: logging.Logger
 
-    def __init__(self, domain: Domain, allow_invalid_actions: bool = False):
+    def __init__(
+        self,
+        domain: Domain,
+        allow_invalid_actions: bool = False,
+        operator_cache_size: Optional[int] = DEFAULT_OPERATOR_CACHE_SIZE,
+    ):
         self.domain = domain
         self.allow_invalid_actions = allow_invalid_actions
+        self.operator_cache_size = operator_cache_size
+        self.operator_cache = None
         self.logger = logging.getLogger(__name__)
 
     def _read_plan(self, plan_file_path: Path) -> List[str]:
@@ -80,14 +91,14 @@ class TrajectoryExporter:
         :param problem_objects: the objects of the problem.
         :return: the new triplet containing (s,a,s').
         """
-        self.logger.info(f"Trying to apply the action - {action_call} on the state - {previous_state.serialize()}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Trying to apply the action - {action_call} on the state - {previous_state.serialize()}")
+
         action_descriptor = parse_action_call(action_call)
-        operator = Operator(
-            action=self.domain.actions[action_descriptor.name],
-            domain=self.domain,
-            grounded_action_call=action_descriptor.parameters,
-            problem_objects=problem_objects,
-        )
+        if self.operator_cache is None or self.operator_cache.problem_objects is not problem_objects:
+            self.operator_cache = OperatorCache(self.domain, problem_objects, self.operator_cache_size)
+
+        operator = self.operator_cache.get_operator(action_descriptor.name, action_descriptor.parameters)
         next_state = operator.apply(previous_state, allow_inapplicable_actions=self.allow_invalid_actions)
         return TrajectoryTriplet(previous_state=previous_state, op=operator, next_state=next_state)
 
@@ -120,10 +131,14 @@ class TrajectoryExporter:
         return triplets
 
     @staticmethod
-    def export(triplets: List[TrajectoryTriplet]) -> List[str]:
+    def export(triplets: List[TrajectoryTriplet], delta_encoding: bool = False) -> List[str]:
         """Export the input triplets as a valid trajectory object.
 
+        Note: delta encoded trajectories contain the complete initial state and then, after each operator, only the
+            facts that were added and deleted and the fluents that changed. TrajectoryParser reconstructs the states.
+
         :param triplets: the objects representing the triplets generated from the plan sequence.
+        :param delta_encoding: whether to serialize only the changes between consecutive states.
         :return: a list of strings representing the trajectory.
         """
         serialized_trajectory = []
@@ -131,18 +146,23 @@ class TrajectoryExporter:
         serialized_trajectory.append(first_state.serialize())
         for triplet in triplets:
             serialized_trajectory.append(f"(operator: {str(triplet.operator)})\n")
+            if delta_encoding:
+                serialized_trajectory.append(triplet.next_state.serialize_delta(triplet.previous_state))
+                continue
+
             serialized_trajectory.append(triplet.next_state.serialize())
 
         serialized_trajectory[0] = f"({serialized_trajectory[0]}"
         serialized_trajectory[-1] = f"{serialized_trajectory[-1]})"
         return serialized_trajectory
 
-    def export_to_file(self, triplets: List[TrajectoryTriplet], output_path: Path) -> None:
+    def export_to_file(self, triplets: List[TrajectoryTriplet], output_path: Path, delta_encoding: bool = False) -> None:
         """Export the trajectory to a file.
 
         :param triplets: the trajectory triples.
         :param output_path: the path to the output file.
+        :param delta_encoding: whether to serialize only the changes between consecutive states.
         """
-        trajectory_lines = self.export(triplets)
+        trajectory_lines = self.export(triplets, delta_encoding)
         with open(output_path, "wt") as output_path:
             output_path.writelines(trajectory_lines)
@@ -0,0 +1,226 @@
+"""Module that stores datasets of trajectories in a packed binary format that is loaded using memory maps."""
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+
+from pddl_plus_parser.models import Observation
+from .columnar_trajectory_exporter import (
+    ColumnarTrajectory,
+    ColumnarTrajectoryExporter,
+    MISSING_PARAMETER_CODE,
+    VOCABULARY_ARRAYS,
+)
+
+DATASET_INDEX_FILE_NAME = "index.json"
+DATASET_FORMAT_VERSION = 1
+# The facts matrices are stored with 8 facts per byte.
+PACKED_FACTS_ARRAYS = ["previous_facts", "next_facts"]
+DATASET_ARRAYS = [
+    "previous_fluents",
+    "next_fluents",
+    *PACKED_FACTS_ARRAYS,
+    "actions",
+    "action_parameters",
+    "is_successful",
+]
+
+
+class TrajectoryDataset:
+    """Dataset of trajectories stored as concatenated binary arrays with an index of the trajectories' offsets.
+
+    Note: the dataset directory contains an index file with the shared column vocabularies and the offsets of the
+        trajectories, and a .npy file per array that is opened as a read-only memory map. Thus, accessing a transition
+        reads only its rows from the disk without parsing any text.
+    """
+
+    dataset_directory: Path
+    trajectory_names: List[str]
+    fluent_names: List[str]
+    fact_names: List[str]
+    action_names: List[str]
+    object_names: List[str]
+    # The transitions of the n-th trajectory are the rows offsets[n] to offsets[n + 1] of the arrays.
+    offsets: np.ndarray
+    _arrays: Dict[str, np.ndarray]
+    logger: logging.Logger
+
+    def __init__(self, dataset_directory: Path):
+        self.dataset_directory = Path(dataset_directory)
+        self.logger = logging.getLogger(__name__)
+        with open(self.dataset_directory / DATASET_INDEX_FILE_NAME, "rt") as index_file:
+            dataset_index = json.load(index_file)
+
+        if dataset_index["format_version"] != DATASET_FORMAT_VERSION:
+            raise ValueError(f"Unsupported trajectory dataset format version - {dataset_index['format_version']}")
+
+        self.trajectory_names = dataset_index["trajectory_names"]
+        self.fluent_names = dataset_index["fluent_names"]
+        self.fact_names = dataset_index["fact_names"]
+        self.action_names = dataset_index["action_names"]
+        self.object_names = dataset_index["object_names"]
+        self.offsets = np.array(dataset_index["offsets"], dtype=np.int64)
+        self._arrays = {
+            array_name: np.load(self.dataset_directory / f"{array_name}.npy", mmap_mode="r")
+            for array_name in DATASET_ARRAYS
+        }
+        self.logger.debug("Loaded a dataset of %d trajectories with %d transitions.", len(self), self.offsets[-1])
+
+    def __len__(self) -> int:
+        return len(self.trajectory_names)
+
+    @staticmethod
+    def _collect_vocabularies(observations: List[Observation]) -> List[List[str]]:
+        """Collects the sorted vocabularies of the fluents, facts, actions and objects in the observations.
+
+        :param observations: the observations to collect the vocabularies from.
+        :return: the fluents, facts, actions and objects vocabularies.
+        """
+        fluent_names: Set[str] = set()
+        fact_names: Set[str] = set()
+        action_names: Set[str] = set()
+        object_names: Set[str] = set()
+        for observation in observations:
+            for component in observation.components:
+                for state in [component.previous_state, component.next_state]:
+                    fluent_names.update(state.state_fluents)
+                    fact_names.update(
+                        predicate.untyped_representation
+                        for predicates in state.state_predicates.values()
+                        for predicate in predicates
+                    )
+
+                action_names.add(component.grounded_action_call.name)
+                object_names.update(component.grounded_action_call.parameters)
+
+        return [sorted(fluent_names), sorted(fact_names), sorted(action_names), sorted(object_names)]
+
+    @classmethod
+    def create(
+        cls,
+        dataset_directory: Path,
+        observations: List[Observation],
+        trajectory_names: Optional[List[str]] = None,
+    ) -> "TrajectoryDataset":
+        """Creates a dataset from parsed single agent observations, e.g., the results of BatchParser.
+
+        :param dataset_directory: the directory to store the dataset in.
+        :param observations: the observations of the trajectories.
+        :param trajectory_names: the names of the trajectories, e.g., the names of the trajectory files.
+        :return: the created dataset.
+        """
+        dataset_directory = Path(dataset_directory)
+        dataset_directory.mkdir(parents=True, exist_ok=True)
+        trajectory_names = trajectory_names or [str(index) for index in range(len(observations))]
+        if len(trajectory_names) != len(observations):
+            raise ValueError("The number of trajectory names should match the number of observations.")
+
+        vocabularies = cls._collect_vocabularies(observations)
+        fluent_names, fact_names, action_names, object_names = vocabularies
+        columnar_exporter = ColumnarTrajectoryExporter(fluent_names, fact_names, action_names, object_names)
+        offsets = np.cumsum([0, *[len(observation) for observation in observations]])
+        num_transitions = int(offsets[-1])
+        max_arity = max(
+            (
+                len(component.grounded_action_call.parameters)
+                for observation in observations
+                for component in observation.components
+            ),
+            default=0,
+        )
+        array_shapes = {
+            "previous_fluents": ((num_transitions, len(fluent_names)), np.float64),
+            "next_fluents": ((num_transitions, len(fluent_names)), np.float64),
+            "previous_facts": ((num_transitions, (len(fact_names) + 7) // 8), np.uint8),
+            "next_facts": ((num_transitions, (len(fact_names) + 7) // 8), np.uint8),
+            "actions": ((num_transitions,), np.int32),
+            "action_parameters": ((num_transitions, max_arity), np.int32),
+            "is_successful": ((num_transitions,), np.bool_),
+        }
+        arrays = {
+            array_name: np.lib.format.open_memmap(
+                dataset_directory / f"{array_name}.npy", mode="w+", dtype=dtype, shape=shape
+            )
+            for array_name, (shape, dtype) in array_shapes.items()
+        }
+        arrays["action_parameters"][:] = MISSING_PARAMETER_CODE
+        for observation, start, stop in zip(observations, offsets[:-1], offsets[1:]):
+            columnar_trajectory = columnar_exporter.export_observation(observation)
+            for array_name, array in arrays.items():
+                trajectory_array = getattr(columnar_trajectory, array_name)
+                if array_name in PACKED_FACTS_ARRAYS:
+                    trajectory_array = np.packbits(trajectory_array, axis=1)
+
+                if array_name == "action_parameters":
+                    array[start:stop, : trajectory_array.shape[1]] = trajectory_array
+                    continue
+
+                array[start:stop] = trajectory_array
+
+        for array in arrays.values():
+            array.flush()
+
+        del arrays
+        dataset_index = {
+            "format_version": DATASET_FORMAT_VERSION,
+            "trajectory_names": trajectory_names,
+            "offsets": offsets.tolist(),
+            **dict(zip(VOCABULARY_ARRAYS, vocabularies)),
+        }
+        with open(dataset_directory / DATASET_INDEX_FILE_NAME, "wt") as index_file:
+            json.dump(dataset_index, index_file)
+
+        return cls(dataset_directory)
+
+    def get_num_transitions(self, trajectory_index: int) -> int:
+        """Returns the number of transitions of a trajectory.
+
+        :param trajectory_index: the index of the trajectory in the dataset.
+        :return: the number of transitions of the trajectory.
+        """
+        return int(self.offsets[trajectory_index + 1] - self.offsets[trajectory_index])
+
+    def _get_rows(self, start: int, stop: int) -> ColumnarTrajectory:
+        """Returns the columnar trajectory of the rows of the dataset, unpacking only the facts of these rows.
+
+        :param start: the first row.
+        :param stop: the row after the last row.
+        :return: the columnar trajectory containing the rows.
+        """
+        rows = {array_name: self._arrays[array_name][start:stop] for array_name in DATASET_ARRAYS}
+        for array_name in PACKED_FACTS_ARRAYS:
+            rows[array_name] = np.unpackbits(rows[array_name], axis=1, count=len(self.fact_names)).astype(np.bool_)
+
+        return ColumnarTrajectory(
+            fluent_names=self.fluent_names,
+            fact_names=self.fact_names,
+            action_names=self.action_names,
+            object_names=self.object_names,
+            **rows,
+        )
+
+    def get_trajectory(self, trajectory_index: int) -> ColumnarTrajectory:
+        """Returns all the transitions of a trajectory.
+
+        :param trajectory_index: the index of the trajectory in the dataset.
+        :return: the columnar trajectory, whose fluents and actions are memory mapped views of the dataset.
+        """
+        return self._get_rows(int(self.offsets[trajectory_index]), int(self.offsets[trajectory_index + 1]))
+
+    def get_transition(self, trajectory_index: int, transition_index: int) -> ColumnarTrajectory:
+        """Returns a single transition of a trajectory.
+
+        :param trajectory_index: the index of the trajectory in the dataset.
+        :param transition_index: the index of the transition in the trajectory.
+        :return: a columnar trajectory containing only the requested transition.
+        """
+        if not 0 <= transition_index < self.get_num_transitions(trajectory_index):
+            raise IndexError(
+                f"The trajectory {self.trajectory_names[trajectory_index]} does not have a transition "
+                f"with the index {transition_index}."
+            )
+
+        row = int(self.offsets[trajectory_index]) + transition_index
+        return self._get_rows(row, row + 1)
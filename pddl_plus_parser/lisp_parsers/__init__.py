@@ -6,3 +6,5 @@ from .problem_parser import ProblemParser
 from .trajectory_parser import TrajectoryParser
 from .preconditions_parser import PreconditionsParser
 from .effects_parser import EffectsParser
+from .parsing_cache import ParsingCache
+from .batch_parser import BatchParser, BatchParsingResult
@@ -0,0 +1,217 @@
+"""Module that parses batches of problem and trajectory files in parallel."""
+import glob
+import logging
+from concurrent.futures import ProcessPoolExecutor, Future, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from pddl_plus_parser.models import Domain
+from .parsing_cache import dump_with_domain_references, load_with_domain_references
+from .problem_parser import ProblemParser
+from .trajectory_parser import TrajectoryParser
+
+# The domain that the worker processes use, it is set once per worker when the worker starts.
+_worker_domain: Optional[Domain] = None
+
+BatchInput = Union[Path, str, Iterable[Union[Path, str]]]
+
+
+class BatchParsingResult:
+    """The result of parsing a single file in a batch."""
+
+    file_path: Path
+    result: Optional[Any]
+    error: Optional[str]
+
+    def __init__(self, file_path: Path, result: Optional[Any] = None, error: Optional[str] = None):
+        self.file_path = file_path
+        self.result = result
+        self.error = error
+
+    @property
+    def is_successful(self) -> bool:
+        return self.error is None
+
+    def __str__(self):
+        status = "successful" if self.is_successful else f"failed - {self.error}"
+        return f"Parsing {self.file_path.name}: {status}"
+
+
+def _initialize_worker(domain: Domain) -> None:
+    """Stores the domain in the worker process so that it is not sent with every parsed file.
+
+    :param domain: the domain used to parse the files.
+    """
+    global _worker_domain
+    _worker_domain = domain
+
+
+def _parse_problem_file(problem_path: Path) -> Tuple[Optional[bytes], Optional[str]]:
+    """Parses a problem file in a worker process.
+
+    :param problem_path: the path to the problem file.
+    :return: the serialized problem or the error that occurred during the parsing.
+    """
+    try:
+        problem = ProblemParser(problem_path=problem_path, domain=_worker_domain).parse_problem()
+        return dump_with_domain_references(problem, _worker_domain), None
+
+    except Exception as error:
+        return None, f"{type(error).__name__}: {error}"
+
+
+def _parse_trajectory_file(
+    trajectory_path: Path,
+    problem_path: Optional[Path],
+    executing_agents: Optional[List[str]],
+    contain_transitions_status: bool,
+) -> Tuple[Optional[bytes], Optional[str]]:
+    """Parses a trajectory file in a worker process.
+
+    :param trajectory_path: the path to the trajectory file.
+    :param problem_path: the path to the problem of the trajectory, if exists.
+    :param executing_agents: the list of agents that partake in the observation.
+    :param contain_transitions_status: whether the trajectory contains transition status labels.
+    :return: the serialized observation or the error that occurred during the parsing.
+    """
+    try:
+        problem = (
+            ProblemParser(problem_path=problem_path, domain=_worker_domain).parse_problem()
+            if problem_path is not None
+            else None
+        )
+        observation = TrajectoryParser(_worker_domain, problem).parse_trajectory(
+            trajectory_path,
+            executing_agents=executing_agents,
+            contain_transitions_status=contain_transitions_status,
+        )
+        return dump_with_domain_references(observation, _worker_domain), None
+
+    except Exception as error:
+        return None, f"{type(error).__name__}: {error}"
+
+
+class BatchParser:
+    """Class that parses multiple problem or trajectory files of the same domain using multiple processes.
+
+    Note: the domain is sent to every worker process once, when the process starts, and the parsed objects reference
+        the objects of the input domain (e.g., its types) and not copies of them. The results are returned in the
+        order of the input files. Files that could not be parsed, whether the parser failed, the worker process crashed
+        or the result could not be deserialized, are reported in their results and do not stop the parsing of the
+        other files.
+    """
+
+    domain: Domain
+    max_workers: Optional[int]
+    logger: logging.Logger
+
+    def __init__(self, domain: Domain, max_workers: Optional[int] = None):
+        self.domain = domain
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def _resolve_file_paths(files: BatchInput, pattern: str) -> List[Path]:
+        """Resolves the input files to an ordered list of file paths.
+
+        :param files: a directory, a glob pattern or a collection of file paths.
+        :param pattern: the glob pattern used to select the files when the input is a directory.
+        :return: the list of file paths.
+        """
+        if isinstance(files, (str, Path)):
+            if Path(files).is_dir():
+                return sorted(file_path for file_path in Path(files).glob(pattern) if file_path.is_file())
+
+            return sorted(Path(file_path) for file_path in glob.glob(str(files)))
+
+        return [Path(file_path) for file_path in files]
+
+    def _collect_result(self, file_path: Path, future: Future) -> BatchParsingResult:
+        """Deserializes the result returned from the worker that parsed the file.
+
+        :param file_path: the path to the parsed file.
+        :param future: the future holding the serialized result or the error of the parsed file.
+        :return: the parsing result of the file.
+        """
+        try:
+            serialized_result, error = future.result()
+            if error is None:
+                parsed_object = load_with_domain_references(serialized_result, self.domain)
+                return BatchParsingResult(file_path, result=parsed_object)
+
+        except Exception as exception:
+            error = f"{type(exception).__name__}: {exception}"
+
+        self.logger.warning("Failed to parse the file %s - %s", file_path, error)
+        return BatchParsingResult(file_path, error=error)
+
+    def _parse_in_parallel(
+        self, parse_function: Callable, file_paths: List[Path], files_arguments: List[Tuple]
+    ) -> List[BatchParsingResult]:
+        """Parses the files in the worker processes and collects the result of each file as soon as it is ready.
+
+        :param parse_function: the function that parses a single file in a worker process.
+        :param file_paths: the paths to the files to parse.
+        :param files_arguments: the arguments of the parse function for each of the files.
+        :return: the parsing results ordered as the input files.
+        """
+        results: List[Optional[BatchParsingResult]] = [None] * len(file_paths)
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=_initialize_worker, initargs=(self.domain,)
+        ) as executor:
+            futures: Dict[Future, int] = {
+                executor.submit(parse_function, *file_arguments): file_index
+                for file_index, file_arguments in enumerate(files_arguments)
+            }
+            for future in as_completed(futures):
+                file_index = futures[future]
+                results[file_index] = self._collect_result(file_paths[file_index], future)
+
+        return results
+
+    def parse_problems(self, problem_files: BatchInput, pattern: str = "*.pddl") -> List[BatchParsingResult]:
+        """Parses the problem files in parallel.
+
+        :param problem_files: a directory, a glob pattern or a collection of problem file paths.
+        :param pattern: the glob pattern used to select the problem files when the input is a directory.
+        :return: the parsing results, containing either the problem or an error, ordered as the input files.
+        """
+        problem_paths = self._resolve_file_paths(problem_files, pattern)
+        self.logger.info("Parsing %d problem files.", len(problem_paths))
+        return self._parse_in_parallel(
+            _parse_problem_file, problem_paths, [(problem_path,) for problem_path in problem_paths]
+        )
+
+    def parse_trajectories(
+        self,
+        trajectory_files: BatchInput,
+        pattern: str = "*.trajectory",
+        problems_directory: Optional[Path] = None,
+        executing_agents: Optional[List[str]] = None,
+        contain_transitions_status: bool = False,
+    ) -> List[BatchParsingResult]:
+        """Parses the trajectory files in parallel.
+
+        :param trajectory_files: a directory, a glob pattern or a collection of trajectory file paths.
+        :param pattern: the glob pattern used to select the trajectory files when the input is a directory.
+        :param problems_directory: the directory containing the problems of the trajectories. The problem of a
+            trajectory is the PDDL file with the same name as the trajectory file, e.g., pfile1.pddl for
+            pfile1.trajectory. If not given, the objects are deduced from the trajectories.
+        :param executing_agents: the list of agents that partake in the observations.
+        :param contain_transitions_status: whether the trajectories contain transition status labels.
+        :return: the parsing results, containing either the observation or an error, ordered as the input files.
+        """
+        trajectory_paths = self._resolve_file_paths(trajectory_files, pattern)
+        problem_paths = [
+            problems_directory / f"{trajectory_path.stem}.pddl" if problems_directory is not None else None
+            for trajectory_path in trajectory_paths
+        ]
+        self.logger.info("Parsing %d trajectory files.", len(trajectory_paths))
+        return self._parse_in_parallel(
+            _parse_trajectory_file,
+            trajectory_paths,
+            [
+                (trajectory_path, problem_path, executing_agents, contain_transitions_status)
+                for trajectory_path, problem_path in zip(trajectory_paths, problem_paths)
+            ],
+        )
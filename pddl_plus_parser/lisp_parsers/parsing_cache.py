@@ -0,0 +1,219 @@
+"""Module that contains an on-disk cache of parsed PDDL domains and problems."""
+import hashlib
+import io
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Tuple, Callable
+
+from pddl_plus_parser import __version__
+from pddl_plus_parser.models import Domain, Problem, PDDLType, PDDLConstant
+from .domain_parser import DomainParser
+from .problem_parser import ProblemParser
+
+CACHE_FILE_SUFFIX = ".pkl"
+
+
+class _DomainReferencesPickler(pickle.Pickler):
+    """Pickler that stores references to the domain's objects instead of copies of them."""
+
+    def __init__(self, file, domain: Domain):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.domain = domain
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[str, ...]]:
+        if obj is self.domain:
+            return ("domain",)
+
+        if isinstance(obj, PDDLType) and self.domain.types.get(obj.name) is obj:
+            return "type", obj.name
+
+        if isinstance(obj, PDDLConstant) and self.domain.constants.get(obj.name) is obj:
+            return "constant", obj.name
+
+        return None
+
+
+class _DomainReferencesUnpickler(pickle.Unpickler):
+    """Unpickler that resolves the references to the domain's objects using the input domain."""
+
+    def __init__(self, file, domain: Domain):
+        super().__init__(file)
+        self.domain = domain
+
+    def persistent_load(self, persistent_id: Tuple[str, ...]) -> Any:
+        object_kind = persistent_id[0]
+        if object_kind == "domain":
+            return self.domain
+
+        domain_objects = self.domain.types if object_kind == "type" else self.domain.constants
+        if persistent_id[1] not in domain_objects:
+            raise pickle.UnpicklingError(f"The domain does not contain the {object_kind} {persistent_id[1]}.")
+
+        return domain_objects[persistent_id[1]]
+
+
+def dump_with_domain_references(parsed_object: Any, domain: Domain) -> bytes:
+    """Serializes an object parsed using the domain without serializing the domain's objects.
+
+    :param parsed_object: the object to serialize, e.g., a problem or an observation.
+    :param domain: the domain that was used to parse the object.
+    :return: the serialized object.
+    """
+    serialized_object = io.BytesIO()
+    _DomainReferencesPickler(serialized_object, domain).dump(parsed_object)
+    return serialized_object.getvalue()
+
+
+def load_with_domain_references(serialized_object: bytes, domain: Domain) -> Any:
+    """Deserializes an object so that it references the objects of the input domain.
+
+    :param serialized_object: the object serialized using dump_with_domain_references.
+    :param domain: the domain whose objects the loaded object should reference.
+    :return: the deserialized object.
+    """
+    return _DomainReferencesUnpickler(io.BytesIO(serialized_object), domain).load()
+
+
+class ParsingCache:
+    """Cache that stores the parsed domains and problems on the disk so that they are not parsed repeatedly.
+
+    Note: the cache entries are keyed by the hash of the files' content and the library's version, so changed files
+        or a newer version of the library result in re-parsing. The entries are pickle files and thus the cache
+        directory should only be shared with trusted sources.
+    """
+
+    cache_directory: Path
+    logger: logging.Logger
+
+    def __init__(self, cache_directory: Path):
+        self.cache_directory = Path(cache_directory)
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def _hash_file(file_path: Path) -> str:
+        """Hashes the content of a file.
+
+        :param file_path: the path to the file.
+        :return: the hexadecimal digest of the file's content.
+        """
+        with open(file_path, "rb") as hashed_file:
+            return hashlib.sha256(hashed_file.read()).hexdigest()
+
+    @staticmethod
+    def _create_cache_key(*key_components: str) -> str:
+        """Creates the key of a cache entry that is valid only for the current library version.
+
+        :param key_components: the components that identify the cached object.
+        :return: the key of the cache entry.
+        """
+        return hashlib.sha256("\n".join((__version__, *key_components)).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _domain_fingerprint(domain: Domain) -> str:
+        """Creates a fingerprint of the parts of the domain that affect the parsing of problems.
+
+        :param domain: the domain to create the fingerprint for.
+        :return: the fingerprint of the domain.
+        """
+        domain_components = [
+            domain.name,
+            *sorted(f"{pddl_type.name} - {pddl_type.parent}" for pddl_type in domain.types.values()),
+            *sorted(f"{constant.name} - {constant.type}" for constant in domain.constants.values()),
+            *sorted(str(predicate) for predicate in domain.predicates.values()),
+            *sorted(str(function) for function in domain.functions.values()),
+        ]
+        return hashlib.sha256("\n".join(domain_components).encode("utf-8")).hexdigest()
+
+    def _get_cache_path(self, object_kind: str, cache_key: str) -> Path:
+        return self.cache_directory / f"{object_kind}-{cache_key}{CACHE_FILE_SUFFIX}"
+
+    def _load(self, cache_path: Path, load_function: Callable) -> Optional[Any]:
+        """Loads a cache entry.
+
+        :param cache_path: the path to the cache entry.
+        :param load_function: the function that loads the entry from the opened file.
+        :return: the cached object or None if the entry does not exist or could not be loaded.
+        """
+        if not cache_path.exists():
+            return None
+
+        try:
+            with open(cache_path, "rb") as cache_file:
+                return load_function(cache_file)
+
+        except Exception as error:
+            self.logger.warning("Could not load the cache entry %s, re-parsing the file - %s", cache_path.name, error)
+            return None
+
+    def _store(self, cache_path: Path, dump_function: Callable) -> None:
+        """Atomically writes a cache entry so that concurrent readers never observe partial entries.
+
+        :param cache_path: the path to the cache entry.
+        :param dump_function: the function that writes the entry to the opened file.
+        """
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.cache_directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as cache_file:
+                dump_function(cache_file)
+
+            os.replace(temporary_path, cache_path)
+
+        except Exception:
+            os.remove(temporary_path)
+            raise
+
+    def parse_domain(
+        self, domain_path: Path, partial_parsing: bool = False, enable_disjunctions: bool = False
+    ) -> Domain:
+        """Parses the domain or loads it from the cache if it was already parsed.
+
+        :param domain_path: the path to the domain file.
+        :param partial_parsing: whether to parse only the domain's header, see DomainParser.
+        :param enable_disjunctions: whether to enable disjunctive preconditions, see DomainParser.
+        :return: the parsed domain.
+        """
+        cache_key = self._create_cache_key(
+            self._hash_file(domain_path), f"partial={partial_parsing}", f"disjunctions={enable_disjunctions}"
+        )
+        cache_path = self._get_cache_path("domain", cache_key)
+        domain = self._load(cache_path, pickle.load)
+        if domain is not None:
+            self.logger.debug("Loaded the domain %s from the cache.", domain_path)
+            return domain
+
+        self.logger.debug("The domain %s is not in the cache, parsing it.", domain_path)
+        domain = DomainParser(
+            domain_path, partial_parsing=partial_parsing, enable_disjunctions=enable_disjunctions
+        ).parse_domain()
+        self._store(cache_path, lambda cache_file: pickle.dump(domain, cache_file, protocol=pickle.HIGHEST_PROTOCOL))
+        return domain
+
+    def parse_problem(self, problem_path: Path, domain: Domain) -> Problem:
+        """Parses the problem or loads it from the cache if it was already parsed with an equivalent domain.
+
+        Note: the loaded problem references the objects of the input domain, e.g., its types, and not copies of them.
+
+        :param problem_path: the path to the problem file.
+        :param domain: the domain of the problem.
+        :return: the parsed problem.
+        """
+        cache_key = self._create_cache_key(self._hash_file(problem_path), self._domain_fingerprint(domain))
+        cache_path = self._get_cache_path("problem", cache_key)
+        problem = self._load(cache_path, lambda cache_file: _DomainReferencesUnpickler(cache_file, domain).load())
+        if problem is not None:
+            self.logger.debug("Loaded the problem %s from the cache.", problem_path)
+            return problem
+
+        self.logger.debug("The problem %s is not in the cache, parsing it.", problem_path)
+        problem = ProblemParser(problem_path=problem_path, domain=domain).parse_problem()
+        self._store(cache_path, lambda cache_file: _DomainReferencesPickler(cache_file, domain).dump(problem))
+        return problem
+
+    def clear(self) -> None:
+        """Removes all the entries from the cache."""
+        for cache_path in self.cache_directory.glob(f"*{CACHE_FILE_SUFFIX}"):
+            cache_path.unlink()
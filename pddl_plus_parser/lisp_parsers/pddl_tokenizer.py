@@ -1,28 +1,41 @@
 """Module that contains the tokenization process of the PDDL files."""
 import re
 from collections import deque
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional
+from sys import intern
+from typing import List, Optional, Iterator
 
 from pddl_plus_parser.lisp_parsers import Expression
 
+COMMENT_PREFIX = ";"
+
 
 class PDDLTokenizer:
     """Class that tokenizes the content of a PDDL file according to the known PDDL scheme."""
 
-    pddl_file_content: List[str]
+    pddl_file_content: Optional[List[str]]
+    file_path: Optional[Path]
+    streaming: bool
 
     def __init__(
-        self, file_path: Optional[Path] = None, pddl_str: Optional[str] = None
+        self,
+        file_path: Optional[Path] = None,
+        pddl_str: Optional[str] = None,
+        streaming: bool = False,
     ):
         if file_path is None and pddl_str is None:
             raise ValueError(
                 "Cannot receive both the file path and the PDDL str as null."
             )
 
+        self.file_path = file_path
+        self.streaming = streaming
+        self.pddl_file_content = None
         if file_path is not None:
-            with open(file_path, "rt", encoding="utf-8") as pddl_file:
-                self.pddl_file_content = pddl_file.readlines()
+            if not streaming:
+                with open(file_path, "rt", encoding="utf-8") as pddl_file:
+                    self.pddl_file_content = pddl_file.readlines()
 
         else:
             self.pddl_file_content = pddl_str.replace("\t", "").split("\n")
@@ -35,8 +48,23 @@ class PDDLTokenizer:
         """
         return line.strip().startswith(";")
 
+    def _iter_lines(self) -> Iterator[str]:
+        """Iterates over the lines of the PDDL content without loading a file that was not read yet.
+
+        :return: an iterator over the lines of the PDDL content.
+        """
+        if self.pddl_file_content is not None:
+            yield from self.pddl_file_content
+            return
+
+        with open(self.file_path, "rt", encoding="utf-8") as pddl_file:
+            yield from pddl_file
+
     def tokenize(self) -> deque:
         """Tokenize the PDDL file into tokens."""
+        if self.streaming:
+            return deque(self.iter_tokens())
+
         tokens = deque()
         for line in self.pddl_file_content:
             if self._is_comment_line(line):
@@ -50,32 +78,115 @@ class PDDLTokenizer:
 
         return tokens
 
+    @staticmethod
+    def _tokenize_line(line: str) -> List[str]:
+        """Tokenize a single line of PDDL content.
+
+        Note: the tokens are interned since the same names repeat many times in large files.
+
+        :param line: the line to tokenize.
+        :return: the tokens in the line without the commented part.
+        """
+        code, _, _ = line.partition(COMMENT_PREFIX)
+        return list(map(intern, code.lower().replace("(", " ( ").replace(")", " ) ").split()))
+
+    def iter_tokens(self) -> Iterator[str]:
+        """Lazily tokenize the PDDL content in a single pass over the content.
+
+        Note: the tokens are identical to the ones returned by `tokenize`, but are produced one line at a time so that
+            neither the file content nor the entire token sequence have to be kept in memory.
+
+        :return: an iterator over the tokens of the PDDL content.
+        """
+        return chain.from_iterable(map(self._tokenize_line, self._iter_lines()))
+
+    @staticmethod
+    def _build_expression(tokens: Iterator[str]) -> Expression:
+        """Builds the first expression in the token stream using an explicit stack instead of recursion.
+
+        Note: only the tokens that belong to the extracted expression are consumed from the stream.
+
+        :param tokens: the iterator over the tokens extracted from the PDDL content.
+        :return: concrete PDDL expressions that can be converted to objects.
+        """
+        open_expressions = []
+        current_expression = None
+        for token in tokens:
+            if token == "(":
+                new_expression = []
+                if current_expression is not None:
+                    current_expression.append(new_expression)
+                    open_expressions.append(current_expression)
+
+                current_expression = new_expression
+                continue
+
+            if token == ")":
+                if current_expression is None:
+                    raise SyntaxError("Unexpected ) while parsing the expressions")
+
+                if len(open_expressions) == 0:
+                    return current_expression
+
+                current_expression = open_expressions.pop()
+                continue
+
+            if current_expression is None:
+                return token
+
+            current_expression.append(token)
+
+        raise SyntaxError("Unexpected EOF")
+
     def read_from_tokens(self, tokens: deque) -> Expression:
         """Extract concrete PDDL expressions from the tokens.
 
         :param tokens: the list of tokens extracted from the PDDL file.
         :return: concrete PDDL expressions that can be converted to objects.
         """
-        if len(tokens) == 0:
+        return self._build_expression(tokens.popleft() for _ in range(len(tokens)))
+
+    def read_from_token_stream(self, tokens: Iterator[str]) -> Expression:
+        """Extract the first concrete PDDL expression from a lazy stream of tokens.
+
+        Note: only the tokens that belong to the extracted expression are consumed from the stream.
+
+        :param tokens: the iterator over the tokens extracted from the PDDL content.
+        :return: concrete PDDL expressions that can be converted to objects.
+        """
+        return self._build_expression(tokens)
+
+    def iter_expressions(self) -> Iterator[Expression]:
+        """Lazily extract the sub-expressions of the outermost expression one at a time.
+
+        Note: this is useful for content composed of a single list containing many blocks, e.g., trajectories,
+            since only the currently extracted block is kept in memory.
+
+        :return: an iterator over the sub-expressions of the outermost expression.
+        """
+        tokens = self.iter_tokens()
+        first_token = next(tokens, None)
+        if first_token is None:
             raise SyntaxError("Unexpected EOF")
 
-        token = tokens.popleft()
-        if token == "(":
-            expression = []
-            while tokens[0] != ")":
-                expression.append(self.read_from_tokens(tokens))
+        if first_token != "(":
+            raise SyntaxError("Expected the PDDL content to start with an opening parenthesis")
 
-            tokens.popleft()  # pop off ')'
-            return expression
+        for token in tokens:
+            if token == ")":
+                return
 
-        if token == ")":
-            raise SyntaxError("Unexpected ) while parsing the expressions")
+            yield self._build_expression(chain((token,), tokens))
 
-        return token
+        raise SyntaxError("Unexpected EOF")
 
     def parse(self) -> Expression:
         """Extracts the expressions from the PDDL file.
 
         :return: the list of expressions that represent the PDDL file.
         """
+        if self.streaming:
+            return self.read_from_token_stream(self.iter_tokens())
+
         return self.read_from_tokens(self.tokenize())
+
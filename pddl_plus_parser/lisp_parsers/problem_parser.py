@@ -12,6 +12,7 @@ from pddl_plus_parser.models import (
     PDDLFunction,
     Predicate,
     GroundedPredicate,
+    GroundedPredicatePool,
     NumericalExpressionTree,
     construct_expression_tree,
 )
@@ -26,12 +27,14 @@ class ProblemParser:
     logger: logging.Logger
     domain: Domain
     problem: Problem
+    predicates_pool: GroundedPredicatePool
 
     def __init__(self, problem_path: Path, domain: Domain):
         self.tokenizer = PDDLTokenizer(problem_path)
         self.domain = domain
         self.logger = logging.getLogger(__name__)
         self.problem = Problem(domain)
+        self.predicates_pool = GroundedPredicatePool()
 
     def _validate_object_types(
         self, lifted_predicate: Predicate, predicate_signature_items: List[str]
@@ -49,8 +52,9 @@ class ProblemParser:
             optional_objects[obj_name].type for obj_name in predicate_signature_items
         ]
         lifted_predicate_types = list(lifted_predicate.signature.values())
+        type_hierarchy = self.domain.type_hierarchy
         for index, grounded_object_type in enumerate(objects_types):
-            assert grounded_object_type.is_sub_type(lifted_predicate_types[index])
+            assert type_hierarchy.is_sub_type(grounded_object_type, lifted_predicate_types[index])
 
     def parse_domain_name(self, domain_name: str) -> None:
         """Parse the domain name in the problem file and verifies that the name given matches the inner domain.
@@ -116,9 +120,8 @@ class ProblemParser:
         :return: the function object representing the grounded fluent.
         """
         function_name = grounded_numeric_fluent[0]
-        self.logger.info(
-            f"Starting to parse the grounded numeric fluent - {function_name}"
-        )
+        self.logger.info("Starting to parse the grounded numeric fluent - %s", function_name)
+
         assert function_name in self.domain.functions
         lifted_function = self.domain.functions[function_name]
         # For now, assuming that fluents have valid parameters.
@@ -140,10 +143,11 @@ class ProblemParser:
             for object_name, count in grounded_fluents_counter.items()
             if count > 1
         }
+        type_hierarchy = self.domain.type_hierarchy
         for grounded_signature_type, lifted_signature_type in zip(
             fluent_signature.values(), lifted_function.signature.values()
         ):
-            assert grounded_signature_type.is_sub_type(lifted_signature_type)
+            assert type_hierarchy.is_sub_type(grounded_signature_type, lifted_signature_type)
 
         return PDDLFunction(
             name=function_name,
@@ -167,9 +171,11 @@ class ProblemParser:
         predicate_name = lifted_predicate.name
         predicate_signature_items = grounded_predicate_ast[1:]
         self.logger.info(
-            f"Starting the parse the grounded predicate - {predicate_name} "
-            f"with the signature - {predicate_signature_items}."
+            "Starting the parse the grounded predicate - %s with the signature - %s.",
+            predicate_name,
+            predicate_signature_items,
         )
+
         if len(predicate_signature_items) != len(lifted_predicate.signature):
             raise ValueError(
                 f"Received illegal grounded predicate with mismatching signature - {grounded_predicate_ast}"
@@ -183,7 +189,7 @@ class ProblemParser:
             )
         }
 
-        return GroundedPredicate(
+        return self.predicates_pool.get_or_create(
             name=predicate_name,
             signature=lifted_predicate.signature,
             object_mapping=object_mapping,
@@ -210,7 +216,8 @@ class ProblemParser:
             function_data = expression[1]
             assigned_value = float(expression[2])
             numeric_fluent = self.parse_grounded_numeric_fluent(function_data)
-            self.logger.debug(f"Setting the fluent's value to - {assigned_value}")
+            self.logger.debug("Setting the fluent's value to - %s", assigned_value)
+
             numeric_fluent.set_value(assigned_value)
             self.problem.initial_state_fluents[
                 numeric_fluent.untyped_representation
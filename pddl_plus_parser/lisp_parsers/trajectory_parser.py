@@ -3,17 +3,22 @@
 import logging
 from collections import defaultdict
 from pathlib import Path
-from typing import List, Union, Optional, Dict
+from typing import List, Union, Optional, Dict, Iterator, Tuple
 
+from pddl_plus_parser.lisp_parsers.pddl_parser_types import Expression
 from pddl_plus_parser.lisp_parsers.pddl_tokenizer import PDDLTokenizer
 from pddl_plus_parser.models import (
     Domain,
     Observation,
+    ObservedComponent,
+    MultiAgentComponent,
     State,
     ActionCall,
     PDDLFunction,
     Predicate,
     GroundedPredicate,
+    GroundedPredicatePool,
+    GroundedPredicateSet,
     Problem,
     MultiAgentObservation,
     NOP_ACTION,
@@ -24,8 +29,10 @@ from pddl_plus_parser.models import (
 class TrajectoryParser:
     """Class that is able to parse a trajectory file and extract its content.
 
-    Note: This class assumes that the trajectory size is tractable and thus, reads the entire file at once.
-    For lay loading of a trajectory future development is needed.
+    Note: parse_trajectory assumes that the trajectory size is tractable and thus, keeps all of its states in memory.
+    For trajectories that are too large to be kept in memory use iter_trajectory that lazily yields the components.
+    Both methods support delta encoded trajectories, whose states after the initial state contain only the changes.
+    The states of delta encoded trajectories share their unchanged facts and fluents (copy-on-write).
 
     Warning: if the problem object is none, all objects should be present in the initial state of the trajectory.
     Furthermore, in this case the script will not support type hierarchy or type checking for the observation objects.
@@ -33,11 +40,13 @@ class TrajectoryParser:
 
     partial_domain: Domain  # domain containing only the publicly known information.
     problem: Problem
+    predicates_pool: GroundedPredicatePool
     logger: logging.Logger
 
     def __init__(self, partial_domain: Domain, problem: Optional[Problem] = None):
         self.partial_domain = partial_domain
         self.problem = problem
+        self.predicates_pool = GroundedPredicatePool()
         self.logger = logging.getLogger(__name__)
 
     def _read_trajectory_file(self, trajectory_file_path: Path) -> PDDLTokenizer:
@@ -47,7 +56,7 @@ class TrajectoryParser:
         :return: the tokenizer that is able to parse the trajectory strings to expressions.
         """
         self.logger.debug(f"Reading the file - {trajectory_file_path}")
-        return PDDLTokenizer(file_path=trajectory_file_path)
+        return PDDLTokenizer(file_path=trajectory_file_path, streaming=True)
 
     def parse_state(self, state_data: List[List[Union[str, List[str]]]]) -> State:
         """Parse the trajectory's state data and extracts the state.
@@ -56,7 +65,7 @@ class TrajectoryParser:
         :return: the state object.
         """
         self.logger.info("Parsing the observed state.")
-        state_predicates = defaultdict(set)
+        state_predicates = defaultdict(GroundedPredicateSet)
         state_fluents = {}
         for expression in state_data:
             if expression[0] == "=":  # This is an assignment of a grounded numeric fluent.
@@ -71,7 +80,8 @@ class TrajectoryParser:
                 function_data = expression[1]
                 assigned_value = float(expression[2])
                 numeric_fluent = self.parse_grounded_numeric_fluent(function_data)
-                self.logger.debug(f"Setting the fluent's value to - {assigned_value}")
+                self.logger.debug("Setting the fluent's value to - %s", assigned_value)
+
                 numeric_fluent.set_value(assigned_value)
                 state_fluents[numeric_fluent.untyped_representation] = numeric_fluent
                 continue
@@ -87,6 +97,53 @@ class TrajectoryParser:
 
         return State(predicates=state_predicates, fluents=state_fluents)
 
+    def parse_state_delta(self, previous_state: State, delta_data: List[List[Union[str, List[str]]]]) -> State:
+        """Parse the changes of a delta encoded trajectory step and applies them on the previous state.
+
+        Note: the returned state is a copy-on-write successor of the previous state, so only the changed facts and
+            fluents are parsed and copied.
+
+        :param previous_state: the state that preceded the delta in the trajectory.
+        :param delta_data: the AST representing the added facts, deleted facts and changed fluents.
+        :return: the next state object.
+        """
+        self.logger.info("Parsing the observed state delta.")
+        next_state = previous_state.create_successor()
+        next_state.is_init = False
+        for section in delta_data:
+            if section[0] not in [":add", ":delete", ":fluents"]:
+                raise SyntaxError(f"Received illegal state delta section - {section[0]}")
+
+            if section[0] == ":fluents":
+                for expression in section[1:]:
+                    if expression[0] != "=" or len(expression) != 3:
+                        raise SyntaxError(
+                            "A numeric fluent should be of length 3. Fluent scheme: "
+                            "(= (<fluent_name> <argument>) <value>)"
+                            f"Received - {expression}"
+                        )
+
+                    numeric_fluent = self.parse_grounded_numeric_fluent(expression[1])
+                    numeric_fluent.set_value(float(expression[2]))
+                    next_state.state_fluents[numeric_fluent.untyped_representation] = numeric_fluent
+
+                continue
+
+            for expression in section[1:]:
+                if expression[0] not in self.partial_domain.predicates:
+                    raise ValueError(f"Received illegal state component - {expression}")
+
+                lifted_predicate = self.partial_domain.predicates[expression[0]]
+                grounded_predicate = self.parse_grounded_predicate(expression, lifted_predicate)
+                grounded_predicates = next_state.get_mutable_groundings(lifted_predicate.untyped_representation)
+                if section[0] == ":add":
+                    grounded_predicates.add(grounded_predicate)
+                    continue
+
+                grounded_predicates.discard(grounded_predicate)
+
+        return next_state
+
     def parse_grounded_numeric_fluent(self, grounded_numeric_fluent: List[str]) -> PDDLFunction:
         """Parse a single grounded numeric fluent in the problem.
 
@@ -94,7 +151,8 @@ class TrajectoryParser:
         :return: the function object representing the grounded fluent.
         """
         function_name = grounded_numeric_fluent[0]
-        self.logger.info(f"Starting to parse the grounded numeric fluent - {function_name}")
+        self.logger.info("Starting to parse the grounded numeric fluent - %s", function_name)
+
         assert function_name in self.partial_domain.functions
         lifted_function = self.partial_domain.functions[function_name]
         # For now, assuming that fluents have valid parameters.
@@ -115,10 +173,11 @@ class TrajectoryParser:
 
         possible_objects = {**self.problem.objects, **self.partial_domain.constants}
         fluent_signature = {object_name: possible_objects[object_name].type for object_name in fluent_signature_items}
+        type_hierarchy = self.partial_domain.type_hierarchy
         for grounded_param_type, lifted_param_type in zip(
             fluent_signature.values(), lifted_function.signature.values()
         ):
-            assert grounded_param_type.is_sub_type(lifted_param_type)
+            assert type_hierarchy.is_sub_type(grounded_param_type, lifted_param_type)
 
         return PDDLFunction(name=function_name, signature=fluent_signature)
 
@@ -134,9 +193,11 @@ class TrajectoryParser:
         predicate_name = lifted_predicate.name
         predicate_signature_items = grounded_predicate_ast[1:]
         self.logger.info(
-            f"Starting the parse the grounded predicate - {predicate_name} "
-            f"with the signature - {predicate_signature_items}."
+            "Starting the parse the grounded predicate - %s with the signature - %s.",
+            predicate_name,
+            predicate_signature_items,
         )
+
         if len(predicate_signature_items) != len(lifted_predicate.signature):
             raise ValueError(
                 f"Received illegal grounded predicate with mismatching signature - {grounded_predicate_ast}"
@@ -157,7 +218,7 @@ class TrajectoryParser:
         else:
             grounded_signature = lifted_predicate.signature
 
-        return GroundedPredicate(
+        return self.predicates_pool.get_or_create(
             name=predicate_name,
             signature=grounded_signature,
             object_mapping=object_mapping,
@@ -170,7 +231,8 @@ class TrajectoryParser:
         :param action_call_ast: a grounded action call in the form: [(<name> <p1> <p2> ... <pn>)]
         :return: the action call object.
         """
-        self.logger.debug(f"Parsing the grounded action call - {action_call_ast}")
+        self.logger.debug("Parsing the grounded action call - %s", action_call_ast)
+
         action_call_data = action_call_ast[0]
         return ActionCall(name=action_call_data[0], grounded_parameters=action_call_data[1:])
 
@@ -182,11 +244,13 @@ class TrajectoryParser:
         :param joint_action_call_ast: the joint action call AST in the form.
         :return: the joint action call object.
         """
-        self.logger.debug(f"Parsing the joint action call - {joint_action_call_ast}")
+        self.logger.debug("Parsing the joint action call - %s", joint_action_call_ast)
+
         actions = []
         for agent_name, action_call_ast in zip(executing_agents, joint_action_call_ast):
             if action_call_ast[0] == NOP_ACTION:
-                self.logger.debug(f"{agent_name} is executing a NOP action.")
+                self.logger.debug("%s is executing a NOP action.", agent_name)
+
                 actions.append(ActionCall(name=NOP_ACTION, grounded_parameters=[]))
                 continue
 
@@ -242,23 +306,14 @@ class TrajectoryParser:
         self.logger.debug(f"Transition status is - {success_status}.")
         return success_status == "success"
 
-    def parse_trajectory(
-        self,
-        trajectory_file_path: Optional[Path] = None,
-        trajectory_string: Optional[str] = None,
-        executing_agents: List[str] = None,
-        strict_trajectory_validation: bool = False,
-        contain_transitions_status: bool = False,
-    ) -> Union[Observation, MultiAgentObservation]:
-        """Parse a trajectory and extracts the observed data into objects.
+    def _iter_trajectory_expressions(
+        self, trajectory_file_path: Optional[Path] = None, trajectory_string: Optional[str] = None
+    ) -> Iterator[Expression]:
+        """Lazily reads the blocks of the trajectory, i.e., the states, operators and transition statuses.
 
         :param trajectory_file_path: the path to the trajectory file.
         :param trajectory_string: the string representation of the trajectory.
-        :param executing_agents: the list of agents that partake in the observation.
-        :param strict_trajectory_validation: whether to validate the trajectory's  syntax strictly
-                (mainly verify that the initial state.is labeled accordingly).
-        :param contain_transitions_status: whether the trajectory contains transition status labels.
-        :return: the observation extracted from the serialized trajectory.
+        :return: an iterator over the expressions of the trajectory's blocks.
         """
         if trajectory_file_path is None and trajectory_string is None:
             raise ValueError("Either trajectory_file_path or trajectory_string should be provided.")
@@ -269,36 +324,52 @@ class TrajectoryParser:
         if trajectory_file_path is not None:
             self.logger.info("Starting to read the trajectory file!")
             tokenizer = self._read_trajectory_file(trajectory_file_path)
-            observation_expression = tokenizer.parse()
 
         else:
             self.logger.info("Starting to parse the trajectory string!")
-            tokenizer = PDDLTokenizer(pddl_str=trajectory_string)
-            observation_expression = tokenizer.parse()
+            tokenizer = PDDLTokenizer(pddl_str=trajectory_string, streaming=True)
 
-        observation = (
-            MultiAgentObservation(executing_agents=executing_agents) if executing_agents is not None else Observation()
-        )
+        return tokenizer.iter_expressions()
+
+    def _read_initial_state_expression(
+        self, trajectory_expressions: Iterator[Expression], strict_trajectory_validation: bool
+    ) -> Expression:
+        """Reads the expression of the initial state of the trajectory.
 
+        :param trajectory_expressions: the iterator over the expressions of the trajectory's blocks.
+        :param strict_trajectory_validation: whether to validate that the initial state is labeled accordingly.
+        :return: the expression representing the initial state.
+        """
         self.logger.debug("Parsing the initial state.")
-        init_state_expression = observation_expression[0]
+        init_state_expression = next(trajectory_expressions, None)
+        if init_state_expression is None:
+            raise SyntaxError("Encountered an empty trajectory!")
+
         if init_state_expression[0] != ":init" and strict_trajectory_validation:
             raise SyntaxError("Encountered a trajectory without an initial state!")
 
-        if self.problem is not None:
-            observation.add_problem_objects(self.problem.objects)
+        return init_state_expression
 
-        else:
-            self.logger.debug("Parsing the initial state and extracting the objects from the state's data.")
-            observation.add_problem_objects(self.deduce_problem_objects(init_state_expression[1:]))
+    def _iter_transitions(
+        self,
+        init_state_expression: Expression,
+        trajectory_expressions: Iterator[Expression],
+        executing_agents: Optional[List[str]] = None,
+        contain_transitions_status: bool = False,
+    ) -> Iterator[Tuple[State, Union[ActionCall, List[ActionCall]], State, bool]]:
+        """Lazily parses the transitions of the trajectory, keeping only the current transition in memory.
 
+        :param init_state_expression: the expression representing the initial state.
+        :param trajectory_expressions: the iterator over the rest of the expressions of the trajectory's blocks.
+        :param executing_agents: the list of agents that partake in the observation.
+        :param contain_transitions_status: whether the trajectory contains transition status labels.
+        :return: an iterator over the (previous state, action call, next state, transition status) tuples.
+        """
         previous_state = self.parse_state(init_state_expression[1:])
 
         self.logger.debug("Starting to generate the observation from the input trajectory.")
-        state_skip_len = 2 if not contain_transitions_status else 3
         is_transition_successful = True
-        for index in range(1, len(observation_expression), state_skip_len):
-            macro_expression = observation_expression[index]
+        for macro_expression in trajectory_expressions:
             if macro_expression[0] == "operator:":
                 action_call = self.parse_action_call(macro_expression[1:])
 
@@ -309,23 +380,105 @@ class TrajectoryParser:
                 raise SyntaxError("Encountered a trajectory without an action call!")
 
             if contain_transitions_status:
-                macro_expression = observation_expression[index + 1]
-                if macro_expression[0] != ":transition_status":
+                macro_expression = next(trajectory_expressions, None)
+                if macro_expression is None or macro_expression[0] != ":transition_status":
                     raise SyntaxError("Encountered a labelled trajectory without a transition status!")
 
                 is_transition_successful = self.parse_transition_status(macro_expression[1])
 
-            next_state_index = index + 1 if not contain_transitions_status else index + 2
-            macro_expression = observation_expression[next_state_index]
-            if macro_expression[0] != ":state":
+            macro_expression = next(trajectory_expressions, None)
+            if macro_expression is None or macro_expression[0] not in [":state", ":delta"]:
                 raise SyntaxError("Encountered a trajectory without a next state!")
 
+            if macro_expression[0] == ":delta":
+                next_state = self.parse_state_delta(previous_state, macro_expression[1:])
+                self.logger.debug("Finished parsing a delta encoded trajectory component.")
+                yield previous_state, action_call, next_state, is_transition_successful
+
+                previous_state = next_state.create_successor()
+                continue
+
             next_state = self.parse_state(macro_expression[1:])
             self.logger.debug("Finished parsing a trajectory component.")
+            yield previous_state, action_call, next_state, is_transition_successful
+
+            previous_state = next_state.copy()
+
+    def parse_trajectory(
+        self,
+        trajectory_file_path: Optional[Path] = None,
+        trajectory_string: Optional[str] = None,
+        executing_agents: List[str] = None,
+        strict_trajectory_validation: bool = False,
+        contain_transitions_status: bool = False,
+    ) -> Union[Observation, MultiAgentObservation]:
+        """Parse a trajectory and extracts the observed data into objects.
+
+        :param trajectory_file_path: the path to the trajectory file.
+        :param trajectory_string: the string representation of the trajectory.
+        :param executing_agents: the list of agents that partake in the observation.
+        :param strict_trajectory_validation: whether to validate the trajectory's  syntax strictly
+                (mainly verify that the initial state.is labeled accordingly).
+        :param contain_transitions_status: whether the trajectory contains transition status labels.
+        :return: the observation extracted from the serialized trajectory.
+        """
+        trajectory_expressions = self._iter_trajectory_expressions(trajectory_file_path, trajectory_string)
+        observation = (
+            MultiAgentObservation(executing_agents=executing_agents) if executing_agents is not None else Observation()
+        )
+
+        init_state_expression = self._read_initial_state_expression(
+            trajectory_expressions, strict_trajectory_validation
+        )
+        if self.problem is not None:
+            observation.add_problem_objects(self.problem.objects)
+
+        else:
+            self.logger.debug("Parsing the initial state and extracting the objects from the state's data.")
+            observation.add_problem_objects(self.deduce_problem_objects(init_state_expression[1:]))
+
+        for previous_state, action_call, next_state, is_transition_successful in self._iter_transitions(
+            init_state_expression, trajectory_expressions, executing_agents, contain_transitions_status
+        ):
             observation.add_component(
                 previous_state, action_call, next_state, is_successful_transition=is_transition_successful
             )
 
-            previous_state = next_state.copy()
-
         return observation
+
+    def iter_trajectory(
+        self,
+        trajectory_file_path: Optional[Path] = None,
+        trajectory_string: Optional[str] = None,
+        executing_agents: List[str] = None,
+        strict_trajectory_validation: bool = False,
+        contain_transitions_status: bool = False,
+    ) -> Iterator[Union[ObservedComponent, MultiAgentComponent]]:
+        """Lazily parse a trajectory and yield its observed components one at a time.
+
+        Note: the trajectory blocks are read from the file one at a time so the memory consumption is bounded by the
+            size of a single transition. The observation objects can be obtained using deduce_problem_objects or from
+            the problem object.
+
+        :param trajectory_file_path: the path to the trajectory file.
+        :param trajectory_string: the string representation of the trajectory.
+        :param executing_agents: the list of agents that partake in the observation.
+        :param strict_trajectory_validation: whether to validate the trajectory's  syntax strictly
+                (mainly verify that the initial state.is labeled accordingly).
+        :param contain_transitions_status: whether the trajectory contains transition status labels.
+        :return: an iterator over the observed components of the trajectory.
+        """
+        trajectory_expressions = self._iter_trajectory_expressions(trajectory_file_path, trajectory_string)
+        init_state_expression = self._read_initial_state_expression(
+            trajectory_expressions, strict_trajectory_validation
+        )
+        for previous_state, action_call, next_state, is_transition_successful in self._iter_transitions(
+            init_state_expression, trajectory_expressions, executing_agents, contain_transitions_status
+        ):
+            if executing_agents is not None:
+                yield MultiAgentComponent(
+                    previous_state, action_call, next_state, is_successful=is_transition_successful
+                )
+                continue
+
+            yield ObservedComponent(previous_state, action_call, next_state, is_successful=is_transition_successful)
@@ -0,0 +1,45 @@
+"""Module that controls the verbosity of the library's loggers."""
+import logging
+import os
+from typing import Optional, Union
+
+LIBRARY_LOGGER_NAME = "pddl_plus_parser"
+LOG_LEVEL_ENVIRONMENT_VARIABLE = "PDDL_PLUS_PARSER_LOG_LEVEL"
+
+
+def set_library_log_level(level: Optional[Union[int, str]]) -> None:
+    """Sets the minimal level of the messages that the library's modules log.
+
+    Note: the loggers of the library's modules are children of the library's logger so they inherit its level. The hot
+        paths of the library format their messages lazily and check whether the level is enabled before computing
+        expensive arguments, so setting a level above DEBUG (or INFO) skips the construction of the messages entirely,
+        even if the application's root logger is more verbose.
+
+    :param level: the minimal level of the logged messages, either as a number or as a name, e.g., "WARNING". None
+        resets the level so that the library's loggers inherit the level of the root logger.
+    """
+    if isinstance(level, str):
+        level = level.strip().upper()
+        if not isinstance(logging.getLevelName(level), int):
+            raise ValueError(f"Unknown logging level - {level}")
+
+    logging.getLogger(LIBRARY_LOGGER_NAME).setLevel(logging.NOTSET if level is None else level)
+
+
+def configure_library_logging_from_environment() -> None:
+    """Sets the level of the library's logger from the environment variable, if the variable is set.
+
+    Note: the function is called when the package is imported, so an unknown level is logged and ignored instead of
+        failing the import.
+    """
+    level = os.environ.get(LOG_LEVEL_ENVIRONMENT_VARIABLE)
+    if not level:
+        return
+
+    try:
+        set_library_log_level(level)
+
+    except ValueError:
+        logging.getLogger(LIBRARY_LOGGER_NAME).warning(
+            "Ignoring the unknown logging level - %s set in %s", level, LOG_LEVEL_ENVIRONMENT_VARIABLE
+        )
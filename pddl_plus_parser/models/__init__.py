@@ -1,11 +1,15 @@
 from .action_call import ActionCall, JointActionCall, NOP_ACTION
 from .conditional_effect import ConditionalEffect, UniversalEffect
+from .expression_node import ExpressionNode
 from .numerical_expression import (
     construct_expression_tree,
     calculate,
     evaluate_expression,
+    evaluate,
+    calculate_value,
     NumericalExpressionTree,
 )
+from .linear_expression import LinearExpression
 from .observation import (
     ActionCall,
     Observation,
@@ -18,9 +22,14 @@ from .pddl_domain import Domain
 from .pddl_function import PDDLFunction
 from .pddl_object import PDDLObject, PDDLConstant
 from .pddl_operator import Operator, NOPOperator
+from .operator_cache import OperatorCache, DEFAULT_OPERATOR_CACHE_SIZE
 from .pddl_precondition import Precondition, CompoundPrecondition, UniversalPrecondition
-from .pddl_predicate import SignatureType, Predicate, GroundedPredicate
+from .pddl_predicate import SignatureType, Predicate, GroundedPredicate, GroundedPredicatePool, GroundedPredicateSet
 from .pddl_problem import Problem
 from .pddl_state import State
-from .pddl_type import PDDLType, ObjectType, create_type_hierarchy_graph
+from .compact_state import FactIndex, CompactState
+from .batch_numeric_evaluation import create_fluents_matrix, compile_batch_expression, evaluate_batch
+from .pddl_type import PDDLType, ObjectType, TypeHierarchyIndex, create_type_hierarchy_graph
+from .relaxed_reachability import RelaxedReachabilityAnalysis, calculate_interval
 from .vocabulary_creator import VocabularyCreator
+from .simplification_cache import SimplificationCache, SIMPLIFICATION_CACHE, DEFAULT_SIMPLIFICATION_CACHE_SIZE
@@ -0,0 +1,168 @@
+"""Module that evaluates numeric expressions over batches of states at once using NumPy."""
+import os
+from typing import Callable, Dict, Iterable, List, Union
+
+import numpy as np
+from anytree import AnyNode
+
+from .numerical_expression import EPSILON, NumericalExpressionTree, COMPARISON_OPERATORS, ASSIGNMENT_EXPRESSIONS
+from .pddl_function import PDDLFunction
+from .pddl_state import State
+
+# The relative tolerance used by math.isclose, so that the batch comparisons match the single state comparisons.
+RELATIVE_TOLERANCE = 1e-09
+
+BatchFunction = Callable[[np.ndarray], np.ndarray]
+
+BATCH_NUMERICAL_BINARY_OPERATORS = {
+    "+": np.add,
+    "-": np.subtract,
+    "/": np.divide,
+    "*": np.multiply,
+}
+
+BATCH_ASSIGNMENT_EXPRESSIONS = {
+    "increase": np.add,
+    "decrease": np.subtract,
+    "assign": lambda _, assigned_value: assigned_value,
+    "scale-up": np.multiply,
+    "scale-down": np.divide,
+}
+
+
+def _batch_isclose(left_values: np.ndarray, right_values: np.ndarray) -> np.ndarray:
+    """Vectorized version of math.isclose with an absolute tolerance of EPSILON.
+
+    :param left_values: the values of the left operand.
+    :param right_values: the values of the right operand.
+    :return: boolean vector indicating whether each pair of values is close.
+    """
+    with np.errstate(invalid="ignore"):
+        tolerance = np.maximum(
+            RELATIVE_TOLERANCE * np.maximum(np.abs(left_values), np.abs(right_values)), EPSILON
+        )
+        return (left_values == right_values) | (np.abs(left_values - right_values) <= tolerance)
+
+
+BATCH_COMPARISON_OPERATORS = {
+    "=": _batch_isclose,
+    "!=": lambda x, y: ~_batch_isclose(x, y),
+    "<=": lambda x, y: _batch_isclose(x, y) | (x < y),
+    ">=": lambda x, y: _batch_isclose(x, y) | (x > y),
+    ">": np.greater,
+    "<": np.less,
+}
+
+
+def create_fluents_matrix(states: Iterable[State], fluent_names: List[str]) -> np.ndarray:
+    """Creates a matrix containing the values of the fluents in every state.
+
+    :param states: the states to extract the fluent values from.
+    :param fluent_names: the untyped representations of the fluents that define the columns of the matrix.
+    :return: a matrix of shape (states x fluents) where fluents that are missing from a state have NaN values.
+    """
+    fluents_matrix = []
+    for state in states:
+        state_fluents = state.state_fluents
+        fluents_matrix.append(
+            [
+                state_fluents[fluent_name].value if fluent_name in state_fluents else np.nan
+                for fluent_name in fluent_names
+            ]
+        )
+
+    return np.array(fluents_matrix, dtype=np.float64).reshape(len(fluents_matrix), len(fluent_names))
+
+
+def _compile_batch_calculation(expression_node: AnyNode, fluent_columns: Dict[str, int]) -> BatchFunction:
+    """Compiles a calculation tree into a function that calculates its value for every row of the fluents matrix.
+
+    :param expression_node: the node that is currently being compiled.
+    :param fluent_columns: mapping between the untyped representation of the fluents and their columns.
+    :return: a function that receives the fluents matrix and returns the vector of calculated values.
+    """
+    if len(expression_node.children) == 0:
+        if isinstance(expression_node.value, PDDLFunction):
+            fluent_key = expression_node.value.untyped_representation
+            if fluent_key not in fluent_columns:
+                raise KeyError(f"The fluent {fluent_key} does not have a column in the fluents matrix.")
+
+            column = fluent_columns[fluent_key]
+            return lambda fluents_matrix: fluents_matrix[:, column]
+
+        constant_value = float(expression_node.value)
+        return lambda fluents_matrix: np.full(fluents_matrix.shape[0], constant_value)
+
+    numerical_operator = BATCH_NUMERICAL_BINARY_OPERATORS[expression_node.value]
+    left_operand = _compile_batch_calculation(expression_node.children[0], fluent_columns)
+    right_operand = _compile_batch_calculation(expression_node.children[1], fluent_columns)
+    return lambda fluents_matrix: numerical_operator(left_operand(fluents_matrix), right_operand(fluents_matrix))
+
+
+def compile_batch_expression(
+    expression_tree: Union[NumericalExpressionTree, AnyNode], fluent_names: List[str]
+) -> BatchFunction:
+    """Compiles a numeric expression into a function that evaluates it over a matrix of fluent values.
+
+    Note: comparisons are false for states in which some of the expression's fluents are missing (NaN), the same
+        as the single state evaluation of preconditions. Division by zero results in inf / NaN values instead of
+        raising an exception.
+
+    :param expression_tree: the expression to compile, either a comparison, an assignment or a calculation.
+    :param fluent_names: the untyped representations of the fluents that define the columns of the matrix.
+    :return: a function that receives the fluents matrix and returns a boolean vector for comparisons or a vector
+        of values for calculations and assignments.
+    """
+    root = expression_tree.root if isinstance(expression_tree, NumericalExpressionTree) else expression_tree
+    fluent_columns = {fluent_name: column for column, fluent_name in enumerate(fluent_names)}
+    if root.value in COMPARISON_OPERATORS:
+        comparison_operator = BATCH_COMPARISON_OPERATORS[root.value]
+        left_operand = _compile_batch_calculation(root.children[0], fluent_columns)
+        right_operand = _compile_batch_calculation(root.children[1], fluent_columns)
+
+        def evaluate_comparison(fluents_matrix: np.ndarray) -> np.ndarray:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                left_values = left_operand(fluents_matrix)
+                right_values = right_operand(fluents_matrix)
+                return comparison_operator(left_values, right_values) & ~(
+                    np.isnan(left_values) | np.isnan(right_values)
+                )
+
+        return evaluate_comparison
+
+    if root.value in ASSIGNMENT_EXPRESSIONS:
+        assignment_operator = BATCH_ASSIGNMENT_EXPRESSIONS[root.value]
+        assigned_fluent = _compile_batch_calculation(root.children[0], fluent_columns)
+        assigned_value = _compile_batch_calculation(root.children[1], fluent_columns)
+
+        def evaluate_assignment(fluents_matrix: np.ndarray) -> np.ndarray:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                new_values = assignment_operator(assigned_fluent(fluents_matrix), assigned_value(fluents_matrix))
+
+            if "NUMERIC_PRECISION" in os.environ:
+                return np.round(new_values, int(os.environ["NUMERIC_PRECISION"]))
+
+            return new_values
+
+        return evaluate_assignment
+
+    calculate_values = _compile_batch_calculation(root, fluent_columns)
+
+    def evaluate_calculation(fluents_matrix: np.ndarray) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return calculate_values(fluents_matrix)
+
+    return evaluate_calculation
+
+
+def evaluate_batch(
+    expression_tree: Union[NumericalExpressionTree, AnyNode], fluents_matrix: np.ndarray, fluent_names: List[str]
+) -> np.ndarray:
+    """Evaluates a numeric expression over a batch of states in a single call.
+
+    :param expression_tree: the expression to evaluate.
+    :param fluents_matrix: matrix of shape (states x fluents) containing the values of the fluents.
+    :param fluent_names: the untyped representations of the fluents that define the columns of the matrix.
+    :return: a boolean vector for comparisons or a vector of values for calculations and assignments.
+    """
+    return compile_batch_expression(expression_tree, fluent_names)(fluents_matrix)
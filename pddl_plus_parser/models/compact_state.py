@@ -0,0 +1,276 @@
+"""Module that represents a compact, bitset backed, version of a state in a PDDL trajectory."""
+import math
+from array import array
+from collections import defaultdict
+from typing import Dict, List, Iterator, Optional, Tuple
+
+from .pddl_function import PDDLFunction
+from .pddl_predicate import GroundedPredicate, GroundedPredicateSet
+from .pddl_problem import Problem
+from .pddl_state import State
+
+MISSING_FLUENT_VALUE = math.nan
+
+
+class FactIndex:
+    """Index that maps the grounded facts and fluents of a problem to bit positions and fluent slots.
+
+    Note: the index grows when it encounters new facts or fluents, so the compact states of a problem should all
+        share the same index.
+    """
+
+    predicates: List[GroundedPredicate]
+    fluents: List[PDDLFunction]
+    _fact_ids: Dict[str, int]
+    _fluent_slots: Dict[str, int]
+
+    def __init__(self):
+        self.predicates = []
+        self.fluents = []
+        self._fact_ids = {}
+        self._fluent_slots = {}
+
+    @classmethod
+    def from_problem(cls, problem: Problem) -> "FactIndex":
+        """Creates an index containing the facts and fluents of the problem's initial and goal states.
+
+        :param problem: the problem to index.
+        :return: the index of the problem's facts and fluents.
+        """
+        fact_index = cls()
+        for grounded_predicates in problem.initial_state_predicates.values():
+            for predicate in grounded_predicates:
+                fact_index.fact_id(predicate)
+
+        for predicate in problem.goal_state_predicates:
+            fact_index.fact_id(predicate if predicate.is_positive else predicate.copy(is_negated=True))
+
+        for fluent in problem.initial_state_fluents.values():
+            fact_index.fluent_slot(fluent)
+
+        return fact_index
+
+    @property
+    def num_facts(self) -> int:
+        return len(self.predicates)
+
+    @property
+    def num_fluents(self) -> int:
+        return len(self.fluents)
+
+    def fact_id(self, predicate: GroundedPredicate) -> int:
+        """Returns the bit position of the positive grounded fact and registers it if it is not indexed yet.
+
+        :param predicate: the positive grounded predicate.
+        :return: the bit position of the fact.
+        """
+        fact_key = predicate.untyped_representation
+        fact_id = self._fact_ids.get(fact_key)
+        if fact_id is None:
+            fact_id = len(self.predicates)
+            self._fact_ids[fact_key] = fact_id
+            self.predicates.append(predicate)
+
+        return fact_id
+
+    def fluent_slot(self, fluent: PDDLFunction) -> int:
+        """Returns the slot of the grounded fluent and registers it if it is not indexed yet.
+
+        :param fluent: the grounded numeric fluent.
+        :return: the slot of the fluent in the fluents array.
+        """
+        fluent_key = fluent.untyped_representation
+        fluent_slot = self._fluent_slots.get(fluent_key)
+        if fluent_slot is None:
+            fluent_slot = len(self.fluents)
+            self._fluent_slots[fluent_key] = fluent_slot
+            self.fluents.append(fluent)
+
+        return fluent_slot
+
+    def get_fact_id(self, fact_key: str) -> Optional[int]:
+        """Returns the bit position of the fact without registering it.
+
+        :param fact_key: the untyped representation of the positive grounded fact.
+        :return: the bit position of the fact or None if the fact is not indexed.
+        """
+        return self._fact_ids.get(fact_key)
+
+    def get_fluent_slot(self, fluent_key: str) -> Optional[int]:
+        """Returns the slot of the fluent without registering it.
+
+        :param fluent_key: the untyped representation of the grounded fluent.
+        :return: the slot of the fluent or None if the fluent is not indexed.
+        """
+        return self._fluent_slots.get(fluent_key)
+
+
+class CompactState:
+    """A compact representation of a state holding its facts as a bitset and its fluents as a float array.
+
+    Note: fluents that are not defined in the state have a NaN value. Compact states are only equal to states that
+        share their index, states using different indices should be compared after converting them to regular states.
+    """
+
+    fact_index: FactIndex
+    facts: bytearray
+    fluents: array
+    is_init: bool
+
+    def __init__(
+        self,
+        fact_index: FactIndex,
+        facts: Optional[bytearray] = None,
+        fluents: Optional[array] = None,
+        is_init: bool = False,
+    ):
+        self.fact_index = fact_index
+        self.facts = facts if facts is not None else bytearray()
+        self.fluents = fluents if fluents is not None else array("d")
+        self.is_init = is_init
+        self._match_index_size()
+
+    @classmethod
+    def from_state(cls, state: State, fact_index: FactIndex) -> "CompactState":
+        """Creates a compact state from a regular state, registering unseen facts and fluents in the index.
+
+        :param state: the state to convert.
+        :param fact_index: the index of the problem's facts and fluents.
+        :return: the compact state.
+        """
+        compact_state = cls(fact_index, is_init=state.is_init)
+        for grounded_predicates in state.state_predicates.values():
+            for predicate in grounded_predicates:
+                compact_state.add_fact(predicate)
+
+        for fluent in state.state_fluents.values():
+            compact_state.set_fluent_value(fluent, fluent.value)
+
+        return compact_state
+
+    def _match_index_size(self) -> None:
+        """Pads the bitset and the fluents array to match the current size of the index."""
+        num_fact_bytes = (self.fact_index.num_facts + 7) >> 3
+        if len(self.facts) < num_fact_bytes:
+            self.facts.extend(bytes(num_fact_bytes - len(self.facts)))
+
+        if len(self.fluents) < self.fact_index.num_fluents:
+            self.fluents.extend([MISSING_FLUENT_VALUE] * (self.fact_index.num_fluents - len(self.fluents)))
+
+    def _canonical_form(self) -> Tuple[bytes, bytes]:
+        """Returns the facts and the fluents of the state without the trailing unset facts and undefined fluents.
+
+        Note: the canonical form does not depend on the current size of the index, so states that were padded at
+            different times are still considered equal and keep their hash.
+
+        :return: the canonical bytes of the facts and of the fluents.
+        """
+        num_defined_fluents = len(self.fluents)
+        while num_defined_fluents > 0 and math.isnan(self.fluents[num_defined_fluents - 1]):
+            num_defined_fluents -= 1
+
+        return bytes(self.facts).rstrip(b"\x00"), self.fluents[:num_defined_fluents].tobytes()
+
+    def __eq__(self, other: "CompactState") -> bool:
+        # The bits and slots of different indices do not match, so the hash of states using them cannot match either.
+        if not isinstance(other, CompactState) or self.fact_index is not other.fact_index:
+            return False
+
+        return self._canonical_form() == other._canonical_form()
+
+    def __hash__(self) -> int:
+        return hash(self._canonical_form())
+
+    def __len__(self) -> int:
+        return sum(bin(fact_byte).count("1") for fact_byte in self.facts)
+
+    def copy(self) -> "CompactState":
+        """Creates a copy of the compact state."""
+        return CompactState(self.fact_index, bytearray(self.facts), array("d", self.fluents), is_init=self.is_init)
+
+    def holds(self, predicate: GroundedPredicate) -> bool:
+        """Checks whether the positive grounded fact holds in the state.
+
+        :param predicate: the positive grounded predicate.
+        :return: whether the fact is set in the state.
+        """
+        fact_id = self.fact_index.get_fact_id(predicate.untyped_representation)
+        if fact_id is None or (fact_id >> 3) >= len(self.facts):
+            return False
+
+        return bool(self.facts[fact_id >> 3] & (1 << (fact_id & 7)))
+
+    def add_fact(self, predicate: GroundedPredicate) -> None:
+        """Sets the positive grounded fact in the state.
+
+        :param predicate: the positive grounded predicate.
+        """
+        fact_id = self.fact_index.fact_id(predicate)
+        self._match_index_size()
+        self.facts[fact_id >> 3] |= 1 << (fact_id & 7)
+
+    def remove_fact(self, predicate: GroundedPredicate) -> None:
+        """Removes the positive grounded fact from the state.
+
+        :param predicate: the positive grounded predicate.
+        """
+        fact_id = self.fact_index.get_fact_id(predicate.untyped_representation)
+        if fact_id is None or (fact_id >> 3) >= len(self.facts):
+            return
+
+        self.facts[fact_id >> 3] &= ~(1 << (fact_id & 7)) & 0xFF
+
+    def get_fluent_value(self, fluent: PDDLFunction) -> float:
+        """Returns the value of the grounded fluent in the state.
+
+        :param fluent: the grounded numeric fluent.
+        :return: the value of the fluent.
+        """
+        fluent_slot = self.fact_index.get_fluent_slot(fluent.untyped_representation)
+        if fluent_slot is None or fluent_slot >= len(self.fluents) or math.isnan(self.fluents[fluent_slot]):
+            raise KeyError(f"The fluent {fluent.untyped_representation} is not defined in the state.")
+
+        return self.fluents[fluent_slot]
+
+    def set_fluent_value(self, fluent: PDDLFunction, value: float) -> None:
+        """Sets the value of the grounded fluent in the state.
+
+        :param fluent: the grounded numeric fluent.
+        :param value: the value to set.
+        """
+        fluent_slot = self.fact_index.fluent_slot(fluent)
+        self._match_index_size()
+        self.fluents[fluent_slot] = value
+
+    def iter_facts(self) -> Iterator[GroundedPredicate]:
+        """Iterates over the grounded facts that hold in the state.
+
+        :return: an iterator over the positive grounded predicates.
+        """
+        for byte_index, fact_byte in enumerate(self.facts):
+            if fact_byte == 0:
+                continue
+
+            for bit_index in range(8):
+                if fact_byte & (1 << bit_index):
+                    yield self.fact_index.predicates[(byte_index << 3) | bit_index]
+
+    def to_state(self) -> State:
+        """Converts the compact state to a regular state.
+
+        :return: the state object containing the facts and the fluents of the compact state.
+        """
+        state_predicates = defaultdict(GroundedPredicateSet)
+        for predicate in self.iter_facts():
+            state_predicates[predicate.lifted_untyped_representation].add(predicate)
+
+        state_fluents = {}
+        for fluent_slot, value in enumerate(self.fluents):
+            if math.isnan(value):
+                continue
+
+            fluent = self.fact_index.fluents[fluent_slot].copy()
+            fluent.stored_value = value
+            state_fluents[fluent.untyped_representation] = fluent
+
+        return State(predicates=state_predicates, fluents=state_fluents, is_init=self.is_init)
@@ -0,0 +1,140 @@
+"""Module that contains the compact node type of the numeric expression trees."""
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+
+class ExpressionNode:
+    """Lightweight node of a numeric expression tree.
+
+    Note: the node exposes the subset of the anytree.AnyNode API that is used for the numeric expressions - id, value,
+        children, parent, is_leaf, is_root, root, depth, height and descendants - so that it can be used wherever an
+        AnyNode expression was used, e.g., with anytree's RenderTree and PreOrderIter. Unlike AnyNode, the node stores
+        its fields in slots and assigning children does not validate the tree, which makes creating and copying the
+        expression trees of the grounded operators cheaper.
+    """
+
+    __slots__ = ("id", "value", "_children", "_parent")
+
+    id: Any
+    value: Any
+    _children: Tuple["ExpressionNode", ...]
+    _parent: Optional["ExpressionNode"]
+
+    def __init__(
+        self,
+        id: Any = None,
+        value: Any = None,
+        children: Iterable["ExpressionNode"] = (),
+        parent: Optional["ExpressionNode"] = None,
+    ):
+        self.id = id
+        self.value = value
+        self._parent = None
+        self._children = ()
+        if children:
+            self.children = children
+
+        if parent is not None:
+            self.parent = parent
+
+    def __repr__(self):
+        return f"ExpressionNode(id={self.id!r}, value={self.value!r})"
+
+    @classmethod
+    def from_node(cls, node: Any) -> "ExpressionNode":
+        """Creates a compact copy of an AnyNode compatible expression tree.
+
+        :param node: the root of the expression tree, e.g., an AnyNode.
+        :return: the root of the compact expression tree.
+        """
+        return cls(id=node.id, value=node.value, children=[cls.from_node(child) for child in node.children])
+
+    @property
+    def children(self) -> Tuple["ExpressionNode", ...]:
+        """Returns the children of the node."""
+        return self._children
+
+    @children.setter
+    def children(self, children: Iterable["ExpressionNode"]) -> None:
+        """Replaces the children of the node, detaching the previous children from the node.
+
+        :param children: the new children of the node.
+        """
+        children = tuple(children)
+        for child in self._children:
+            child._parent = None
+
+        for child in children:
+            if child._parent is not self:
+                child.parent = None
+
+            child._parent = self
+
+        self._children = children
+
+    @property
+    def parent(self) -> Optional["ExpressionNode"]:
+        """Returns the parent of the node or None if the node is the root of the tree."""
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: Optional["ExpressionNode"]) -> None:
+        """Attaches the node as the last child of the parent, None detaches the node from its current parent.
+
+        :param parent: the new parent of the node.
+        """
+        if self._parent is parent:
+            return
+
+        if self._parent is not None:
+            self._parent._children = tuple(sibling for sibling in self._parent._children if sibling is not self)
+            self._parent = None
+
+        if parent is not None:
+            parent._children = (*parent._children, self)
+            self._parent = parent
+
+    @property
+    def is_leaf(self) -> bool:
+        """Returns whether the node has no children."""
+        return len(self._children) == 0
+
+    @property
+    def is_root(self) -> bool:
+        """Returns whether the node has no parent."""
+        return self._parent is None
+
+    @property
+    def root(self) -> "ExpressionNode":
+        """Returns the root of the tree that contains the node."""
+        node = self
+        while node._parent is not None:
+            node = node._parent
+
+        return node
+
+    @property
+    def depth(self) -> int:
+        """Returns the number of edges between the node and the root of the tree."""
+        depth = 0
+        node = self
+        while node._parent is not None:
+            node = node._parent
+            depth += 1
+
+        return depth
+
+    @property
+    def height(self) -> int:
+        """Returns the number of edges in the longest path from the node to a leaf."""
+        return max((child.height + 1 for child in self._children), default=0)
+
+    def _iter_descendants(self) -> Iterator["ExpressionNode"]:
+        """Iterates over the descendants of the node in pre-order."""
+        for child in self._children:
+            yield child
+            yield from child._iter_descendants()
+
+    @property
+    def descendants(self) -> Tuple["ExpressionNode", ...]:
+        """Returns the descendants of the node in pre-order."""
+        return tuple(self._iter_descendants())
@@ -1,6 +1,6 @@
 """Module that encapsulates the functionality of grounded effects."""
 import logging
-from typing import Set, Dict, Optional
+from typing import Set, Dict, Optional, Callable, List, Tuple
 
 from pddl_plus_parser.models.grounded_precondition import GroundedPrecondition
 from pddl_plus_parser.models.grounding_utils import (
@@ -9,8 +9,9 @@ from pddl_plus_parser.models.grounding_utils import (
 )
 from pddl_plus_parser.models.numerical_expression import (
     NumericalExpressionTree,
-    evaluate_expression,
-    set_expression_value,
+    evaluate,
+    compile_calculation,
+    ASSIGNMENT_EXPRESSIONS,
 )
 from pddl_plus_parser.models.pddl_action import Action
 from pddl_plus_parser.models.pddl_domain import Domain
@@ -29,6 +30,7 @@ class GroundedEffect:
     grounded_antecedents: GroundedPrecondition
     grounded_discrete_effects: Set[GroundedPredicate]
     grounded_numeric_effects: Set[NumericalExpressionTree]
+    _compiled_effect: Optional[Callable[[State], None]]
 
     def __init__(
         self,
@@ -49,6 +51,7 @@ class GroundedEffect:
         self.action = action
         self.grounded_discrete_effects = set()
         self.grounded_numeric_effects = set()
+        self._compiled_effect = None
         self.logger = logging.getLogger(__name__)
 
     def ground_conditional_effect(self, parameters_map: Dict[str, str]) -> None:
@@ -70,6 +73,8 @@ class GroundedEffect:
                 ground_numeric_calculation_tree(effect, parameters_map, self.domain)
             )
 
+        self._compiled_effect = self._compile_effect()
+
     def antecedents_hold(
         self, state: State, allow_inapplicable_actions: bool = False
     ) -> bool:
@@ -84,14 +89,12 @@ class GroundedEffect:
 
         return self.grounded_antecedents.is_applicable(state)
 
-    def _apply_discrete_effects(
-        self, next_state_predicates: Dict[str, Set[GroundedPredicate]]
-    ) -> None:
+    def _apply_discrete_effects(self, next_state: State) -> None:
         """Applies the discrete effects to the given state.
 
         Note: This method works according to the delete then add semantics of PDDL+.
 
-        :param next_state_predicates: the next state predicates to update with the effect's data.
+        :param next_state: the next state to update with the effect's data.
         """
         # delete effects
         delete_effects = [
@@ -103,33 +106,32 @@ class GroundedEffect:
             effect for effect in self.grounded_discrete_effects if effect.is_positive
         ]
         for predicate in delete_effects:
-            positive_predicate = predicate.copy()
-            positive_predicate.is_positive = True
+            positive_predicate = predicate.copy(is_negated=True)
             if (
                 positive_predicate.lifted_untyped_representation
-                not in next_state_predicates
+                not in next_state.state_predicates
             ):
                 continue
 
-            for state_predicate in next_state_predicates[
+            for state_predicate in next_state.state_predicates[
                 positive_predicate.lifted_untyped_representation
             ]:
                 if (
                     state_predicate.untyped_representation
                     == positive_predicate.untyped_representation
                 ):
-                    next_state_predicates[
+                    next_state.get_mutable_groundings(
                         positive_predicate.lifted_untyped_representation
-                    ].discard(state_predicate)
+                    ).discard(state_predicate)
                     break
 
         for predicate in add_effects:
             lifted_predicate_str = predicate.lifted_untyped_representation
-            next_state_grounded_predicates = next_state_predicates.get(
-                lifted_predicate_str, set()
-            )
-            next_state_grounded_predicates.add(predicate)
-            next_state_predicates[lifted_predicate_str] = next_state_grounded_predicates
+            next_state_grounded_predicates = next_state.state_predicates.get(lifted_predicate_str)
+            if next_state_grounded_predicates is not None and predicate in next_state_grounded_predicates:
+                continue
+
+            next_state.get_mutable_groundings(lifted_predicate_str).add(predicate)
 
     @staticmethod
     def _update_single_numeric_expression(
@@ -142,8 +144,97 @@ class GroundedEffect:
         :param previous_state_functions: the previous values of the numeric expressions to use to evaluate
             the next state functions.
         """
-        set_expression_value(numeric_expression.root, previous_state_functions)
-        return evaluate_expression(numeric_expression.root)
+        assigned_fluent: PDDLFunction = numeric_expression.root.children[0].value
+        updated_fluent = previous_state_functions[assigned_fluent.untyped_representation].copy()
+        updated_fluent.set_value(evaluate(numeric_expression, previous_state_functions))
+        return updated_fluent
+
+    @staticmethod
+    def _compile_numeric_effect(
+        numeric_expression: NumericalExpressionTree,
+    ) -> Optional[Callable[[Dict[str, PDDLFunction]], PDDLFunction]]:
+        """Compiles a numeric effect into a closure that calculates the updated fluent from the state's fluents.
+
+        :param numeric_expression: the expression that represents the change to the state.
+        :return: a function that receives the state's fluents and returns the updated copy of the assigned fluent or
+            None if the expression is not an assignment.
+        """
+        root = numeric_expression.root
+        if root.value not in ASSIGNMENT_EXPRESSIONS or not isinstance(root.children[0].value, PDDLFunction):
+            return None
+
+        assignment = ASSIGNMENT_EXPRESSIONS[root.value]
+        assigned_fluent_key = root.children[0].value.untyped_representation
+        calculate_operand = compile_calculation(root.children[1])
+
+        def compute_assigned_fluent(state_fluents: Dict[str, PDDLFunction]) -> PDDLFunction:
+            assigned_fluent = state_fluents[assigned_fluent_key].copy()
+            assignment(assigned_fluent, calculate_operand(state_fluents))
+            return assigned_fluent
+
+        return compute_assigned_fluent
+
+    def _compile_effect(self) -> Optional[Callable[[State], None]]:
+        """Compiles the grounded effects into a flat closure that updates the state without traversing the effects.
+
+        Note: the compiled effect has the same delete then add semantics as `apply`.
+
+        :return: a function that receives a state and applies the effect on it or None if some of the numeric effects
+            cannot be compiled.
+        """
+        delete_effects: List[Tuple[str, str, GroundedPredicate]] = []
+        add_effects: List[Tuple[str, GroundedPredicate]] = []
+        for effect in self.grounded_discrete_effects:
+            if effect.is_positive:
+                add_effects.append((effect.lifted_untyped_representation, effect))
+                continue
+
+            positive_predicate = effect.copy(is_negated=True)
+            delete_effects.append(
+                (
+                    positive_predicate.lifted_untyped_representation,
+                    positive_predicate.untyped_representation,
+                    positive_predicate,
+                )
+            )
+
+        numeric_effects = []
+        for numeric_expression in self.grounded_numeric_effects:
+            compiled_numeric_effect = self._compile_numeric_effect(numeric_expression)
+            if compiled_numeric_effect is None:
+                return None
+
+            numeric_effects.append(compiled_numeric_effect)
+
+        def apply_effect(state: State) -> None:
+            state_predicates = state.state_predicates
+            for lifted_predicate_str, predicate_str, positive_predicate in delete_effects:
+                grounded_predicates = state_predicates.get(lifted_predicate_str)
+                if not grounded_predicates:
+                    continue
+
+                if positive_predicate in grounded_predicates:
+                    state.get_mutable_groundings(lifted_predicate_str).discard(positive_predicate)
+                    continue
+
+                for state_predicate in grounded_predicates:
+                    if state_predicate.untyped_representation == predicate_str:
+                        state.get_mutable_groundings(lifted_predicate_str).discard(state_predicate)
+                        break
+
+            for lifted_predicate_str, predicate in add_effects:
+                grounded_predicates = state_predicates.get(lifted_predicate_str)
+                if grounded_predicates is not None and predicate in grounded_predicates:
+                    continue
+
+                state.get_mutable_groundings(lifted_predicate_str).add(predicate)
+
+            state_fluents = state.state_fluents
+            assigned_fluents = [compute_assigned_fluent(state_fluents) for compute_assigned_fluent in numeric_effects]
+            for assigned_fluent in assigned_fluents:
+                state_fluents[assigned_fluent.untyped_representation] = assigned_fluent
+
+        return apply_effect
 
     @property
     def grounded_numeric_fluents(self) -> Set[str]:
@@ -165,7 +256,11 @@ class GroundedEffect:
         :param state: the state in which the effect is applied.
         """
         self.logger.debug("The antecedents for the effect hold so applying the effect.")
-        self._apply_discrete_effects(next_state_predicates=state.state_predicates)
+        if self._compiled_effect is not None:
+            self._compiled_effect(state)
+            return
+
+        self._apply_discrete_effects(next_state=state)
         new_values = []
         for grounded_expression in self.grounded_numeric_effects:
             new_values.append(
@@ -1,7 +1,7 @@
 """Module to encapsulate the functionality of grounded preconditions."""
 
 import logging
-from typing import Set, Tuple, Dict, Optional
+from typing import Set, Tuple, Dict, Optional, Callable, List
 
 from pddl_plus_parser.models import PDDLFunction
 from pddl_plus_parser.models.grounding_utils import (
@@ -10,8 +10,9 @@ from pddl_plus_parser.models.grounding_utils import (
 )
 from pddl_plus_parser.models.numerical_expression import (
     NumericalExpressionTree,
-    evaluate_expression,
-    set_expression_value,
+    evaluate,
+    compile_comparison,
+    COMPARISON_OPERATORS,
 )
 from pddl_plus_parser.models.pddl_action import Action
 from pddl_plus_parser.models.pddl_domain import Domain
@@ -26,6 +27,8 @@ from pddl_plus_parser.models.pddl_state import State
 
 BinaryOperator = {"and": lambda x, y: x and y, "or": lambda x, y: x or y}
 
+CompiledCondition = Callable[[State], bool]
+
 
 class GroundedPrecondition:
     """class representing the grounded version of an action's precondition."""
@@ -33,6 +36,7 @@ class GroundedPrecondition:
     _lifted_precondition: CompoundPrecondition
     _grounded_precondition: CompoundPrecondition
     _parameter_map: Dict[str, str]
+    _compiled_precondition: Optional[CompiledCondition]
     logger: logging.Logger
 
     def __init__(self, lifted_precondition: CompoundPrecondition, domain: Domain, action: Action):
@@ -40,11 +44,20 @@ class GroundedPrecondition:
         self._grounded_precondition = CompoundPrecondition()
         self.domain = domain
         self.action = action
+        self._compiled_precondition = None
         self.logger = logging.getLogger(__name__)
 
     def __iter__(self):
         yield from self._grounded_precondition
 
+    @property
+    def grounded_condition(self) -> Precondition:
+        """The root of the grounded precondition tree.
+
+        :return: the grounded root condition.
+        """
+        return self._grounded_precondition.root
+
     @staticmethod
     def _ground_equality_objects(
         equality_preconditions: Set[Tuple[str, str]], parameters_map: Dict[str, str]
@@ -124,10 +137,11 @@ class GroundedPrecondition:
         :return: whether the numeric expression is applicable in the given state.
         """
         try:
-            set_expression_value(condition.root, state.state_fluents)
-            self.logger.debug(f"Validating if the expression {condition.to_pddl()} is applicable in the state")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Validating if the expression {condition.to_pddl()} is applicable in the state")
+
             is_applicable = BinaryOperator[preconditions.binary_operator](
-                prev_is_applicable, evaluate_expression(condition.root)
+                prev_is_applicable, evaluate(condition, state.state_fluents)
             )
 
         except KeyError:
@@ -153,20 +167,15 @@ class GroundedPrecondition:
         :param state: the state to validate the predicate in.
         :return: whether the predicate is applicable in the given state.
         """
-        self.logger.debug(
-            f"Validating if the predicate {condition.untyped_representation} " f"is applicable in the state"
-        )
-        positive_condition_predicate = condition.copy()
-        positive_condition_predicate.is_positive = True
-
-        is_applicable = BinaryOperator[preconditions.binary_operator](
-            prev_is_applicable,
-            (
-                condition.untyped_representation in state.serialize()
-                if condition.is_positive
-                else positive_condition_predicate.untyped_representation not in state.serialize()
-            ),
-        )
+        self.logger.debug("Validating if the predicate %s is applicable in the state", condition.untyped_representation)
+
+        if condition.is_positive:
+            predicate_holds = state.holds(condition)
+
+        else:
+            predicate_holds = not state.holds(condition.copy(is_negated=True))
+
+        is_applicable = BinaryOperator[preconditions.binary_operator](prev_is_applicable, predicate_holds)
         return is_applicable
 
     def _ground_universal_condition(
@@ -180,9 +189,9 @@ class GroundedPrecondition:
         :return: the grounded condition for a single object.
         """
         grounded_preconditions = Precondition(condition.binary_operator)
-        tmp_action = Action()
-        tmp_action.signature = self.action.signature
-        tmp_action.signature[condition.quantified_parameter] = condition.quantified_type
+        tmp_action = Action(
+            signature={**self.action.signature, condition.quantified_parameter: condition.quantified_type}
+        )
         for sub_condition in condition.operands:
             if isinstance(sub_condition, Predicate):
                 grounded_predicate = ground_predicate(sub_condition, extended_parameter_map, self.domain, tmp_action)
@@ -288,6 +297,99 @@ class GroundedPrecondition:
             
         return is_applicable
 
+    @staticmethod
+    def _compile_predicate(condition: GroundedPredicate) -> CompiledCondition:
+        """Compiles a grounded predicate into a fact lookup closure.
+
+        :param condition: the grounded predicate to compile.
+        :return: a function that receives a state and returns whether the predicate holds in it.
+        """
+        if condition.is_positive:
+            return lambda state: state.holds(condition)
+
+        positive_condition_predicate = condition.copy(is_negated=True)
+        return lambda state: not state.holds(positive_condition_predicate)
+
+    @staticmethod
+    def _compile_numeric_expression(condition: NumericalExpressionTree) -> Optional[CompiledCondition]:
+        """Compiles a numeric condition into a closure that evaluates it on the state's fluents.
+
+        :param condition: the grounded numeric condition to compile.
+        :return: a function that receives a state and returns whether the condition holds in it or None if the
+            condition is not a comparison.
+        """
+        if condition.root.value not in COMPARISON_OPERATORS:
+            return None
+
+        comparison = compile_comparison(condition.root)
+
+        def numeric_condition_holds(state: State) -> bool:
+            try:
+                return comparison(state.state_fluents)
+
+            except KeyError:
+                return False
+
+        return numeric_condition_holds
+
+    def _compile_condition(self, preconditions: Precondition) -> Optional[CompiledCondition]:
+        """Compiles the grounded condition into a flat closure so that it is evaluated without traversing the tree.
+
+        Note: the compiled condition has the same semantics as `_is_condition_applicable`.
+
+        :param preconditions: the grounded condition to compile.
+        :return: a function that receives a state and returns whether the condition holds in it or None if the
+            condition contains components that cannot be compiled, e.g., universal preconditions.
+        """
+        if preconditions.binary_operator not in BinaryOperator:
+            return None
+
+        compiled_operands: List[CompiledCondition] = []
+        for condition in preconditions.operands:
+            if isinstance(condition, GroundedPredicate):
+                compiled_operand = self._compile_predicate(condition)
+
+            elif isinstance(condition, NumericalExpressionTree):
+                compiled_operand = self._compile_numeric_expression(condition)
+
+            elif isinstance(condition, Precondition) and not isinstance(condition, UniversalPrecondition):
+                compiled_operand = self._compile_condition(condition)
+
+            else:
+                compiled_operand = None
+
+            if compiled_operand is None:
+                return None
+
+            compiled_operands.append(compiled_operand)
+
+        equality_holds = self._validate_equality_holds(preconditions)
+        compiled_operands = tuple(compiled_operands)
+        if preconditions.binary_operator == "and":
+            if not equality_holds:
+                return lambda _: False
+
+            def conjunction_holds(state: State) -> bool:
+                for compiled_operand in compiled_operands:
+                    if not compiled_operand(state):
+                        return False
+
+                return True
+
+            return conjunction_holds
+
+        if equality_holds:
+            return lambda _: True
+
+        def disjunction_holds(state: State) -> bool:
+            for compiled_operand in compiled_operands:
+                if compiled_operand(state):
+                    return True
+
+            return False
+
+        return disjunction_holds
+
     def ground_preconditions(self, parameters_map: Dict[str, str]) -> None:
         """Ground the preconditions of the action.
 
@@ -305,6 +407,7 @@ class GroundedPrecondition:
             grounded_conditions=self._grounded_precondition.root,
             parameters_map=parameters_map,
         )
+        self._compiled_precondition = self._compile_condition(self._grounded_precondition.root)
 
     @property
     def grounded_numeric_fluents(self) -> Set[str]:
@@ -329,4 +432,7 @@ class GroundedPrecondition:
         :return: True if the precondition is satisfied, False otherwise.
         """
         self.logger.debug("Validating if the preconditions hold in the state.")
+        if self._compiled_precondition is not None:
+            return self._compiled_precondition(state)
+
         return self._is_condition_applicable(self._grounded_precondition.root, state, problem_objects)
@@ -1,8 +1,7 @@
 """Nodule that contains utilities for grounding PDDL+ actions."""
 from typing import Dict, List, Set
 
-from anytree import AnyNode
-
+from pddl_plus_parser.models.expression_node import ExpressionNode
 from pddl_plus_parser.models.numerical_expression import NumericalExpressionTree
 from pddl_plus_parser.models.pddl_action import Action
 from pddl_plus_parser.models.pddl_domain import Domain
@@ -15,8 +14,8 @@ from pddl_plus_parser.models.pddl_predicate import (
 
 
 def _iterate_calc_tree_and_ground(
-    calc_node: AnyNode, parameters_map: Dict[str, str], domain: Domain
-) -> AnyNode:
+    calc_node: ExpressionNode, parameters_map: Dict[str, str], domain: Domain
+) -> ExpressionNode:
     """Recursion function that iterates over the lifted calculation tree and grounds its elements.
 
     :param calc_node: the current node the recursion currently visits.
@@ -42,11 +41,11 @@ def _iterate_calc_tree_and_ground(
             grounded_function = PDDLFunction(
                 name=lifted_function.name, signature=grounded_signature
             )
-            return AnyNode(id=str(grounded_function), value=grounded_function)
+            return ExpressionNode(id=str(grounded_function), value=grounded_function)
 
-        return AnyNode(id=calc_node.id, value=calc_node.value)
+        return ExpressionNode(id=calc_node.id, value=calc_node.value)
 
-    return AnyNode(
+    return ExpressionNode(
         id=calc_node.id,
         value=calc_node.value,
         children=[
@@ -0,0 +1,303 @@
+"""Module that represents linear numeric expressions without using symbolic computations."""
+import os
+import re
+from decimal import Decimal
+from typing import Dict, Optional, Set, Tuple, Union
+
+from anytree import AnyNode
+
+from .pddl_function import PDDLFunction
+
+DEFAULT_DIGITS = int(os.environ.get("NUMERIC_PRECISION", 4))
+
+Number = Union[int, float]
+
+
+def _format_number(number: float, decimal_digits: int) -> str:
+    """Formats a number the same way the symbolic simplification formats the numbers of the expressions.
+
+    :param number: the number to format.
+    :param decimal_digits: the number of decimal digits to keep.
+    :return: the string representing the number.
+    """
+    if round(number, decimal_digits).is_integer():
+        return f"{int(number)}"
+
+    # Sympy formats its floats through their decimal representation with 15 significant digits.
+    return format(Decimal(f"{number:.15g}"), f".{decimal_digits}f")
+
+
+def _symbol_name(function_name: str) -> str:
+    """Returns the name of the symbol that represents the function in the symbolic simplification.
+
+    :param function_name: the untyped representation of the function.
+    :return: the name of the function's symbol.
+    """
+    return re.sub(r"[\(\-\)\s\?]", "", function_name)
+
+
+def _coefficient_sort_key(coefficient: float, is_float: bool) -> Tuple:
+    """Returns the key by which sympy orders scaled functions according to their coefficients.
+
+    Note: sympy compares the type of the coefficients first (minus one, then integers and then floats) and then their
+        content, i.e., the value of integers and the sign, odd mantissa, exponent and bit count of floats.
+
+    :param coefficient: the coefficient of the function.
+    :param is_float: whether sympy represents the coefficient as a floating point number.
+    :return: the sort key of the coefficient.
+    """
+    if not is_float:
+        return (0,) if coefficient == -1 else (1, int(coefficient))
+
+    mantissa, denominator = abs(coefficient).as_integer_ratio()
+    exponent = 1 - denominator.bit_length()
+    while mantissa % 2 == 0:
+        mantissa >>= 1
+        exponent += 1
+
+    return 2, int(coefficient < 0), mantissa, exponent, mantissa.bit_length()
+
+
+class LinearExpression:
+    """Class that represents a linear combination of numeric functions and a constant.
+
+    Note: the coefficients are mapped by the untyped representation of the functions. Printing the expression sorts
+        the functions, so equal expressions are printed the same regardless of the order of their terms.
+        The expression also tracks which of its numbers were computed using non-integer numbers, since sympy keeps
+        them as floating point numbers even when their values are integers and orders and prints them differently.
+    """
+
+    coefficients: Dict[str, float]
+    functions: Dict[str, PDDLFunction]
+    constant: float
+    float_coefficients: Set[str]
+    is_float_constant: bool
+
+    def __init__(
+        self,
+        coefficients: Optional[Dict[str, float]] = None,
+        functions: Optional[Dict[str, PDDLFunction]] = None,
+        constant: Number = 0.0,
+        float_coefficients: Optional[Set[str]] = None,
+        is_float_constant: bool = False,
+    ):
+        self.coefficients = coefficients or {}
+        self.functions = functions or {}
+        self.constant = float(constant)
+        self.float_coefficients = float_coefficients or set()
+        self.is_float_constant = is_float_constant
+
+    def __str__(self):
+        return self.to_pddl()
+
+    def __eq__(self, other: "LinearExpression") -> bool:
+        if not isinstance(other, LinearExpression):
+            return False
+
+        self_coefficients = {name: value for name, value in self.coefficients.items() if value != 0}
+        other_coefficients = {name: value for name, value in other.coefficients.items() if value != 0}
+        return self_coefficients == other_coefficients and self.constant == other.constant
+
+    @classmethod
+    def from_function(cls, function: PDDLFunction) -> "LinearExpression":
+        """Creates a linear expression that contains only the function.
+
+        :param function: the numeric function.
+        :return: the linear expression of the function.
+        """
+        function_name = function.untyped_representation
+        return cls(coefficients={function_name: 1.0}, functions={function_name: function})
+
+    @classmethod
+    def from_expression_node(cls, expression_node: AnyNode) -> Optional["LinearExpression"]:
+        """Creates the linear expression that is equivalent to the arithmetic expression tree.
+
+        Note: the expression is not linear if it multiplies two non-constant expressions or divides by a non-constant
+            expression. In these cases None is returned and the expression should be simplified symbolically.
+
+        :param expression_node: the root of the arithmetic expression tree.
+        :return: the linear expression or None if the expression is not linear.
+        """
+        if expression_node.is_leaf:
+            if isinstance(expression_node.value, PDDLFunction):
+                return cls.from_function(expression_node.value)
+
+            constant = float(expression_node.value)
+            return cls(constant=constant, is_float_constant=not constant.is_integer())
+
+        left_expression = cls.from_expression_node(expression_node.children[0])
+        if left_expression is None:
+            return None
+
+        right_expression = cls.from_expression_node(expression_node.children[1])
+        if right_expression is None:
+            return None
+
+        if expression_node.value == "+":
+            return left_expression + right_expression
+
+        if expression_node.value == "-":
+            return left_expression - right_expression
+
+        if expression_node.value == "*":
+            if left_expression.is_constant:
+                return right_expression.scale(left_expression.constant, left_expression.is_float_constant)
+
+            if right_expression.is_constant:
+                return left_expression.scale(right_expression.constant, right_expression.is_float_constant)
+
+            return None
+
+        if expression_node.value == "/" and right_expression.is_constant and right_expression.constant != 0:
+            return left_expression.scale(1 / right_expression.constant, right_expression.is_float_constant)
+
+        return None
+
+    @property
+    def is_constant(self) -> bool:
+        """Returns whether the expression does not contain functions with non-zero coefficients."""
+        return all(coefficient == 0 for coefficient in self.coefficients.values())
+
+    def __add__(self, other: "LinearExpression") -> "LinearExpression":
+        return self.merge(other, 1.0)
+
+    def __sub__(self, other: "LinearExpression") -> "LinearExpression":
+        return self.merge(other, -1.0)
+
+    def __neg__(self) -> "LinearExpression":
+        return self.scale(-1.0)
+
+    def merge(self, other: "LinearExpression", factor: Number = 1.0) -> "LinearExpression":
+        """Merges the expressions by adding the other expression multiplied by the factor to this expression.
+
+        :param other: the expression to merge into this expression.
+        :param factor: the factor to multiply the other expression by.
+        :return: the merged expression.
+        """
+        coefficients = dict(self.coefficients)
+        functions = dict(self.functions)
+        float_coefficients = set(self.float_coefficients)
+        for function_name, coefficient in other.coefficients.items():
+            coefficients[function_name] = coefficients.get(function_name, 0.0) + factor * coefficient
+            functions.setdefault(function_name, other.functions[function_name])
+            # Terms that are multiplied by zero vanish in sympy, so they do not turn the coefficient into a float.
+            if function_name in other.float_coefficients and factor * coefficient != 0:
+                float_coefficients.add(function_name)
+
+        return LinearExpression(
+            coefficients,
+            functions,
+            self.constant + factor * other.constant,
+            {function_name for function_name in float_coefficients if coefficients[function_name] != 0},
+            self.is_float_constant or other.is_float_constant,
+        )
+
+    def scale(self, factor: Number, is_float_factor: bool = False) -> "LinearExpression":
+        """Multiplies the expression by a constant factor.
+
+        :param factor: the factor to multiply the expression by.
+        :param is_float_factor: whether the factor was computed using non-integer numbers.
+        :return: the scaled expression.
+        """
+        coefficients = {function_name: coefficient * factor for function_name, coefficient in self.coefficients.items()}
+        float_coefficients = set(self.coefficients) if is_float_factor else self.float_coefficients
+        return LinearExpression(
+            coefficients,
+            dict(self.functions),
+            self.constant * factor,
+            {function_name for function_name in float_coefficients if coefficients[function_name] != 0},
+            self.is_float_constant or is_float_factor,
+        )
+
+    def _is_float_coefficient(self, function_name: str) -> bool:
+        """Returns whether sympy represents the coefficient of the function as a floating point number.
+
+        :param function_name: the untyped representation of the function.
+        :return: whether the coefficient is a floating point number.
+        """
+        return function_name in self.float_coefficients or not self.coefficients[function_name].is_integer()
+
+    def normalize(self, decimal_digits: Optional[int] = None) -> "LinearExpression":
+        """Removes the functions whose coefficients are zero, optionally after rounding the numbers of the expression.
+
+        :param decimal_digits: the number of decimal digits to round the numbers to, None to avoid rounding.
+        :return: the normalized expression.
+        """
+        def round_number(number: float) -> float:
+            return number if decimal_digits is None else round(number, decimal_digits)
+
+        coefficients = {
+            function_name: round_number(coefficient)
+            for function_name, coefficient in self.coefficients.items()
+            if round_number(coefficient) != 0
+        }
+        functions = {function_name: self.functions[function_name] for function_name in coefficients}
+        float_coefficients = {function_name for function_name in self.float_coefficients if function_name in coefficients}
+        return LinearExpression(
+            coefficients, functions, round_number(self.constant), float_coefficients, self.is_float_constant
+        )
+
+    def evaluate(self, state_fluents: Dict[str, PDDLFunction]) -> float:
+        """Evaluates the expression using the values of the grounded functions.
+
+        :param state_fluents: the grounded functions mapped by their untyped representations.
+        :return: the value of the expression.
+        """
+        return self.constant + sum(
+            coefficient * state_fluents[function_name].value
+            for function_name, coefficient in self.coefficients.items()
+        )
+
+    def to_pddl(self, decimal_digits: int = DEFAULT_DIGITS) -> str:
+        """Converts the expression to a PDDL string in the format of the symbolically simplified expressions.
+
+        Note: the terms are ordered and printed as sympy orders and prints them. Functions with an integer coefficient
+            of one come first, sorted by the names of their symbols, and then the scaled functions, sorted by their
+            coefficients and names. Numbers that are integers after rounding are printed without decimal digits and
+            coefficients that are zero after rounding are omitted while the function itself is kept.
+
+        :param decimal_digits: the number of decimal digits to keep.
+        :return: the PDDL string of the expression.
+        """
+        function_names = [
+            function_name for function_name, coefficient in self.coefficients.items() if coefficient != 0
+        ]
+        symbol_names = sorted(
+            (
+                function_name
+                for function_name in function_names
+                if self.coefficients[function_name] == 1 and not self._is_float_coefficient(function_name)
+            ),
+            key=_symbol_name,
+        )
+        scaled_function_names = sorted(
+            (function_name for function_name in function_names if function_name not in symbol_names),
+            key=lambda function_name: (
+                _coefficient_sort_key(self.coefficients[function_name], self._is_float_coefficient(function_name)),
+                _symbol_name(function_name),
+            ),
+        )
+        terms = list(symbol_names)
+        for function_name in scaled_function_names:
+            formatted_coefficient = _format_number(self.coefficients[function_name], decimal_digits)
+            terms.append(
+                function_name
+                if float(formatted_coefficient) == 0
+                else f"(* {function_name} {formatted_coefficient})"
+            )
+
+        constant = _format_number(self.constant, decimal_digits)
+        if len(terms) == 0:
+            return constant
+
+        nested_expression = terms[-1]
+        if float(constant) != 0:
+            for term in [*reversed(terms[:-1]), constant]:
+                nested_expression = f"(+ {nested_expression} {term})"
+
+            return nested_expression
+
+        for term in reversed(terms[:-1]):
+            nested_expression = f"(+ {term} {nested_expression})"
+
+        return nested_expression
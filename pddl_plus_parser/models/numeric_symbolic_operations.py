@@ -9,6 +9,8 @@ from sympy.core.numbers import Zero, NegativeOne, One, Integer
 from sympy.logic.boolalg import BooleanTrue
 from sympy.parsing.sympy_parser import parse_expr
 
+from .simplification_cache import SIMPLIFICATION_CACHE
+
 SYMPY_OP_TO_PDDL_OP = {
     Add: "+",
     Mul: "*",
@@ -24,6 +26,11 @@ SYMPY_OP_TO_PDDL_OP = {
 DEFAULT_DECIMAL_DIGITS = os.environ.get("NUMERIC_PRECISION", 4)
 
 
+def _canonical_expression(expression: str) -> str:
+    """Returns the expression with its whitespaces normalized so that equal expressions share cache keys."""
+    return " ".join(expression.split())
+
+
 def is_number_string(s):
     pattern = re.compile(r"^-?\d+(\.\d+)?$")
     return bool(pattern.match(s))
@@ -212,6 +219,20 @@ def simplify_complex_numeric_expression(
     """Simplifies a complex numeric expression.
 
     Note: The expression should not be in PDD: format but in regular mathematical format.
+        The results are memoized in the process-wide simplification cache.
+
+    :param complex_numeric_expression: the expression to simplify.
+    :param decimal_digits: the number of decimal digits to keep.
+    :return: the simplified expression in PDDL format.
+    """
+    return SIMPLIFICATION_CACHE.get_or_compute(
+        ("expression", _canonical_expression(complex_numeric_expression), decimal_digits),
+        lambda: _simplify_complex_numeric_expression(complex_numeric_expression, decimal_digits),
+    )
+
+
+def _simplify_complex_numeric_expression(complex_numeric_expression: str, decimal_digits: int) -> str:
+    """Simplifies a complex numeric expression without using the simplification cache.
 
     :param complex_numeric_expression: the expression to simplify.
     :param decimal_digits: the number of decimal digits to keep.
@@ -228,11 +249,26 @@ def simplify_complex_numeric_expression(
 def simplify_equality(
     equation: str, decimal_digits=DEFAULT_DECIMAL_DIGITS
 ) -> Optional[str]:
+    """Simplifies a numeric equality.
+
+    Note: The results are memoized in the process-wide simplification cache.
+
+    :param equation: the equation to simplify in mathematical format.
+    :param decimal_digits: the number of decimal digits to keep.
+    :return: the simplified equality in PDDL format or None if the equality is trivial.
     """
+    return SIMPLIFICATION_CACHE.get_or_compute(
+        ("equality", _canonical_expression(equation), decimal_digits),
+        lambda: _simplify_equality(equation, decimal_digits),
+    )
+
 
-    :param equation:
-    :param decimal_digits:
-    :return:
+def _simplify_equality(equation: str, decimal_digits: int) -> Optional[str]:
+    """Simplifies a numeric equality without using the simplification cache.
+
+    :param equation: the equation to simplify in mathematical format.
+    :param decimal_digits: the number of decimal digits to keep.
+    :return: the simplified equality in PDDL format or None if the equality is trivial.
     """
     left_expr, right_expr = equation.split("=")
     transformed_left_expr, symbolic_vars = transform_expression(left_expr)
@@ -271,6 +307,31 @@ def simplify_inequality(
     1. if there are assumptions, substitute them into the inequality
     2. expand the brackets in the expression
 
+    Note: The results are memoized in the process-wide simplification cache.
+
+    :param complex_numeric_expression: the expression to simplify.
+    :param inequality_operator: the operator of the inequality.
+    :param assumptions: the assumptions to substitute into the inequality.
+    :param decimal_digits: the number of decimal digits to keep.
+    :return: the simplified expression in PDDL format.
+    """
+    return SIMPLIFICATION_CACHE.get_or_compute(
+        (
+            "inequality",
+            _canonical_expression(complex_numeric_expression),
+            inequality_operator,
+            tuple(_canonical_expression(assumption) for assumption in assumptions),
+            decimal_digits,
+        ),
+        lambda: _simplify_inequality(complex_numeric_expression, inequality_operator, assumptions, decimal_digits),
+    )
+
+
+def _simplify_inequality(
+    complex_numeric_expression: str, inequality_operator: str, assumptions: List[str], decimal_digits: int
+) -> Optional[str]:
+    """Simplifies a complex numeric inequality without using the simplification cache.
+
     :param complex_numeric_expression: the expression to simplify.
     :param inequality_operator: the operator of the inequality.
     :param assumptions: the assumptions to substitute into the inequality.
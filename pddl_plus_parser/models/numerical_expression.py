@@ -2,10 +2,12 @@
 
 import math
 import os
-from typing import List, Union, Dict, Optional, Iterator, Tuple
+from typing import List, Union, Dict, Optional, Iterator, Tuple, Callable, Mapping, Sequence, Type
 
 from anytree import AnyNode, RenderTree
 
+from .expression_node import ExpressionNode
+from .linear_expression import LinearExpression
 from .numeric_symbolic_operations import simplify_complex_numeric_expression
 from .pddl_function import PDDLFunction
 
@@ -29,11 +31,14 @@ LEGAL_NUMERICAL_EXPRESSIONS = [
 ]
 LEGAL_NUMERIC_OPERATORS = ["+", "-", "/", "*"]
 
+# Nested tuples of the operators and the operands' keys, functions are represented by their names and parameters.
+ExpressionKey = Union[float, Tuple[str, Tuple[str, ...]], Tuple[str, "ExpressionKey", "ExpressionKey"]]
+
 
 def construct_expression_tree(
     expression_ast: List[Union[str, List[str]]],
     domain_functions: Dict[str, PDDLFunction],
-) -> AnyNode:
+) -> ExpressionNode:
     """Constructs a tree that represents the numerical expression and that is later on able to be evaluated.
 
     :param expression_ast: the AST representing the numeric expression that is to be parsed.
@@ -46,7 +51,7 @@ def construct_expression_tree(
 
         ast_node_item: str = expression_ast
         try:
-            return AnyNode(id=f"{float(ast_node_item)}", value=float(ast_node_item))
+            return ExpressionNode(id=f"{float(ast_node_item)}", value=float(ast_node_item))
 
         except ValueError:
             raise SyntaxError("Leaf node with bad string was encountered!")
@@ -57,12 +62,12 @@ def construct_expression_tree(
             # Probably someone trying to perform numerical operation on constants.
             first_operand = float(expression_ast[1])
             second_operand = float(expression_ast[2])
-            node = AnyNode(
+            node = ExpressionNode(
                 id=expression_ast[0],
                 value=expression_ast[0],
                 children=[
-                    AnyNode(id=f"{first_operand}", value=first_operand),
-                    AnyNode(id=f"{second_operand}", value=second_operand),
+                    ExpressionNode(id=f"{first_operand}", value=first_operand),
+                    ExpressionNode(id=f"{second_operand}", value=second_operand),
                 ],
             )
             return node
@@ -70,7 +75,7 @@ def construct_expression_tree(
         function_name = expression_ast[0]
         extracted_function = domain_functions[function_name]
         if len(expression_ast) == 1:
-            return AnyNode(id=str(extracted_function), value=extracted_function)
+            return ExpressionNode(id=str(extracted_function), value=extracted_function)
 
         new_function = PDDLFunction(
             name=function_name,
@@ -79,9 +84,9 @@ def construct_expression_tree(
                 for param_name, param_type in zip(expression_ast[1:], extracted_function.signature.values())
             },
         )
-        return AnyNode(id=str(new_function), value=new_function)
+        return ExpressionNode(id=str(new_function), value=new_function)
 
-    node = AnyNode(
+    node = ExpressionNode(
         id=expression_ast[0],
         value=expression_ast[0],
         children=[
@@ -175,6 +180,33 @@ NUMERICAL_BINARY_OPERATORS = {
 }
 
 
+def _scale_down_value(previous_value: float, scale_factor: float) -> float:
+    """Calculates the value of a fluent after scaling it down without changing the fluent itself.
+
+    :param previous_value: the value of the fluent before the assignment.
+    :param scale_factor: the factor to scale the value by.
+    :return: the scaled down value.
+    """
+    if scale_factor == 0:
+        raise ValueError("Cannot scale down by zero!")
+
+    return previous_value / scale_factor
+
+
+# The value calculations of the assignment expressions that do not change the assigned fluents.
+ASSIGNMENT_VALUE_OPERATORS = {
+    "increase": lambda previous_value, operand: previous_value + operand,
+    "decrease": lambda previous_value, operand: previous_value - operand,
+    "assign": lambda _, operand: operand,
+    "scale-up": lambda previous_value, operand: previous_value * operand,
+    "scale-down": _scale_down_value,
+}
+
+# Either a mapping between the grounded fluents' names to their values (or the fluents themselves) or an array of
+# values that is accessed using a mapping between the fluents' names and their indices.
+FluentValues = Union[Mapping[str, Union[float, PDDLFunction]], Sequence[float]]
+
+
 def calculate(expression_node: AnyNode) -> float:
     """Calculates the numerical value of an expression tree.
 
@@ -194,6 +226,105 @@ def calculate(expression_node: AnyNode) -> float:
     return NUMERICAL_BINARY_OPERATORS[numerical_operator](left_operand, right_operand)
 
 
+def _get_fluent_value(
+    fluent_name: str, fluent_values: FluentValues, fluent_indices: Optional[Mapping[str, int]] = None
+) -> float:
+    """Reads the value of a fluent from the input values.
+
+    :param fluent_name: the untyped representation of the fluent.
+    :param fluent_values: the values of the fluents.
+    :param fluent_indices: the indices of the fluents in case the values are given as an array.
+    :return: the value of the fluent.
+    """
+    value = fluent_values[fluent_name] if fluent_indices is None else fluent_values[fluent_indices[fluent_name]]
+    return value.value if isinstance(value, PDDLFunction) else value
+
+
+def calculate_value(
+    expression_node: AnyNode, fluent_values: FluentValues, fluent_indices: Optional[Mapping[str, int]] = None
+) -> float:
+    """Calculates the numerical value of an expression tree without setting the values of its leaves.
+
+    :param expression_node: the node that is currently being observed.
+    :param fluent_values: the values of the fluents, e.g., the state's fluents.
+    :param fluent_indices: the indices of the fluents in case the values are given as an array.
+    :return: the value that was calculated.
+    """
+    if len(expression_node.children) == 0:
+        if isinstance(expression_node.value, PDDLFunction):
+            return _get_fluent_value(expression_node.value.untyped_representation, fluent_values, fluent_indices)
+
+        return expression_node.value
+
+    left_operand = calculate_value(expression_node.children[0], fluent_values, fluent_indices)
+    right_operand = calculate_value(expression_node.children[1], fluent_values, fluent_indices)
+    return NUMERICAL_BINARY_OPERATORS[expression_node.value](left_operand, right_operand)
+
+
+def evaluate(
+    expression_tree: Union["NumericalExpressionTree", AnyNode],
+    fluent_values: FluentValues,
+    fluent_indices: Optional[Mapping[str, int]] = None,
+) -> Union[bool, float]:
+    """Evaluates a PDDL expression using the input fluent values without changing the expression tree.
+
+    Note: since the tree is only read, the same tree can be evaluated concurrently with different values.
+
+    :param expression_tree: the PDDL expression to evaluate.
+    :param fluent_values: the values of the fluents, e.g., the state's fluents.
+    :param fluent_indices: the indices of the fluents in case the values are given as an array.
+    :return: bool if the expression is a comparison, the new value of the assigned fluent if the expression is an
+        assignment and otherwise the calculated value of the expression.
+    """
+    root = expression_tree.root if isinstance(expression_tree, NumericalExpressionTree) else expression_tree
+    if root.value in ASSIGNMENT_VALUE_OPERATORS:
+        assigned_fluent: PDDLFunction = root.children[0].value
+        previous_value = _get_fluent_value(assigned_fluent.untyped_representation, fluent_values, fluent_indices)
+        evaluated_operand = calculate_value(root.children[1], fluent_values, fluent_indices)
+        return ASSIGNMENT_VALUE_OPERATORS[root.value](previous_value, evaluated_operand)
+
+    if root.value in COMPARISON_OPERATORS:
+        compared_operator = calculate_value(root.children[0], fluent_values, fluent_indices)
+        evaluated_operand = calculate_value(root.children[1], fluent_values, fluent_indices)
+        return COMPARISON_OPERATORS[root.value](compared_operator, evaluated_operand)
+
+    return calculate_value(root, fluent_values, fluent_indices)
+
+
+def compile_calculation(expression_node: AnyNode) -> Callable[[Dict[str, PDDLFunction]], float]:
+    """Compiles a calculation tree into a closure that calculates its value directly from the state's fluents.
+
+    Note: the closure does not set the values of the tree's leaves, so the tree is not traversed when it is called.
+
+    :param expression_node: the root of the calculation tree.
+    :return: a function that receives the state's fluents and returns the calculated value.
+    """
+    if len(expression_node.children) == 0:
+        if isinstance(expression_node.value, PDDLFunction):
+            fluent_key = expression_node.value.untyped_representation
+            return lambda state_fluents: state_fluents[fluent_key].value
+
+        constant_value = expression_node.value
+        return lambda _: constant_value
+
+    numerical_operator = NUMERICAL_BINARY_OPERATORS[expression_node.value]
+    left_operand = compile_calculation(expression_node.children[0])
+    right_operand = compile_calculation(expression_node.children[1])
+    return lambda state_fluents: numerical_operator(left_operand(state_fluents), right_operand(state_fluents))
+
+
+def compile_comparison(expression_tree: AnyNode) -> Callable[[Dict[str, PDDLFunction]], bool]:
+    """Compiles a numeric comparison into a closure that evaluates it directly from the state's fluents.
+
+    :param expression_tree: the root of the comparison expression.
+    :return: a function that receives the state's fluents and returns whether the comparison holds.
+    """
+    comparison_operator = COMPARISON_OPERATORS[expression_tree.value]
+    left_operand = compile_calculation(expression_tree.children[0])
+    right_operand = compile_calculation(expression_tree.children[1])
+    return lambda state_fluents: comparison_operator(left_operand(state_fluents), right_operand(state_fluents))
+
+
 def evaluate_expression(
     expression_tree: AnyNode,
 ) -> Optional[Union[bool, PDDLFunction]]:
@@ -233,10 +364,30 @@ def set_expression_value(expression_node: AnyNode, state_fluents: Dict[str, PDDL
 
 
 class NumericalExpressionTree:
-    root: AnyNode
+    """Class that represents a numeric expression as a tree.
+
+    Note: the library creates the trees using compact ExpressionNode objects, which expose the same id, value, children
+        and parent attributes as anytree.AnyNode. A tree created from an AnyNode keeps the input node as its root, so
+        changes to the node affect the tree, use `from_anynode` to create a compact copy of an AnyNode tree instead.
+        The canonical key of the tree is computed once and is reset by the methods that change the tree, i.e.,
+        change_signature and locate_and_replace.
+    """
 
-    def __init__(self, expression_tree: AnyNode):
+    root: Union[ExpressionNode, AnyNode]
+    _key: Optional[ExpressionKey]
+
+    def __init__(self, expression_tree: Union[ExpressionNode, AnyNode]):
         self.root = expression_tree
+        self._key = None
+
+    @classmethod
+    def from_anynode(cls, expression_tree: AnyNode) -> "NumericalExpressionTree":
+        """Creates a tree of compact ExpressionNode objects that is a copy of the AnyNode expression tree.
+
+        :param expression_tree: the root of the AnyNode expression tree.
+        :return: the tree containing a compact copy of the expression.
+        """
+        return cls(ExpressionNode.from_node(expression_tree))
 
     def __str__(self):
         return "\n".join([f"{pre}{node.id}" for pre, _, node in RenderTree(self.root)])
@@ -248,22 +399,25 @@ class NumericalExpressionTree:
             for n in self._iter_internal(child):
                 yield n
 
-    def _copy_internal(self, node: AnyNode) -> AnyNode:
+    def _copy_internal(
+        self, node: Union[ExpressionNode, AnyNode], node_type: Type[Union[ExpressionNode, AnyNode]] = ExpressionNode
+    ) -> Union[ExpressionNode, AnyNode]:
         """Recursive method that copies the expression tree.
 
         :param node: the node that the recursion is currently working on.
+        :param node_type: the type of the nodes of the copied tree.
         :return: the copied node.
         """
         if node.is_leaf:
             if isinstance(node.value, PDDLFunction):
                 function: PDDLFunction = node.value
-                return AnyNode(id=str(function), value=function)
+                return node_type(id=str(function), value=function)
 
-            return AnyNode(id=node.id, value=node.value)
+            return node_type(id=node.id, value=node.value)
 
-        left_child = self._copy_internal(node.children[0])
-        right_child = self._copy_internal(node.children[1])
-        return AnyNode(id=node.id, value=node.value, children=[left_child, right_child])
+        left_child = self._copy_internal(node.children[0], node_type)
+        right_child = self._copy_internal(node.children[1], node_type)
+        return node_type(id=node.id, value=node.value, children=[left_child, right_child])
 
     def __iter__(self):
         """iterator in pre-order method."""
@@ -272,6 +426,33 @@ class NumericalExpressionTree:
     def __copy__(self) -> "NumericalExpressionTree":
         return NumericalExpressionTree(self._copy_internal(self.root))
 
+    def _create_key(self, node: ExpressionNode) -> ExpressionKey:
+        """Recursive method that creates the canonical key of the expression tree.
+
+        :param node: the node that the recursion is currently working on.
+        :return: the key of the expression.
+        """
+        if node.is_leaf:
+            if isinstance(node.value, PDDLFunction):
+                function: PDDLFunction = node.value
+                return function.name, tuple(function.signature)
+
+            return round(float(node.value), DEFAULT_DIGITS)
+
+        return node.value, self._create_key(node.children[0]), self._create_key(node.children[1])
+
+    @property
+    def key(self) -> ExpressionKey:
+        """Returns the canonical structural key of the expression.
+
+        Note: the numbers are rounded to the default number of decimal digits, so expressions with the same key have
+            the same PDDL representation.
+        """
+        if self._key is None:
+            self._key = self._create_key(self.root)
+
+        return self._key
+
     def _convert_to_pddl(self, node: AnyNode, decimal_digits: int = DEFAULT_DIGITS) -> str:
         """Recursive method that converts the expression tree to a PDDL string.
 
@@ -332,6 +513,8 @@ class NumericalExpressionTree:
                 function_to_change: PDDLFunction = node.value
                 function_to_change.change_signature(old_to_new_parameter_map)
 
+        self._key = None
+
     def locate_and_replace(
         self,
         expression_to_locate: "NumericalExpressionTree",
@@ -344,11 +527,14 @@ class NumericalExpressionTree:
         """
         for node in self.root.descendants:
             if str(NumericalExpressionTree(node)) == str(expression_to_locate):
-                item_to_replace_copy = expression_to_replace.__copy__()
+                # The copy uses the type of the located node since AnyNode trees accept only AnyNode children.
+                item_to_replace_copy = expression_to_replace._copy_internal(expression_to_replace.root, type(node))
                 prev_children = list(node.parent.children)
-                new_children = [item_to_replace_copy.root if child == node else child for child in prev_children]
+                new_children = [item_to_replace_copy if child == node else child for child in prev_children]
                 node.parent.children = tuple(new_children)
 
+        self._key = None
+
     def extract_eliminated_expressions(
         self,
     ) -> Optional[Tuple["NumericalExpressionTree", "NumericalExpressionTree"]]:
@@ -376,14 +562,16 @@ class NumericalExpressionTree:
 
         replacing_expression = (
             NumericalExpressionTree(
-                AnyNode(
+                ExpressionNode(
                     id="*",
                     value="*",
-                    children=[AnyNode(id="-1", value=-1), left_op_second_child],
+                    children=[ExpressionNode(id="-1", value=-1), left_op_second_child],
                 )
             )
             if right_operand.value == 0
-            else NumericalExpressionTree(AnyNode(id="-", value="-", children=[right_operand, left_op_second_child]))
+            else NumericalExpressionTree(
+                ExpressionNode(id="-", value="-", children=[right_operand, left_op_second_child])
+            )
         )
 
         return expression_to_eliminate, replacing_expression
@@ -391,10 +579,16 @@ class NumericalExpressionTree:
     def simplify_complex_numerical_pddl_expression(self, decimal_digits: int = DEFAULT_DIGITS) -> str:
         """Method that minimizes complex numeric expression by applying the simplify algorithm on the expression.
 
+        Note: linear expressions are merged natively and only non-linear expressions are simplified using sympy.
+
         :param decimal_digits: the number of decimal digits to show in the PDDL string.
         """
-        left_side_op = NumericalExpressionTree(self.root.children[0]).to_mathematical()
         right_side_op = self._convert_to_pddl(self.root.children[1], decimal_digits=decimal_digits)
+        linear_left_side = LinearExpression.from_expression_node(self.root.children[0])
+        if linear_left_side is not None:
+            return f"({self.root.value} {linear_left_side.to_pddl(decimal_digits)} {right_side_op})"
+
+        left_side_op = NumericalExpressionTree(self.root.children[0]).to_mathematical()
         simplified_left_side = simplify_complex_numeric_expression(left_side_op, decimal_digits=decimal_digits)
         return f"({self.root.value} {simplified_left_side} {right_side_op})"
 
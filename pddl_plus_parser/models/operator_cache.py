@@ -0,0 +1,84 @@
+"""Module that contains an LRU cache of grounded operators."""
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from .pddl_domain import Domain
+from .pddl_object import PDDLObject
+from .pddl_operator import Operator
+
+DEFAULT_OPERATOR_CACHE_SIZE = 1024
+
+
+class OperatorCache:
+    """LRU cache of the operators of a domain (and problem) keyed by the action name and the grounded parameters.
+
+    Note: operators ground themselves the first time they are used and keep their grounded preconditions and effects,
+        so a cached operator is grounded only once no matter how many times the action appears in the plans.
+        A max_size of None creates an unbounded cache and a max_size of 0 disables the caching.
+    """
+
+    domain: Domain
+    problem_objects: Optional[Dict[str, PDDLObject]]
+    max_size: Optional[int]
+    hits: int
+    misses: int
+    _operators: "OrderedDict[Tuple[str, Tuple[str, ...]], Operator]"
+    logger: logging.Logger
+
+    def __init__(
+        self,
+        domain: Domain,
+        problem_objects: Optional[Dict[str, PDDLObject]] = None,
+        max_size: Optional[int] = DEFAULT_OPERATOR_CACHE_SIZE,
+    ):
+        self.domain = domain
+        self.problem_objects = problem_objects
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._operators = OrderedDict()
+        self.logger = logging.getLogger(__name__)
+
+    def __len__(self) -> int:
+        return len(self._operators)
+
+    def __str__(self):
+        return f"OperatorCache(hits={self.hits}, misses={self.misses}, size={len(self)}, max_size={self.max_size})"
+
+    def get_operator(self, action_name: str, parameters: List[str]) -> Operator:
+        """Returns the operator of the grounded action, creating it if it is not in the cache.
+
+        :param action_name: the name of the action.
+        :param parameters: the objects that the action is called with.
+        :return: the operator of the grounded action.
+        """
+        cache_key = (action_name, tuple(parameters))
+        operator = self._operators.get(cache_key)
+        if operator is not None:
+            self.hits += 1
+            self._operators.move_to_end(cache_key)
+            return operator
+
+        self.misses += 1
+        operator = Operator(
+            action=self.domain.actions[action_name],
+            domain=self.domain,
+            grounded_action_call=list(parameters),
+            problem_objects=self.problem_objects,
+        )
+        if self.max_size == 0:
+            return operator
+
+        self._operators[cache_key] = operator
+        if self.max_size is not None and len(self._operators) > self.max_size:
+            evicted_key, _ = self._operators.popitem(last=False)
+            self.logger.debug("Evicted the operator of %s from the cache.", evicted_key)
+
+        return operator
+
+    def clear(self) -> None:
+        """Removes the cached operators and resets the hit and miss counters."""
+        self._operators.clear()
+        self.hits = 0
+        self.misses = 0
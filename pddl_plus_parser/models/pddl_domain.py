@@ -1,13 +1,13 @@
 """Module that represents a PDDL+ domain"""
 from collections import defaultdict
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Optional, Tuple
 
 from .numerical_expression import DEFAULT_DIGITS
 from .pddl_action import Action
 from .pddl_function import PDDLFunction
 from .pddl_object import PDDLConstant
 from .pddl_predicate import Predicate
-from .pddl_type import PDDLType, ObjectType
+from .pddl_type import PDDLType, ObjectType, TypeHierarchyIndex
 
 DEFAULT_TYPES = {"object": ObjectType}
 
@@ -22,6 +22,8 @@ class Domain:
     predicates: Dict[str, Predicate]
     functions: Dict[str, PDDLFunction]
     actions: Dict[str, Action]
+    # The type hierarchy index and the types it was built from (the types dictionary and its size).
+    _type_hierarchy_cache: Optional[Tuple[TypeHierarchyIndex, Dict[str, PDDLType], int]]
 
     # processes: Dict[str, Action] - TBD
     # events: Dict[str, Action] - TBD
@@ -33,6 +35,7 @@ class Domain:
         self.types = DEFAULT_TYPES
         self.predicates = {}
         self.requirements = set()
+        self._type_hierarchy_cache = None
 
     def __str__(self):
         return (
@@ -48,6 +51,21 @@ class Domain:
             )
         )
 
+    @property
+    def type_hierarchy(self) -> TypeHierarchyIndex:
+        """The index of the domain's type hierarchy used to check subtypes in constant time.
+
+        Note: the index is rebuilt when types are added or the types dictionary is replaced.
+
+        :return: the type hierarchy index.
+        """
+        cache = getattr(self, "_type_hierarchy_cache", None)
+        if cache is None or cache[1] is not self.types or cache[2] != len(self.types):
+            cache = (TypeHierarchyIndex(self.types), self.types, len(self.types))
+            self._type_hierarchy_cache = cache
+
+        return cache[0]
+
     def shallow_copy(self) -> "Domain":
         """Creates a shallow copy of the domain without the actions internal structure."""
         new_domain = Domain()
@@ -1,6 +1,6 @@
 """module to represent an operator that can apply actions and change state objects."""
 import logging
-from typing import List, Set, Dict, Optional
+from typing import List, Set, Dict, Optional, Iterator
 
 from .conditional_effect import UniversalEffect
 from .grounded_effect import GroundedEffect
@@ -98,37 +98,35 @@ class Operator:
 
         return effects
 
-    def _apply_universal_effects(
-        self, previous_state: State, current_state: State
-    ) -> None:
-        """Updates the state predicates based on the universal effects of the action.
+    def iter_grounded_universal_effects(self) -> Iterator[GroundedEffect]:
+        """Grounds the action's universal effects on every problem object of the quantified type.
 
-        :param previous_state: the state that the action is being applied on.
-        :param current_state: the state that will change according to the action's effects.
+        :return: an iterator over the grounded conditional effects of the universal effects.
         """
         if self.problem_objects is None:
             self.logger.debug(
-                "Did not receive the problem object so cannot apply the universal effects."
+                "Did not receive the problem object so cannot ground the universal effects."
             )
             return
 
         for pddl_object in self.problem_objects.values():
-            self.logger.debug(
-                f"Trying to apply the action's universal effects on the object: {pddl_object.name}"
-            )
+            self.logger.debug("Trying to ground the action's universal effects on the object: %s", pddl_object.name)
 
             for universal_effect in self.lifted_universal_effects:
-                self.logger.debug(
-                    "Updating the action's signature to temporarily include the quantified parameter."
-                )
-                self.action.signature[
-                    universal_effect.quantified_parameter
-                ] = universal_effect.quantified_type
                 if pddl_object.type.name != universal_effect.quantified_type.name:
                     continue
 
+                self.logger.debug("Trying to ground the universal effect on the object: %s", pddl_object)
+
                 self.logger.debug(
-                    f"Trying to apply the universal effect on the object: {str(pddl_object)}"
+                    "Creating a temporary action whose signature includes the quantified parameter."
+                )
+                extended_action = Action(
+                    name=self.action.name,
+                    signature={
+                        **self.action.signature,
+                        universal_effect.quantified_parameter: universal_effect.quantified_type,
+                    },
                 )
                 extended_parameter_map = {
                     lifted_param: grounded_object
@@ -145,21 +143,27 @@ class Operator:
                         lifted_discrete_effects=conditional_effect.discrete_effects,
                         lifted_numeric_effects=conditional_effect.numeric_effects,
                         domain=self.domain,
-                        action=self.action,
+                        action=extended_action,
                     )
                     grounded_conditional_effect.ground_conditional_effect(
                         extended_parameter_map
                     )
-                    if grounded_conditional_effect.antecedents_hold(previous_state):
-                        self.logger.debug(
-                            "The antecedents of the universal effect hold."
-                        )
-                        grounded_conditional_effect.apply(current_state)
+                    yield grounded_conditional_effect
 
+    def _apply_universal_effects(
+        self, previous_state: State, current_state: State
+    ) -> None:
+        """Updates the state predicates based on the universal effects of the action.
+
+        :param previous_state: the state that the action is being applied on.
+        :param current_state: the state that will change according to the action's effects.
+        """
+        for grounded_conditional_effect in self.iter_grounded_universal_effects():
+            if grounded_conditional_effect.antecedents_hold(previous_state):
                 self.logger.debug(
-                    "Removing the temporarily added signature item from the action."
+                    "The antecedents of the universal effect hold."
                 )
-                self.action.signature.pop(universal_effect.quantified_parameter)
+                grounded_conditional_effect.apply(current_state)
 
     def is_applicable(self, state: State) -> bool:
         """Checks if the action is applicable on the current state.
@@ -180,6 +184,9 @@ class Operator:
     ) -> State:
         """Applies an action on a state and changes the state according to the action's effects.
 
+        Note: the new state is a copy-on-write successor of the previous state and shares its unchanged facts and
+            fluents, use `State.copy` on the new state before changing its predicates or fluents directly.
+
         :param previous_state: the state in which the operator is being applied on.
         :param allow_inapplicable_actions: whether to allow inapplicable actions to be applied.
         :param skip_validation: whether to skip the validation of the action's applicability.
@@ -196,14 +203,14 @@ class Operator:
             if not allow_inapplicable_actions:
                 raise ValueError("Cannot apply an action when it is not applicable!")
 
-        self.logger.debug(
-            f"Applying the grounded action - {self.name} on the current state."
-        )
-        new_state = previous_state.copy()
+        self.logger.debug("Applying the grounded action - %s on the current state.", self.name)
+
+        new_state = previous_state.create_successor()
         new_state.is_init = False
 
         for effect in self.grounded_effects:
-            self.logger.debug(f"Applying the effect: {str(effect)}")
+            self.logger.debug("Applying the effect: %s", effect)
+
             if not not skip_validation and not effect.antecedents_hold(previous_state):
                 self.logger.debug(
                     "The antecedents for the effect do not hold so skipping the effect."
@@ -1,30 +1,148 @@
 """Module containing the classes representing the preconditions of a PDDL+ action."""
-from typing import Union, Set, Tuple, List, Dict
+from typing import Union, Set, Tuple, List, Dict, Hashable, Optional, FrozenSet, Iterable, AbstractSet
 
 from pddl_plus_parser.models.numeric_symbolic_operations import (
     simplify_inequality,
     simplify_equality,
 )
-from pddl_plus_parser.models.numerical_expression import NumericalExpressionTree
-from pddl_plus_parser.models.pddl_predicate import Predicate, GroundedPredicate
+from pddl_plus_parser.models.numerical_expression import NumericalExpressionTree, ExpressionKey
+from pddl_plus_parser.models.pddl_predicate import Predicate, GroundedPredicate, PredicateKey
 from pddl_plus_parser.models.pddl_type import PDDLType
 
 DEFAULT_DECIMAL_DIGITS = 2
 
+OperandKey = Union[PredicateKey, ExpressionKey]
+PreconditionKey = Tuple[Hashable, ...]
+
+
+class PreconditionOperands(set):
+    """Set of the operands of a precondition that tracks whether the precondition's index matches its content.
+
+    Note: every method that changes the set marks it as not indexed, so the precondition rebuilds its index after its
+        operands are changed directly instead of through the precondition's methods.
+    """
+
+    __slots__ = ("is_indexed",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.is_indexed = False
+
+    def _invalidate(self) -> None:
+        """Marks the set as changed since it was indexed."""
+        self.is_indexed = False
+
+    def add(self, operand: Hashable) -> None:
+        self._invalidate()
+        super().add(operand)
+
+    def discard(self, operand: Hashable) -> None:
+        self._invalidate()
+        super().discard(operand)
+
+    def remove(self, operand: Hashable) -> None:
+        self._invalidate()
+        super().remove(operand)
+
+    def pop(self) -> Hashable:
+        self._invalidate()
+        return super().pop()
+
+    def clear(self) -> None:
+        self._invalidate()
+        super().clear()
+
+    def update(self, *others: Iterable[Hashable]) -> None:
+        self._invalidate()
+        super().update(*others)
+
+    def difference_update(self, *others: Iterable[Hashable]) -> None:
+        self._invalidate()
+        super().difference_update(*others)
+
+    def intersection_update(self, *others: Iterable[Hashable]) -> None:
+        self._invalidate()
+        super().intersection_update(*others)
+
+    def symmetric_difference_update(self, other: Iterable[Hashable]) -> None:
+        self._invalidate()
+        super().symmetric_difference_update(other)
+
+    def __ior__(self, other: AbstractSet[Hashable]) -> "PreconditionOperands":
+        self._invalidate()
+        return super().__ior__(other)
+
+    def __iand__(self, other: AbstractSet[Hashable]) -> "PreconditionOperands":
+        self._invalidate()
+        return super().__iand__(other)
+
+    def __isub__(self, other: AbstractSet[Hashable]) -> "PreconditionOperands":
+        self._invalidate()
+        return super().__isub__(other)
+
+    def __ixor__(self, other: AbstractSet[Hashable]) -> "PreconditionOperands":
+        self._invalidate()
+        return super().__ixor__(other)
+
 
 class Precondition:
-    """class representing a single precondition in a PDDL+ action."""
+    """class representing a single precondition in a PDDL+ action.
+
+    Note: the predicates and numeric expressions of the precondition are indexed by their canonical keys, so adding,
+        removing and searching for them does not render the existing operands. The index is rebuilt lazily whenever
+        the operands are changed or replaced directly.
+    """
 
     binary_operator: str
-    operands: Set[Union["Precondition", Predicate, NumericalExpressionTree]]
     equality_preconditions: Set[Tuple[str, str]]
     inequality_preconditions: Set[Tuple[str, str]]
+    _operands: PreconditionOperands
+    _key_index: Dict[OperandKey, List[Union[Predicate, NumericalExpressionTree]]]
+    _nested_preconditions: List["Precondition"]
+    _operands_key: Optional[FrozenSet[OperandKey]]
 
     def __init__(self, binary_operator: str):
         self.binary_operator = binary_operator
         self.operands = set()
         self.equality_preconditions = set()
         self.inequality_preconditions = set()
+        self._key_index = {}
+        self._nested_preconditions = []
+        self._operands_key = None
+
+    @property
+    def operands(self) -> Set[Union["Precondition", Predicate, NumericalExpressionTree]]:
+        return self._operands
+
+    @operands.setter
+    def operands(self, operands: Iterable[Union["Precondition", Predicate, NumericalExpressionTree]]) -> None:
+        self._operands = PreconditionOperands(operands)
+
+    def _index_operands(self) -> None:
+        """Rebuilds the index of the operands if they were changed since they were last indexed."""
+        # Unpickled and copied sets do not restore their slots, so a missing flag means the index is not valid.
+        if getattr(self._operands, "is_indexed", False):
+            return
+
+        self._key_index = {}
+        self._nested_preconditions = []
+        self._operands_key = None
+        for operand in self._operands:
+            self._index_operand(operand)
+
+        self._operands.is_indexed = True
+
+    def _index_operand(self, operand: Union["Precondition", Predicate, NumericalExpressionTree]) -> None:
+        """Adds the operand to the index of the precondition.
+
+        :param operand: the operand to index.
+        """
+        if isinstance(operand, Precondition):
+            self._nested_preconditions.append(operand)
+
+        elif isinstance(operand, (Predicate, NumericalExpressionTree)):
+            self._key_index.setdefault(operand.key, []).append(operand)
+            self._operands_key = None
 
     def _print_self(self, decimal_digits: int = DEFAULT_DECIMAL_DIGITS) -> str:
         """Print the precondition in a human-readable format.
@@ -76,12 +194,12 @@ class Precondition:
             cond for cond in self.operands if isinstance(cond, Precondition)
         ]
         self_primitive_predicates = {
-            cond.untyped_representation
+            cond.key
             for cond in self.operands
             if isinstance(cond, Predicate)
         }
         self_primitive_numeric_conditions = {
-            cond.to_pddl()
+            cond.key
             for cond in self.operands
             if isinstance(cond, NumericalExpressionTree)
         }
@@ -90,12 +208,12 @@ class Precondition:
             cond for cond in other.operands if isinstance(cond, Precondition)
         ]
         other_primitive_predicates = {
-            cond.untyped_representation
+            cond.key
             for cond in other.operands
             if isinstance(cond, Predicate)
         }
         other_primitive_numeric_conditions = {
-            cond.to_pddl()
+            cond.key
             for cond in other.operands
             if isinstance(cond, NumericalExpressionTree)
         }
@@ -150,7 +268,62 @@ class Precondition:
         )
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        return hash(self.key)
+
+    @property
+    def key(self) -> PreconditionKey:
+        """Returns the canonical structural key of the precondition.
+
+        Note: the keys of the predicates and numeric expressions are cached until the operands change, while the keys
+            of the nested preconditions are collected on every call since they can be changed after being added.
+        """
+        self._index_operands()
+        if self._operands_key is None:
+            self._operands_key = frozenset(self._key_index)
+
+        return (
+            self.binary_operator,
+            self._operands_key,
+            frozenset(nested_precondition.key for nested_precondition in self._nested_preconditions),
+            frozenset(self.equality_preconditions),
+            frozenset(self.inequality_preconditions),
+        )
+
+    def _contains_key(self, operand_key: OperandKey) -> bool:
+        """Checks whether a predicate or a numeric expression with the key is part of the precondition.
+
+        :param operand_key: the key of the searched predicate or numeric expression.
+        :return: whether the precondition or one of its nested preconditions contains an operand with the key.
+        """
+        self._index_operands()
+        if operand_key in self._key_index:
+            return True
+
+        return any(nested_precondition._contains_key(operand_key) for nested_precondition in self._nested_preconditions)
+
+    def _contains_precondition(self, precondition_key: PreconditionKey) -> bool:
+        """Checks whether a nested precondition with the key is part of the precondition.
+
+        :param precondition_key: the key of the searched precondition.
+        :return: whether the precondition or one of its nested preconditions contains a precondition with the key.
+        """
+        self._index_operands()
+        return any(
+            nested_precondition.key == precondition_key or nested_precondition._contains_precondition(precondition_key)
+            for nested_precondition in self._nested_preconditions
+        )
+
+    def _has_nested_precondition(self, precondition_key: PreconditionKey) -> bool:
+        """Checks whether one of the direct operands of the precondition is a precondition with the key.
+
+        Note: preconditions nested deeper are not searched since their conditions might not be required, e.g., when
+            they are part of a disjunction.
+
+        :param precondition_key: the key of the searched precondition.
+        :return: whether the precondition directly contains a precondition with the key.
+        """
+        self._index_operands()
+        return any(nested_precondition.key == precondition_key for nested_precondition in self._nested_preconditions)
 
     def __contains__(
         self,
@@ -161,15 +334,69 @@ class Precondition:
         if len(self.operands) == 0:
             return False
 
-        if item in self.operands:
-            return True
+        if isinstance(item, (Predicate, NumericalExpressionTree)):
+            return self._contains_key(item.key)
 
-        for operand in self.operands:
+        if isinstance(item, Precondition):
+            return self._contains_precondition(item.key)
+
+        return item in self.operands
+
+    def _add_operand(self, operand: Union["Precondition", Predicate, NumericalExpressionTree]) -> None:
+        """Adds the operand to the operands and indexes it.
+
+        :param operand: the operand to add.
+        """
+        self._index_operands()
+        num_operands = len(self._operands)
+        self._operands.add(operand)
+        self._operands.is_indexed = True
+        if len(self._operands) > num_operands:
+            self._index_operand(operand)
+
+    def _discard_operand(
+        self,
+        operand: Union["Precondition", Predicate, NumericalExpressionTree],
+        operand_key: Optional[OperandKey] = None,
+    ) -> None:
+        """Removes the operand from the operands and from the index.
+
+        :param operand: the operand to remove.
+        :param operand_key: the key the predicate or numeric expression is indexed by, defaults to its current key.
+        """
+        self._index_operands()
+        self._operands.discard(operand)
+        self._operands.is_indexed = True
+        if isinstance(operand, Precondition):
+            self._nested_preconditions = [
+                nested_precondition
+                for nested_precondition in self._nested_preconditions
+                if nested_precondition is not operand
+            ]
+            return
+
+        operand_key = operand.key if operand_key is None else operand_key
+        indexed_operands = [indexed for indexed in self._key_index[operand_key] if indexed is not operand]
+        if len(indexed_operands) > 0:
+            self._key_index[operand_key] = indexed_operands
+
+        else:
+            del self._key_index[operand_key]
+
+        self._operands_key = None
+
+    def _reindex(self) -> None:
+        """Recreates the operands' set and index of the precondition and its nested preconditions.
+
+        Note: this is required after changing the operands in place since their hash and keys change.
+        """
+        operands = list(self._operands)
+        for operand in operands:
             if isinstance(operand, Precondition):
-                if item in operand:
-                    return True
+                operand._reindex()
 
-        return False
+        self.operands = operands
+        self._index_operands()
 
     def _unique_add_predicate(
         self, condition: Union[Predicate, GroundedPredicate]
@@ -178,13 +405,8 @@ class Precondition:
 
         :param condition: the condition to add.
         """
-        current_predicates = [
-            cond.untyped_representation
-            for _, cond in self.__iter__()
-            if isinstance(cond, Predicate)
-        ]
-        if condition.untyped_representation not in current_predicates:
-            self.operands.add(condition)
+        if not self._contains_key(condition.key):
+            self._add_operand(condition)
 
     def _unique_add_numeric_expression(
         self, condition: NumericalExpressionTree
@@ -193,13 +415,8 @@ class Precondition:
 
         :param condition: the condition to add.
         """
-        current_expressions = [
-            cond.to_pddl()
-            for _, cond in self.__iter__()
-            if isinstance(cond, NumericalExpressionTree)
-        ]
-        if condition.to_pddl() not in current_expressions:
-            self.operands.add(condition)
+        if not self._contains_key(condition.key):
+            self._add_operand(condition)
 
     @staticmethod
     def _simplify_numeric_preconditions(
@@ -267,26 +484,20 @@ class Precondition:
         """
         if isinstance(condition, (Predicate, GroundedPredicate)):
             if not check_duplications:
-                self.operands.add(condition)
+                self._add_operand(condition)
 
             else:
                 self._unique_add_predicate(condition)
 
         elif isinstance(condition, NumericalExpressionTree):
             if not check_duplications:
-                self.operands.add(condition)
+                self._add_operand(condition)
 
             else:
                 self._unique_add_numeric_expression(condition)
 
-        else:
-            current_compound_conditions = [
-                str(cond)
-                for _, cond in self.__iter__()
-                if isinstance(cond, Precondition)
-            ]
-            if str(condition) not in current_compound_conditions:
-                self.operands.add(condition)
+        elif not self._has_nested_precondition(condition.key):
+            self._add_operand(condition)
 
     @staticmethod
     def _remove_condition(
@@ -301,17 +512,27 @@ class Precondition:
         :param searched_condition: the precondition to search in.
         :return: True if the condition was removed, False otherwise.
         """
-        for operand in searched_condition.operands:
-            if (
-                isinstance(operand, type(condition_to_remove))
-                and operand == condition_to_remove
-            ):
-                searched_condition.operands.remove(operand)
+        searched_condition._index_operands()
+        if isinstance(condition_to_remove, Precondition):
+            operand_key = None
+            matching_operands = [
+                nested_precondition
+                for nested_precondition in searched_condition._nested_preconditions
+                if nested_precondition == condition_to_remove
+            ]
+
+        else:
+            operand_key = condition_to_remove.key
+            matching_operands = searched_condition._key_index.get(operand_key, [])
+
+        for operand in matching_operands:
+            if isinstance(operand, type(condition_to_remove)):
+                searched_condition._discard_operand(operand, operand_key)
                 return True
 
-            elif isinstance(operand, Precondition):
-                if Precondition._remove_condition(condition_to_remove, operand):
-                    return True
+        for nested_precondition in searched_condition._nested_preconditions:
+            if Precondition._remove_condition(condition_to_remove, nested_precondition):
+                return True
 
         return False
 
@@ -357,6 +578,7 @@ class Precondition:
             elif isinstance(condition, Precondition):
                 condition.change_signature(old_to_new_param_names)
 
+        self._reindex()
         new_equality_conditions = set()
         new_inequality_conditions = set()
         for equality_condition in self.equality_preconditions:
@@ -402,7 +624,12 @@ class UniversalPrecondition(Precondition):
         )
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        return hash(self.key)
+
+    @property
+    def key(self) -> PreconditionKey:
+        """Returns the canonical structural key of the universal precondition."""
+        return self.quantified_parameter, self.quantified_type.name, *super().key
 
     def __eq__(self, other: "UniversalPrecondition") -> bool:
         return (
@@ -1,9 +1,12 @@
 """Module that represents a boolean predicate in a PDDL+ model."""
-from typing import Dict, Optional, List
+from types import MappingProxyType
+from typing import Dict, Optional, List, Tuple, Mapping, Set, Iterable, AbstractSet
 
 from .pddl_type import PDDLType
 
 SignatureType = Dict[str, PDDLType]
+# The name, the untyped parameters (or the objects of grounded predicates) and the positivity of a predicate.
+PredicateKey = Tuple[str, Tuple[str, ...], bool]
 
 
 class Predicate:
@@ -30,6 +33,14 @@ class Predicate:
             self.signature = signature
             self.is_positive = is_positive
 
+    @property
+    def key(self) -> PredicateKey:
+        """Returns the canonical structural key of the predicate that matches its untyped representation.
+
+        Note: the key is computed on every call since the signature of a lifted predicate can be changed inline.
+        """
+        return self.name, tuple(self.signature), self.is_positive
+
     def __eq__(self, other: "Predicate") -> bool:
         """Checks whether two predicates are considered equal.
 
@@ -102,12 +113,30 @@ class Predicate:
         return hash(self.__str__())
 
 
+# The attributes that define the identity of a grounded predicate and thus its cached representations.
+GROUNDED_PREDICATE_KEY_ATTRIBUTES = {"name", "signature", "object_mapping", "is_positive"}
+# The mapping attributes of a grounded predicate that are stored as read-only views.
+GROUNDED_PREDICATE_MAPPING_ATTRIBUTES = {"signature", "object_mapping"}
+
+
 class GroundedPredicate(Predicate):
-    """Class defining a grounded predicate."""
+    """Class defining a grounded predicate.
 
-    object_mapping: Dict[str, str]
+    Note: grounded predicates are treated as immutable values, so their representations and hash are computed once
+        at construction. The signature and the object mapping are stored as read-only views over private copies, so
+        they cannot be changed inline. Assigning a new value to one of the identifying attributes recomputes them.
+    """
+
+    signature: Mapping[str, PDDLType]
+    object_mapping: Mapping[str, str]
     is_masked: bool
 
+    _untyped_representation: str
+    _lifted_untyped_representation: str
+    _typed_representation: str
+    _key: PredicateKey
+    _hash: int
+
     def __init__(
         self,
         name: str,
@@ -121,6 +150,41 @@ class GroundedPredicate(Predicate):
         )
         self.object_mapping = object_mapping
         self.is_masked = is_masked
+        self._cache_representations()
+
+    def __setattr__(self, key: str, value) -> None:
+        if key in GROUNDED_PREDICATE_MAPPING_ATTRIBUTES:
+            value = MappingProxyType(dict(value))
+
+        super(GroundedPredicate, self).__setattr__(key, value)
+        if key in GROUNDED_PREDICATE_KEY_ATTRIBUTES and "_hash" in self.__dict__:
+            self._cache_representations()
+
+    def __reduce__(self):
+        # The read-only views cannot be pickled, so the predicate is recreated from plain dictionaries.
+        return (
+            GroundedPredicate,
+            (self.name, dict(self.signature), dict(self.object_mapping), self.is_positive, self.is_masked),
+        )
+
+    def _cache_representations(self) -> None:
+        """Computes the string representations and the hash of the grounded predicate."""
+        untyped_grounded_signature_str = " ".join(self.object_mapping.values())
+        typed_signature_str = " ".join(
+            f"{self.object_mapping[parameter_name]} - {str(parameter_type)}"
+            for parameter_name, parameter_type in self.signature.items()
+        )
+        if self.is_positive:
+            self._untyped_representation = f"({self.name} {untyped_grounded_signature_str})"
+            self._typed_representation = f"({self.name} {typed_signature_str})"
+
+        else:
+            self._untyped_representation = f"(not ({self.name} {untyped_grounded_signature_str}))"
+            self._typed_representation = f"(not ({self.name} {typed_signature_str}))"
+
+        self._lifted_untyped_representation = super().untyped_representation
+        self._key = (self.name, tuple(self.object_mapping.values()), self.is_positive)
+        self._hash = hash(self._typed_representation)
 
     def __eq__(self, other: "GroundedPredicate") -> bool:
         """Checks whether or not two grounded predicates are considered equal.
@@ -130,6 +194,9 @@ class GroundedPredicate(Predicate):
         :param other: the other predicate to compare.
         :return: whether or not the predicates are equal.
         """
+        if self is other:
+            return True
+
         if not super(GroundedPredicate, self).__eq__(other):
             return False
 
@@ -151,12 +218,29 @@ class GroundedPredicate(Predicate):
             self.is_positive if not is_negated else not self.is_positive,
         )
 
+    def change_signature(self, old_to_new_param_names: Dict[str, str]) -> None:
+        """Performs inline changing of the predicate's signature.
+
+        :param old_to_new_param_names: the mapping of old parameter names to new parameter names.
+        """
+        # The signature is replaced without recomputing the representations since the object mapping still uses the
+        # old parameter names, the representations are recomputed once the object mapping is replaced as well.
+        self.__dict__["signature"] = MappingProxyType({
+            old_to_new_param_names[parameter_name]: parameter_type
+            for parameter_name, parameter_type in self.signature.items()
+        })
+        self.object_mapping = {
+            old_to_new_param_names[parameter_name]: object_name
+            for parameter_name, object_name in self.object_mapping.items()
+        }
+
+    @property
+    def key(self) -> PredicateKey:
+        return self._key
+
     @property
     def untyped_representation(self) -> str:
-        untyped_grounded_signature_str = " ".join(self.object_mapping.values())
-        if self.is_positive:
-            return f"({self.name} {untyped_grounded_signature_str})"
-        return f"(not ({self.name} {untyped_grounded_signature_str}))"
+        return self._untyped_representation
 
     @property
     def grounded_objects(self) -> List[str]:
@@ -168,20 +252,132 @@ class GroundedPredicate(Predicate):
 
     @property
     def lifted_untyped_representation(self) -> str:
-        return super().untyped_representation
+        return self._lifted_untyped_representation
 
     def __str__(self):
-        signature_str_items = []
-        for parameter_name, parameter_type in self.signature.items():
-            signature_str_items.append(
-                f"{self.object_mapping[parameter_name]} - {str(parameter_type)}"
+        return self._typed_representation
+
+    def __hash__(self):
+        return self._hash
+
+
+class GroundedPredicatePool:
+    """Interns grounded predicates so that every fact of a problem is represented by a single object.
+
+    Note: the interned predicates are shared between all the states using them. Their signature and object mapping
+        are read-only, so an interned predicate cannot be changed inline.
+    """
+
+    _grounded_predicates: Dict[Tuple, GroundedPredicate]
+
+    def __init__(self):
+        self._grounded_predicates = {}
+
+    def __len__(self) -> int:
+        return len(self._grounded_predicates)
+
+    def get_or_create(
+        self,
+        name: str,
+        signature: SignatureType,
+        object_mapping: Dict[str, str],
+        is_positive: bool = True,
+    ) -> GroundedPredicate:
+        """Returns the interned grounded predicate matching the input data and creates it if it does not exist yet.
+
+        :param name: the name of the predicate.
+        :param signature: the typed signature of the grounded predicate.
+        :param object_mapping: the mapping between the predicate's parameters and the grounded objects.
+        :param is_positive: whether the predicate is positive.
+        :return: the interned grounded predicate.
+        """
+        predicate_key = (
+            name,
+            is_positive,
+            tuple(object_mapping.items()),
+            tuple((parameter_name, parameter_type.name) for parameter_name, parameter_type in signature.items()),
+        )
+        grounded_predicate = self._grounded_predicates.get(predicate_key)
+        if grounded_predicate is None:
+            grounded_predicate = GroundedPredicate(
+                name=name, signature=signature, object_mapping=object_mapping, is_positive=is_positive
             )
+            self._grounded_predicates[predicate_key] = grounded_predicate
 
-        signature_str = " ".join(signature_str_items)
-        if self.is_positive:
-            return f"({self.name} {signature_str})"
+        return grounded_predicate
 
-        return f"(not ({self.name} {signature_str}))"
 
-    def __hash__(self):
-        return hash(self.__str__())
+class GroundedPredicateSet(set):
+    """Set of grounded predicates that indexes the untyped representations of its predicates.
+
+    Note: the index is computed lazily and is discarded by every method that changes the set, so searching for a fact
+        in the set never returns stale results.
+    """
+
+    __slots__ = ("_untyped_representations",)
+
+    @property
+    def untyped_representations(self) -> Set[str]:
+        """Returns the untyped representations of the grounded predicates in the set."""
+        untyped_representations = getattr(self, "_untyped_representations", None)
+        if untyped_representations is None:
+            untyped_representations = {predicate.untyped_representation for predicate in self}
+            self._untyped_representations = untyped_representations
+
+        return untyped_representations
+
+    def _invalidate(self) -> None:
+        """Discards the index of the untyped representations."""
+        self._untyped_representations = None
+
+    def add(self, predicate: GroundedPredicate) -> None:
+        self._invalidate()
+        super().add(predicate)
+
+    def discard(self, predicate: GroundedPredicate) -> None:
+        self._invalidate()
+        super().discard(predicate)
+
+    def remove(self, predicate: GroundedPredicate) -> None:
+        self._invalidate()
+        super().remove(predicate)
+
+    def pop(self) -> GroundedPredicate:
+        self._invalidate()
+        return super().pop()
+
+    def clear(self) -> None:
+        self._invalidate()
+        super().clear()
+
+    def update(self, *others: Iterable[GroundedPredicate]) -> None:
+        self._invalidate()
+        super().update(*others)
+
+    def difference_update(self, *others: Iterable[GroundedPredicate]) -> None:
+        self._invalidate()
+        super().difference_update(*others)
+
+    def intersection_update(self, *others: Iterable[GroundedPredicate]) -> None:
+        self._invalidate()
+        super().intersection_update(*others)
+
+    def symmetric_difference_update(self, other: Iterable[GroundedPredicate]) -> None:
+        self._invalidate()
+        super().symmetric_difference_update(other)
+
+    def __ior__(self, other: AbstractSet[GroundedPredicate]) -> "GroundedPredicateSet":
+        self._invalidate()
+        return super().__ior__(other)
+
+    def __iand__(self, other: AbstractSet[GroundedPredicate]) -> "GroundedPredicateSet":
+        self._invalidate()
+        return super().__iand__(other)
+
+    def __isub__(self, other: AbstractSet[GroundedPredicate]) -> "GroundedPredicateSet":
+        self._invalidate()
+        return super().__isub__(other)
+
+    def __ixor__(self, other: AbstractSet[GroundedPredicate]) -> "GroundedPredicateSet":
+        self._invalidate()
+        return super().__ixor__(other)
@@ -6,7 +6,7 @@ from .numerical_expression import NumericalExpressionTree
 from .pddl_domain import Domain
 from .pddl_function import PDDLFunction
 from .pddl_object import PDDLObject
-from .pddl_predicate import GroundedPredicate
+from .pddl_predicate import GroundedPredicate, GroundedPredicateSet
 
 METRICS = {"maximize": max, "minimize": min}
 
@@ -30,7 +30,7 @@ class Problem:
         self.name = ""
         self.domain = domain
         self.objects = {}
-        self.initial_state_predicates = defaultdict(set)
+        self.initial_state_predicates = defaultdict(GroundedPredicateSet)
         self.initial_state_fluents = {}
         self.goal_state_predicates = []
         self.goal_state_fluents = set()
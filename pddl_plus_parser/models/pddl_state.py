@@ -1,13 +1,12 @@
 """Module that represents a state definition in a PDDL trajectory."""
 
-from typing import Dict, Set
-
-from anytree import AnyNode
+from typing import Dict, Set, Optional
 
+from .expression_node import ExpressionNode
 from .numerical_expression import NumericalExpressionTree
 from .pddl_function import PDDLFunction
 from .pddl_object import PDDLObject
-from .pddl_predicate import GroundedPredicate
+from .pddl_predicate import GroundedPredicate, GroundedPredicateSet
 
 
 class State:
@@ -18,6 +17,8 @@ class State:
     state_predicates: Dict[str, Set[GroundedPredicate]]
     # Map between the grounded numeric fluent string to the actual function.
     state_fluents: Dict[str, PDDLFunction]
+    # The lifted predicates whose groundings are not shared with other states, None if none of them are shared.
+    _owned_predicates: Optional[Set[str]]
 
     def __init__(
         self,
@@ -28,6 +29,7 @@ class State:
         self.state_predicates = predicates
         self.state_fluents = fluents
         self.is_init = is_init
+        self._owned_predicates = None
 
     def __eq__(self, other: "State") -> bool:
         my_predicates = {
@@ -48,6 +50,49 @@ class State:
 
         return my_numeric_expressions == other_numeric_expressions
 
+    def get_mutable_groundings(self, lifted_predicate_str: str) -> Set[GroundedPredicate]:
+        """Returns the groundings of a lifted predicate in a set that can be changed without affecting other states.
+
+        Note: if the groundings are shared with a successor or a predecessor state, they are copied first.
+
+        :param lifted_predicate_str: the untyped representation of the lifted predicate.
+        :return: the set of the predicate's groundings owned by the state.
+        """
+        grounded_predicates = self.state_predicates.get(lifted_predicate_str)
+        if grounded_predicates is None:
+            grounded_predicates = GroundedPredicateSet()
+            self.state_predicates[lifted_predicate_str] = grounded_predicates
+
+        elif self._owned_predicates is not None and lifted_predicate_str not in self._owned_predicates:
+            grounded_predicates = GroundedPredicateSet(grounded_predicates)
+            self.state_predicates[lifted_predicate_str] = grounded_predicates
+
+        if self._owned_predicates is not None:
+            self._owned_predicates.add(lifted_predicate_str)
+
+        return grounded_predicates
+
+    def holds(self, predicate: GroundedPredicate) -> bool:
+        """Checks whether the positive grounded fact holds in the state.
+
+        Note: groundings stored in a `GroundedPredicateSet` are searched using the set's index, other sets are scanned.
+
+        :param predicate: the positive grounded predicate to search for.
+        :return: whether the fact is one of the state's facts.
+        """
+        grounded_predicates = self.state_predicates.get(predicate.lifted_untyped_representation)
+        if not grounded_predicates:
+            return False
+
+        fact_representation = predicate.untyped_representation
+        if isinstance(grounded_predicates, GroundedPredicateSet):
+            return fact_representation in grounded_predicates.untyped_representations
+
+        return any(
+            grounded_predicate.untyped_representation == fact_representation
+            for grounded_predicate in grounded_predicates
+        )
+
     def _serialize_numeric_fluents(self) -> str:
         """Serialize the numeric fluents of the state.
 
@@ -104,6 +149,43 @@ class State:
             f"{self._serialize_predicates()})\n"
         )
 
+    def serialize_delta(self, previous_state: "State") -> str:
+        """Serializes only the facts and fluents that changed between the previous state and this state.
+
+        Note: groundings sets and fluents that are shared with the previous state, e.g., in successor states created
+            by applying operators, are skipped without comparing their content. Fluents are never removed from states
+            so only their assignments are serialized.
+
+        :param previous_state: the state that preceded this state in the trajectory.
+        :return: the string representation of the added facts, the deleted facts and the changed fluents.
+        """
+        added_facts = []
+        deleted_facts = []
+        for lifted_predicate_str in {**previous_state.state_predicates, **self.state_predicates}:
+            previous_predicates = previous_state.state_predicates.get(lifted_predicate_str, set())
+            next_predicates = self.state_predicates.get(lifted_predicate_str, set())
+            if previous_predicates is next_predicates:
+                continue
+
+            previous_facts = {predicate.untyped_representation for predicate in previous_predicates}
+            next_facts = {predicate.untyped_representation for predicate in next_predicates}
+            added_facts.extend(next_facts - previous_facts)
+            deleted_facts.extend(previous_facts - next_facts)
+
+        changed_fluents = []
+        for fluent_name, fluent in self.state_fluents.items():
+            previous_fluent = previous_state.state_fluents.get(fluent_name)
+            if previous_fluent is fluent:
+                continue
+
+            if previous_fluent is None or previous_fluent.state_representation != fluent.state_representation:
+                changed_fluents.append(fluent.state_representation)
+
+        return (
+            f"(:delta (:add {' '.join(sorted(added_facts))}) (:delete {' '.join(sorted(deleted_facts))})"
+            f" (:fluents {' '.join(changed_fluents)}))\n"
+        )
+
     def convert_fluents_to_numeric_conditions(self) -> Set[NumericalExpressionTree]:
         """Converts the numeric fluents to numerical conditions.
 
@@ -111,17 +193,38 @@ class State:
         """
         conditions = set()
         for fluent in self.state_fluents.values():
-            left_child = AnyNode(id=str(fluent), value=fluent)
-            right_child = AnyNode(id=str(fluent.value), value=fluent.value)
-            root_node = AnyNode(id="=", value="=", children=[left_child, right_child])
+            left_child = ExpressionNode(id=str(fluent), value=fluent)
+            right_child = ExpressionNode(id=str(fluent.value), value=fluent.value)
+            root_node = ExpressionNode(id="=", value="=", children=[left_child, right_child])
             conditions.add(NumericalExpressionTree(root_node))
 
         return conditions
 
+    def create_successor(self) -> "State":
+        """Creates a copy-on-write successor of the state.
+
+        Note: the successor shares the sets of groundings and the numeric fluents with this state. A shared set is
+            copied only when one of the states changes it using `get_mutable_groundings` and numeric effects replace
+            the assigned fluents instead of changing them. Thus, creating a successor and applying an action on it
+            costs time proportional to the action's effects and not to the size of the state.
+            Use `copy` to create a state that can be changed directly.
+
+        :return: the successor state.
+        """
+        # The sets are now shared so this state must copy them before changing them as well.
+        self._owned_predicates = set()
+        successor = State(dict(self.state_predicates), dict(self.state_fluents), is_init=self.is_init)
+        successor._owned_predicates = set()
+        return successor
+
     def copy(self) -> "State":
-        """Creates a copy of the state."""
+        """Creates a copy of the state.
+
+        Note: the grounded predicates are immutable, so the copy shares them with the original state and only the sets
+            containing them are copied.
+        """
         copied_predicates = {
-            predicate_name: {predicate.copy() for predicate in predicates}
+            predicate_name: GroundedPredicateSet(predicates)
             for predicate_name, predicates in self.state_predicates.items()
         }
         copied_fluents = {fluent_name: fluent.copy() for fluent_name, fluent in self.state_fluents.items()}
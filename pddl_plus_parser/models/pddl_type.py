@@ -1,6 +1,7 @@
 """Module that contains the definition of PDDL+ types"""
 
-from typing import Optional, Dict
+from collections import defaultdict
+from typing import Optional, Dict, FrozenSet, Iterable, List, Union, Any
 
 import networkx as nx
 
@@ -75,3 +76,77 @@ def create_type_hierarchy_graph(types: Dict[str, PDDLType]) -> nx.DiGraph:
             hierarchy_graph.add_edge(pddl_type.parent.name, type_name)
 
     return hierarchy_graph
+
+
+class TypeHierarchyIndex:
+    """Precomputed index of a type hierarchy that answers subtype queries in constant time.
+
+    Note: the index is keyed by the types' names, types that are not part of the indexed hierarchy are checked
+        by walking their parent chain.
+    """
+
+    ancestors: Dict[str, FrozenSet[str]]
+    descendants: Dict[str, FrozenSet[str]]
+
+    def __init__(self, types: Dict[str, PDDLType]):
+        hierarchy_graph = create_type_hierarchy_graph(types)
+        self.ancestors = {}
+        descendants = defaultdict(set)
+        root_types = [type_name for type_name in hierarchy_graph.nodes if hierarchy_graph.in_degree(type_name) == 0]
+        types_to_visit = [(type_name, frozenset([type_name])) for type_name in root_types]
+        while len(types_to_visit) > 0:
+            type_name, type_ancestors = types_to_visit.pop()
+            self.ancestors[type_name] = type_ancestors
+            for ancestor_name in type_ancestors:
+                descendants[ancestor_name].add(type_name)
+
+            for child_name in hierarchy_graph.successors(type_name):
+                types_to_visit.append((child_name, type_ancestors | {child_name}))
+
+        self.descendants = {
+            type_name: frozenset(type_descendants) for type_name, type_descendants in descendants.items()
+        }
+
+    def is_sub_type(self, my_type: PDDLType, other_type: PDDLType) -> bool:
+        """Checks if a type is a subtype of the other.
+
+        :param my_type: the type that is checked to see if it is a subtype of the other.
+        :param other_type: the type that is checked to see if the first is a subtype of.
+        :return: whether the first is a subtype of the other.
+        """
+        type_ancestors = self.ancestors.get(my_type.name)
+        if type_ancestors is None:
+            return my_type.is_sub_type(other_type)
+
+        return other_type.name in type_ancestors
+
+    def get_sub_types(self, pddl_type: Union[PDDLType, str]) -> FrozenSet[str]:
+        """Returns the names of the types that are subtypes of the input type (including the type itself).
+
+        :param pddl_type: the type or the name of the type.
+        :return: the names of the subtypes.
+        """
+        type_name = pddl_type if isinstance(pddl_type, str) else pddl_type.name
+        return self.descendants.get(type_name, frozenset([type_name]))
+
+    def group_objects_by_type(self, objects: Iterable[Any]) -> Dict[str, List[Any]]:
+        """Groups objects by every type that they are instances of, i.e., their types and their ancestors.
+
+        :param objects: the objects or constants to group, each object should have a type attribute.
+        :return: mapping between the type names and the objects that can be assigned to parameters of that type.
+        """
+        objects_by_type = defaultdict(list)
+        for pddl_object in objects:
+            object_type = pddl_object.type
+            type_ancestors = self.ancestors.get(object_type.name)
+            if type_ancestors is None:
+                type_ancestors = []
+                ancestor_type = object_type
+                while ancestor_type is not None:
+                    type_ancestors.append(ancestor_type.name)
+                    ancestor_type = ancestor_type.parent
+
+            for ancestor_name in type_ancestors:
+                objects_by_type[ancestor_name].append(pddl_object)
+
+        return dict(objects_by_type)
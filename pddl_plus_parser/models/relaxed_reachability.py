@@ -0,0 +1,525 @@
+"""Module that prunes grounded actions that are unreachable using a delete-relaxation reachability analysis."""
+import logging
+import math
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from anytree import AnyNode
+
+from .action_call import ActionCall
+from .grounded_effect import GroundedEffect
+from .grounded_precondition import GroundedPrecondition
+from .numerical_expression import EPSILON, NumericalExpressionTree, COMPARISON_OPERATORS
+from .pddl_domain import Domain
+from .pddl_function import PDDLFunction
+from .pddl_operator import Operator
+from .pddl_precondition import Precondition, UniversalPrecondition
+from .pddl_predicate import GroundedPredicate
+from .pddl_problem import Problem
+
+Interval = Tuple[float, float]
+
+UNBOUNDED_INTERVAL = (-math.inf, math.inf)
+# The number of times an assigned fluent's interval can grow before its changing bounds are widened to infinity.
+MAX_ASSIGNMENT_UPDATES = 3
+
+
+def _bounded_interval(lower_bound: float, upper_bound: float) -> Interval:
+    """Creates an interval while treating undefined bounds (e.g., inf - inf) as unbounded."""
+    if math.isnan(lower_bound) or math.isnan(upper_bound):
+        return UNBOUNDED_INTERVAL
+
+    return lower_bound, upper_bound
+
+
+def _multiply_intervals(left: Interval, right: Interval) -> Interval:
+    products = [left_bound * right_bound for left_bound in left for right_bound in right]
+    if any(math.isnan(product) for product in products):
+        return UNBOUNDED_INTERVAL
+
+    return min(products), max(products)
+
+
+def _divide_intervals(left: Interval, right: Interval) -> Interval:
+    if right[0] <= 0 <= right[1]:
+        return UNBOUNDED_INTERVAL
+
+    return _multiply_intervals(left, (1 / right[1], 1 / right[0]))
+
+
+INTERVAL_BINARY_OPERATORS = {
+    "+": lambda left, right: _bounded_interval(left[0] + right[0], left[1] + right[1]),
+    "-": lambda left, right: _bounded_interval(left[0] - right[1], left[1] - right[0]),
+    "*": _multiply_intervals,
+    "/": _divide_intervals,
+}
+
+INTERVAL_ASSIGNMENT_OPERATORS = {
+    "increase": INTERVAL_BINARY_OPERATORS["+"],
+    "decrease": INTERVAL_BINARY_OPERATORS["-"],
+    "scale-up": _multiply_intervals,
+    "scale-down": _divide_intervals,
+    "assign": lambda _, assigned_value: assigned_value,
+}
+
+INTERVAL_COMPARISON_OPERATORS = {
+    ">=": lambda left, right: left[1] >= right[0] - EPSILON,
+    ">": lambda left, right: left[1] > right[0],
+    "<=": lambda left, right: left[0] <= right[1] + EPSILON,
+    "<": lambda left, right: left[0] < right[1],
+    "=": lambda left, right: left[0] <= right[1] + EPSILON and right[0] <= left[1] + EPSILON,
+    "!=": lambda left, right: not (left[0] == left[1] == right[0] == right[1]),
+}
+
+
+def calculate_interval(expression_node: AnyNode, fluent_intervals: Dict[str, Interval]) -> Optional[Interval]:
+    """Calculates the interval of values that a numeric calculation can have given the intervals of the fluents.
+
+    :param expression_node: the root of the calculation tree.
+    :param fluent_intervals: mapping between the fluents' untyped representation and their possible values.
+    :return: the interval of the calculation's values or None if some of the fluents are not defined.
+    """
+    if expression_node.is_leaf:
+        if isinstance(expression_node.value, PDDLFunction):
+            return fluent_intervals.get(expression_node.value.untyped_representation)
+
+        return float(expression_node.value), float(expression_node.value)
+
+    left_interval = calculate_interval(expression_node.children[0], fluent_intervals)
+    right_interval = calculate_interval(expression_node.children[1], fluent_intervals)
+    if left_interval is None or right_interval is None:
+        return None
+
+    return INTERVAL_BINARY_OPERATORS[expression_node.value](left_interval, right_interval)
+
+
+def _iter_fluent_names(expression_node: AnyNode) -> Iterator[str]:
+    """Iterates over the untyped representations of the fluents in a calculation tree.
+
+    :param expression_node: the root of the calculation tree.
+    :return: an iterator over the names of the fluents.
+    """
+    if expression_node.is_leaf:
+        if isinstance(expression_node.value, PDDLFunction):
+            yield expression_node.value.untyped_representation
+
+        return
+
+    for child in expression_node.children:
+        yield from _iter_fluent_names(child)
+
+
+GroundedCondition = Union[GroundedPredicate, NumericalExpressionTree, Precondition]
+
+
+class _PendingAction:
+    """A grounded action call together with the number of its preconditions that cannot hold yet."""
+
+    action_call: ActionCall
+    index: int
+    num_unsatisfied_conditions: int
+
+    def __init__(self, action_call: ActionCall, index: int):
+        self.action_call = action_call
+        self.index = index
+        self.num_unsatisfied_conditions = 0
+
+
+class _PendingCondition:
+    """A grounded condition that cannot hold yet together with the action or the effect that depends on it."""
+
+    condition: GroundedCondition
+    dependent: Union[_PendingAction, GroundedEffect]
+    is_satisfied: bool
+
+    def __init__(self, condition: GroundedCondition, dependent: Union[_PendingAction, GroundedEffect]):
+        self.condition = condition
+        self.dependent = dependent
+        self.is_satisfied = False
+
+
+class RelaxedReachabilityAnalysis:
+    """Computes the grounded actions that are reachable from the initial state when ignoring the delete effects.
+
+    Note: numeric fluents are over-approximated by intervals of their possible values. Actions that can be applied
+        repeatedly to increase or decrease a fluent widen its interval to infinity. Negative preconditions are assumed
+        to be achievable. Hence, the analysis only removes actions that can never be applied.
+        Every condition that cannot hold yet is indexed by the facts and the fluents it depends on, so it is checked
+        again only when one of them changes. An action becomes reachable once all of its conditions hold.
+    """
+
+    domain: Domain
+    problem: Problem
+    reachable_facts: Set[str]
+    fluent_intervals: Dict[str, Interval]
+    _num_assignment_updates: Dict[str, int]
+    _fact_watchers: Dict[str, List[_PendingCondition]]
+    _fluent_watchers: Dict[str, List[_PendingCondition]]
+    _numeric_effect_watchers: Dict[str, List[NumericalExpressionTree]]
+    _reached_facts: Deque[str]
+    _changed_fluents: Deque[str]
+    _reachable_action_calls: List[Tuple[int, ActionCall]]
+    logger: logging.Logger
+
+    def __init__(self, domain: Domain, problem: Problem):
+        self.domain = domain
+        self.problem = problem
+        self.reachable_facts = {
+            predicate.untyped_representation
+            for predicates in problem.initial_state_predicates.values()
+            for predicate in predicates
+        }
+        self.fluent_intervals = {
+            fluent_name: (fluent.value, fluent.value) for fluent_name, fluent in problem.initial_state_fluents.items()
+        }
+        self._num_assignment_updates = {}
+        self._clear_pending_state()
+        self.logger = logging.getLogger(__name__)
+
+    def _clear_pending_state(self) -> None:
+        """Discards the conditions and the effects waiting for changes and the action calls found reachable."""
+        self._fact_watchers = {}
+        self._fluent_watchers = {}
+        self._numeric_effect_watchers = {}
+        self._reached_facts = deque()
+        self._changed_fluents = deque()
+        self._reachable_action_calls = []
+
+    def _numeric_condition_relaxed_holds(self, condition: NumericalExpressionTree) -> bool:
+        """Checks whether a numeric condition can hold given the intervals of the fluents.
+
+        :param condition: the grounded numeric condition.
+        :return: whether the condition can hold.
+        """
+        if condition.root.value not in COMPARISON_OPERATORS:
+            return True
+
+        left_interval = calculate_interval(condition.root.children[0], self.fluent_intervals)
+        right_interval = calculate_interval(condition.root.children[1], self.fluent_intervals)
+        if left_interval is None or right_interval is None:
+            return False
+
+        return INTERVAL_COMPARISON_OPERATORS[condition.root.value](left_interval, right_interval)
+
+    @staticmethod
+    def _equality_holds(precondition: Precondition) -> bool:
+        """Checks whether the grounded equality and inequality conditions of the precondition hold.
+
+        :param precondition: the grounded condition.
+        :return: whether all the equality and inequality conditions hold.
+        """
+        return all(obj1 == obj2 for obj1, obj2 in precondition.equality_preconditions) and all(
+            obj1 != obj2 for obj1, obj2 in precondition.inequality_preconditions
+        )
+
+    def _operand_relaxed_holds(self, condition: GroundedCondition) -> bool:
+        """Checks whether a single operand of a grounded condition holds in the relaxed reachable state.
+
+        :param condition: the grounded predicate, numeric condition or nested condition.
+        :return: whether the operand can hold.
+        """
+        if isinstance(condition, GroundedPredicate):
+            return not condition.is_positive or condition.untyped_representation in self.reachable_facts
+
+        if isinstance(condition, NumericalExpressionTree):
+            return self._numeric_condition_relaxed_holds(condition)
+
+        if isinstance(condition, Precondition) and not isinstance(condition, UniversalPrecondition):
+            return self._condition_relaxed_holds(condition)
+
+        return True
+
+    def _condition_relaxed_holds(self, precondition: Precondition) -> bool:
+        """Checks whether the grounded condition holds in the relaxed reachable state.
+
+        :param precondition: the grounded condition.
+        :return: whether the condition can hold.
+        """
+        if precondition.binary_operator not in ["and", "or"]:
+            return True
+
+        equality_holds = self._equality_holds(precondition)
+        if precondition.binary_operator == "or" and equality_holds:
+            return True
+
+        if precondition.binary_operator == "and" and not equality_holds:
+            return False
+
+        for condition in precondition.operands:
+            condition_holds = self._operand_relaxed_holds(condition)
+            if precondition.binary_operator == "and" and not condition_holds:
+                return False
+
+            if precondition.binary_operator == "or" and condition_holds:
+                return True
+
+        return precondition.binary_operator == "and"
+
+    def _update_fluent_interval(self, numeric_effect: NumericalExpressionTree) -> bool:
+        """Extends the interval of the assigned fluent with the values that the numeric effect can assign.
+
+        :param numeric_effect: the grounded numeric effect.
+        :return: whether the interval of the fluent changed.
+        """
+        assignment_operator = numeric_effect.root.value
+        fluent_name = numeric_effect.root.children[0].value.untyped_representation
+        current_interval = self.fluent_intervals.get(fluent_name)
+        value_interval = calculate_interval(numeric_effect.root.children[1], self.fluent_intervals)
+        if value_interval is None or (current_interval is None and assignment_operator != "assign"):
+            return False
+
+        assigned_interval = INTERVAL_ASSIGNMENT_OPERATORS[assignment_operator](current_interval, value_interval)
+        if current_interval is None:
+            self.fluent_intervals[fluent_name] = assigned_interval
+            return True
+
+        lower_bound = min(current_interval[0], assigned_interval[0])
+        upper_bound = max(current_interval[1], assigned_interval[1])
+        if (lower_bound, upper_bound) == current_interval:
+            return False
+
+        self._num_assignment_updates[fluent_name] = self._num_assignment_updates.get(fluent_name, 0) + 1
+        if assignment_operator != "assign" or self._num_assignment_updates[fluent_name] > MAX_ASSIGNMENT_UPDATES:
+            # The effect can be applied repeatedly so the changing bounds are not bounded.
+            lower_bound = -math.inf if lower_bound < current_interval[0] else lower_bound
+            upper_bound = math.inf if upper_bound > current_interval[1] else upper_bound
+
+        self.fluent_intervals[fluent_name] = (lower_bound, upper_bound)
+        return True
+
+    def _get_dependencies(self, condition: GroundedCondition) -> Tuple[Set[str], Set[str]]:
+        """Returns the facts that are not reachable yet and the fluents that the grounded condition depends on.
+
+        :param condition: the grounded condition.
+        :return: the names of the unreached facts and the names of the fluents in the condition.
+        """
+        facts, fluents = set(), set()
+        conditions = [condition]
+        while len(conditions) > 0:
+            current_condition = conditions.pop()
+            if isinstance(current_condition, GroundedPredicate):
+                if current_condition.is_positive:
+                    facts.add(current_condition.untyped_representation)
+
+            elif isinstance(current_condition, NumericalExpressionTree):
+                fluents.update(_iter_fluent_names(current_condition.root))
+
+            elif isinstance(current_condition, Precondition) and not isinstance(
+                current_condition, UniversalPrecondition
+            ):
+                conditions.extend(current_condition.operands)
+
+        return facts - self.reachable_facts, fluents
+
+    def _watch_condition(self, pending_condition: _PendingCondition, facts: Set[str], fluents: Set[str]) -> None:
+        """Indexes the pending condition so it is checked again when one of its facts or fluents changes.
+
+        :param pending_condition: the condition that cannot hold yet.
+        :param facts: the unreached facts that the condition depends on.
+        :param fluents: the fluents that the condition depends on.
+        """
+        for fact in facts:
+            self._fact_watchers.setdefault(fact, []).append(pending_condition)
+
+        for fluent_name in fluents:
+            self._fluent_watchers.setdefault(fluent_name, []).append(pending_condition)
+
+    def _reach_fact(self, fact: str) -> None:
+        """Adds the fact to the reachable facts and schedules the conditions depending on it to be checked.
+
+        :param fact: the untyped representation of the positive grounded fact.
+        """
+        if fact in self.reachable_facts:
+            return
+
+        self.reachable_facts.add(fact)
+        self._reached_facts.append(fact)
+
+    def _apply_numeric_effect(self, numeric_effect: NumericalExpressionTree) -> None:
+        """Applies the numeric effect and schedules the conditions and effects depending on the fluent if it changed.
+
+        :param numeric_effect: the grounded numeric effect.
+        """
+        if self._update_fluent_interval(numeric_effect):
+            self._changed_fluents.append(numeric_effect.root.children[0].value.untyped_representation)
+
+    def _apply_relaxed_effect(self, effect: GroundedEffect) -> None:
+        """Applies the add effects and the numeric effects of a grounded effect whose antecedents hold.
+
+        Note: the numeric effects are applied again whenever the intervals of the fluents they use change.
+
+        :param effect: the grounded effect.
+        """
+        for predicate in effect.grounded_discrete_effects:
+            if predicate.is_positive:
+                self._reach_fact(predicate.untyped_representation)
+
+        for numeric_effect in effect.grounded_numeric_effects:
+            used_fluents = set(_iter_fluent_names(numeric_effect.root.children[1]))
+            if numeric_effect.root.value != "assign":
+                used_fluents.add(numeric_effect.root.children[0].value.untyped_representation)
+
+            for fluent_name in used_fluents:
+                self._numeric_effect_watchers.setdefault(fluent_name, []).append(numeric_effect)
+
+            self._apply_numeric_effect(numeric_effect)
+
+    def _activate_effect(self, effect: GroundedEffect) -> None:
+        """Applies the grounded effect if its antecedents hold and otherwise waits until they can hold.
+
+        :param effect: the grounded effect of a reachable action.
+        """
+        if effect.grounded_antecedents is None:
+            self._apply_relaxed_effect(effect)
+            return
+
+        antecedents = effect.grounded_antecedents.grounded_condition
+        if self._condition_relaxed_holds(antecedents):
+            self._apply_relaxed_effect(effect)
+            return
+
+        facts, fluents = self._get_dependencies(antecedents)
+        self._watch_condition(_PendingCondition(antecedents, effect), facts, fluents)
+
+    def _activate_action(self, pending_action: _PendingAction) -> None:
+        """Marks the action call as reachable and activates its effects.
+
+        :param pending_action: the action call whose conditions all hold.
+        """
+        self.logger.debug("The action %s is relaxed reachable.", pending_action.action_call)
+        self._reachable_action_calls.append((pending_action.index, pending_action.action_call))
+        for effect in self._ground_effects(pending_action.action_call):
+            self._activate_effect(effect)
+
+    def _add_action_call(self, action_call: ActionCall, index: int) -> None:
+        """Grounds the preconditions of the action call and indexes the conditions that cannot hold yet.
+
+        Note: action calls with conditions that do not depend on any unreached fact or fluent can never be applied,
+            so they are discarded without being indexed.
+
+        :param action_call: the action call to add.
+        :param index: the position of the action call in the input action calls.
+        """
+        grounded_condition = self._ground_preconditions(action_call).grounded_condition
+        if grounded_condition.binary_operator != "and":
+            conditions = [grounded_condition]
+
+        elif not self._equality_holds(grounded_condition):
+            return
+
+        else:
+            conditions = grounded_condition.operands
+
+        unsatisfied_conditions = []
+        for condition in conditions:
+            if self._operand_relaxed_holds(condition):
+                continue
+
+            facts, fluents = self._get_dependencies(condition)
+            if len(facts) == 0 and len(fluents) == 0:
+                return
+
+            unsatisfied_conditions.append((condition, facts, fluents))
+
+        pending_action = _PendingAction(action_call, index)
+        if len(unsatisfied_conditions) == 0:
+            self._activate_action(pending_action)
+            return
+
+        pending_action.num_unsatisfied_conditions = len(unsatisfied_conditions)
+        for condition, facts, fluents in unsatisfied_conditions:
+            self._watch_condition(_PendingCondition(condition, pending_action), facts, fluents)
+
+    def _check_pending_condition(self, pending_condition: _PendingCondition) -> None:
+        """Checks whether the pending condition holds and updates the action or the effect depending on it.
+
+        :param pending_condition: the condition whose facts or fluents changed.
+        """
+        if pending_condition.is_satisfied or not self._operand_relaxed_holds(pending_condition.condition):
+            return
+
+        pending_condition.is_satisfied = True
+        dependent = pending_condition.dependent
+        if isinstance(dependent, GroundedEffect):
+            self._apply_relaxed_effect(dependent)
+            return
+
+        dependent.num_unsatisfied_conditions -= 1
+        if dependent.num_unsatisfied_conditions == 0:
+            self._activate_action(dependent)
+
+    def _propagate_changes(self) -> None:
+        """Checks the conditions and applies the numeric effects depending on the facts and fluents that changed."""
+        while len(self._reached_facts) > 0 or len(self._changed_fluents) > 0:
+            if len(self._reached_facts) > 0:
+                # A reached fact never changes again, so the conditions waiting for it are checked once.
+                for pending_condition in self._fact_watchers.pop(self._reached_facts.popleft(), []):
+                    self._check_pending_condition(pending_condition)
+
+                continue
+
+            fluent_name = self._changed_fluents.popleft()
+            for pending_condition in list(self._fluent_watchers.get(fluent_name, [])):
+                self._check_pending_condition(pending_condition)
+
+            if fluent_name in self._fluent_watchers:
+                self._fluent_watchers[fluent_name] = [
+                    pending_condition
+                    for pending_condition in self._fluent_watchers[fluent_name]
+                    if not pending_condition.is_satisfied
+                ]
+
+            for numeric_effect in list(self._numeric_effect_watchers.get(fluent_name, [])):
+                self._apply_numeric_effect(numeric_effect)
+
+    def _ground_preconditions(self, action_call: ActionCall) -> GroundedPrecondition:
+        """Grounds the preconditions of the action call.
+
+        :param action_call: the action call to ground.
+        :return: the grounded preconditions.
+        """
+        action = self.domain.actions[action_call.name]
+        grounded_preconditions = GroundedPrecondition(
+            lifted_precondition=action.preconditions, domain=self.domain, action=action
+        )
+        grounded_preconditions.ground_preconditions(dict(zip(action.signature, action_call.parameters)))
+        return grounded_preconditions
+
+    def _ground_effects(self, action_call: ActionCall) -> List[GroundedEffect]:
+        """Grounds the effects of the action call, including its universal effects.
+
+        :param action_call: the action call to ground.
+        :return: the grounded effects.
+        """
+        operator = Operator(
+            action=self.domain.actions[action_call.name],
+            domain=self.domain,
+            grounded_action_call=action_call.parameters,
+            problem_objects=self.problem.objects,
+        )
+        operator.ground()
+        return [*operator.grounded_effects, *operator.iter_grounded_universal_effects()]
+
+    def filter_reachable_actions(self, action_calls: Iterable[ActionCall]) -> List[ActionCall]:
+        """Computes the relaxed reachability fixpoint and returns the action calls whose preconditions can hold.
+
+        Note: the action calls are consumed one at a time, so lazily created action calls are not stored unless some
+            of their conditions might hold later. The effects of the actions are grounded only when the actions become
+            reachable.
+
+        :param action_calls: the grounded action calls to filter.
+        :return: the reachable action calls, ordered as the input action calls.
+        """
+        self._clear_pending_state()
+        num_action_calls = 0
+        for index, action_call in enumerate(action_calls):
+            num_action_calls += 1
+            self._add_action_call(action_call, index)
+            self._propagate_changes()
+
+        self.logger.info(
+            "%d out of %d actions are relaxed reachable.", len(self._reachable_action_calls), num_action_calls
+        )
+        reachable_action_calls = sorted(self._reachable_action_calls, key=lambda indexed_action: indexed_action[0])
+        self._clear_pending_state()
+        return [action_call for _, action_call in reachable_action_calls]
@@ -0,0 +1,173 @@
+"""Module that memoizes the results of the symbolic simplifications of numeric expressions."""
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from pddl_plus_parser import __version__
+
+DEFAULT_SIMPLIFICATION_CACHE_SIZE = 4096
+# Environment variable with the path of a file that persists the process-wide cache across runs.
+SIMPLIFICATION_CACHE_PATH_VARIABLE = "SIMPLIFICATION_CACHE_PATH"
+
+CacheKey = Tuple[Hashable, ...]
+
+
+def _to_hashable(value):
+    """Converts the lists in a cache key, e.g., in keys loaded from JSON, to tuples."""
+    return tuple(_to_hashable(item) for item in value) if isinstance(value, (list, tuple)) else value
+
+
+class SimplificationCache:
+    """Bounded LRU cache of the simplified PDDL strings of numeric expressions.
+
+    Note: the keys contain the canonical mathematical string of the expression, the assumptions substituted into it
+        and the number of decimal digits, so equal keys always produce the same simplified string. The cache is
+        shared between threads and a max_size of None creates an unbounded cache.
+    """
+
+    max_size: Optional[int]
+    hits: int
+    misses: int
+    evictions: int
+    _results: "OrderedDict[CacheKey, Optional[str]]"
+    _lock: threading.Lock
+    logger: logging.Logger
+
+    def __init__(self, max_size: Optional[int] = DEFAULT_SIMPLIFICATION_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __str__(self):
+        return (
+            f"SimplificationCache(hits={self.hits}, misses={self.misses}, evictions={self.evictions}, "
+            f"size={len(self)}, max_size={self.max_size})"
+        )
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        """Returns the hit, miss and eviction counters of the cache."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self)}
+
+    def _store(self, key: CacheKey, result: Optional[str]) -> None:
+        """Stores the result in the cache and evicts the least recently used results if the cache is full.
+
+        Note: the caller should hold the cache's lock.
+
+        :param key: the key of the simplified expression.
+        :param result: the simplified expression.
+        """
+        self._results[key] = result
+        self._results.move_to_end(key)
+        while self.max_size is not None and len(self._results) > self.max_size:
+            self._results.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_compute(self, key: CacheKey, compute_result: Callable[[], Optional[str]]) -> Optional[str]:
+        """Returns the cached simplification result or computes and caches it.
+
+        Note: exceptions raised while computing the result are propagated and nothing is cached.
+
+        :param key: the key of the simplified expression.
+        :param compute_result: function that simplifies the expression.
+        :return: the simplified expression.
+        """
+        key = _to_hashable(key)
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                self._results.move_to_end(key)
+                return self._results[key]
+
+            self.misses += 1
+
+        result = compute_result()
+        with self._lock:
+            self._store(key, result)
+
+        return result
+
+    def clear(self) -> None:
+        """Removes the cached results and resets the statistics."""
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def save(self, cache_path: Path) -> None:
+        """Saves the cached results to a JSON file.
+
+        :param cache_path: the path of the file to save the results to.
+        """
+        cache_path = Path(cache_path)
+        with self._lock:
+            cache_content = {
+                "version": __version__,
+                "results": [[list(key), result] for key, result in self._results.items()],
+            }
+
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wt") as cache_file:
+                json.dump(cache_content, cache_file)
+
+            os.replace(temporary_path, cache_path)
+
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def load(self, cache_path: Path) -> None:
+        """Loads results that were saved by a previous run into the cache.
+
+        Note: results saved by other versions of the package are ignored since the simplification might differ.
+
+        :param cache_path: the path of the file to load the results from.
+        """
+        try:
+            with open(cache_path, "rt") as cache_file:
+                cache_content = json.load(cache_file)
+
+        except (OSError, ValueError) as error:
+            self.logger.warning("Could not load the simplification cache from %s - %s", cache_path, error)
+            return
+
+        if cache_content.get("version") != __version__:
+            self.logger.debug("The simplification cache was created by another version of the package, ignoring it.")
+            return
+
+        with self._lock:
+            for key, result in cache_content["results"]:
+                self._store(_to_hashable(key), result)
+
+        self.logger.debug("Loaded %d simplified expressions from %s.", len(cache_content["results"]), cache_path)
+
+    def enable_persistence(self, cache_path: Path) -> None:
+        """Loads the results saved in the file, if it exists, and saves the cache to the file when the process exits.
+
+        :param cache_path: the path of the file that persists the cache.
+        """
+        cache_path = Path(cache_path)
+        if cache_path.exists():
+            self.load(cache_path)
+
+        atexit.register(self.save, cache_path)
+
+
+SIMPLIFICATION_CACHE = SimplificationCache()
+if os.environ.get(SIMPLIFICATION_CACHE_PATH_VARIABLE):
+    SIMPLIFICATION_CACHE.enable_persistence(Path(os.environ[SIMPLIFICATION_CACHE_PATH_VARIABLE]))
@@ -1,8 +1,9 @@
 import itertools
 import logging
-from collections import defaultdict
+import math
+from collections import defaultdict, Counter
 from itertools import permutations
-from typing import List, Tuple, Dict, Set, Union, Optional
+from typing import List, Tuple, Dict, Set, Union, Optional, Iterator, Sequence
 
 from pddl_plus_parser.models.action_call import ActionCall
 from pddl_plus_parser.models.pddl_action import Action
@@ -10,7 +11,19 @@ from pddl_plus_parser.models.pddl_domain import Domain
 from pddl_plus_parser.models.pddl_function import PDDLFunction
 from pddl_plus_parser.models.pddl_object import PDDLObject
 from pddl_plus_parser.models.pddl_predicate import Predicate, GroundedPredicate
-from pddl_plus_parser.models.pddl_type import PDDLType
+from pddl_plus_parser.models.pddl_problem import Problem
+from pddl_plus_parser.models.pddl_type import PDDLType, TypeHierarchyIndex
+from pddl_plus_parser.models.relaxed_reachability import RelaxedReachabilityAnalysis
+
+
+def iter_objects_subset(array: List[str], subset_size: int) -> Iterator[Tuple[str]]:
+    """Lazily choose r items our of a list size n.
+
+    :param array: the input list.
+    :param subset_size: the size of the subset.
+    :return: an iterator over the subsets of the original list.
+    """
+    return permutations(array, subset_size)
 
 
 def choose_objects_subset(array: List[str], subset_size: int) -> List[Tuple[str]]:
@@ -20,7 +33,37 @@ def choose_objects_subset(array: List[str], subset_size: int) -> List[Tuple[str]
     :param subset_size: the size of the subset.
     :return: a list containing subsets of the original list.
     """
-    return list(permutations(array, subset_size))
+    return list(iter_objects_subset(array, subset_size))
+
+
+def count_distinct_assignments(candidate_objects: Sequence[Sequence[PDDLObject]]) -> int:
+    """Counts the assignments of objects to parameters in which no object is assigned to more than one parameter.
+
+    Note: the objects are grouped by the parameters they are candidates of, so the count is calculated without
+        enumerating the assignments.
+
+    :param candidate_objects: the candidate objects of every parameter.
+    :return: the number of assignments of distinct objects.
+    """
+    objects_candidacy = defaultdict(set)
+    for parameter_index, parameter_candidates in enumerate(candidate_objects):
+        for pddl_object in parameter_candidates:
+            objects_candidacy[pddl_object.name].add(parameter_index)
+
+    candidacy_classes = Counter(frozenset(parameter_indexes) for parameter_indexes in objects_candidacy.values())
+    parameters_classes = [
+        [candidacy_class for candidacy_class in candidacy_classes if parameter_index in candidacy_class]
+        for parameter_index in range(len(candidate_objects))
+    ]
+    num_assignments = 0
+    for classes_assignment in itertools.product(*parameters_classes):
+        num_class_assignments = 1
+        for candidacy_class, num_assigned in Counter(classes_assignment).items():
+            num_class_assignments *= math.perm(candidacy_classes[candidacy_class], num_assigned)
+
+        num_assignments += num_class_assignments
+
+    return num_assignments
 
 
 class VocabularyCreator:
@@ -30,72 +73,125 @@ class VocabularyCreator:
         self.logger = logging.getLogger(__name__)
 
     def _validate_type_matching(
-        self, grounded_signatures: Dict[str, PDDLType], lifted_variable_to_match: Union[Predicate, PDDLFunction, Action]
+        self,
+        grounded_signatures: Dict[str, PDDLType],
+        lifted_variable_to_match: Union[Predicate, PDDLFunction, Action],
+        type_hierarchy: Optional[TypeHierarchyIndex] = None,
     ) -> bool:
         """Validates that the types of the grounded signature match the types of the predicate signature.
 
         :param grounded_signatures: the grounded predicate signature.
         :param lifted_variable_to_match: the lifted predicate.
+        :param type_hierarchy: the index of the domain's type hierarchy used to check the subtypes, if given.
         :return: whether the types match.
         """
 
         if len(grounded_signatures) != len(lifted_variable_to_match.signature):
             self.logger.debug(
-                f"The number of objects - {grounded_signatures} does not match {lifted_variable_to_match.name}"
+                "The number of objects - %s does not match %s", grounded_signatures, lifted_variable_to_match.name
             )
+
             return False
 
         for object_name, predicate_parameter in zip(grounded_signatures, lifted_variable_to_match.signature):
             parameter_type = lifted_variable_to_match.signature[predicate_parameter]
             grounded_type = grounded_signatures[object_name]
-            if not grounded_type.is_sub_type(parameter_type):
+            is_sub_type = (
+                type_hierarchy.is_sub_type(grounded_type, parameter_type)
+                if type_hierarchy is not None
+                else grounded_type.is_sub_type(parameter_type)
+            )
+            if not is_sub_type:
                 self.logger.debug(
-                    f"The combination of objects - {grounded_signatures}"
-                    f" does not fit {lifted_variable_to_match.name}'s signature"
+                    "The combination of objects - %s does not fit %s's signature",
+                    grounded_signatures,
+                    lifted_variable_to_match.name,
                 )
+
                 return False
 
         return True
 
-    def create_grounded_predicate_vocabulary(
+    @staticmethod
+    def _group_objects_by_type(domain: Domain, observed_objects: Dict[str, PDDLObject]) -> Dict[str, List[PDDLObject]]:
+        """Groups the observed objects and the domain constants by the types they can be assigned to.
+
+        :param domain: the domain containing the constants and the type hierarchy.
+        :param observed_objects: the objects that were observed in the trajectory.
+        :return: mapping between the type names and the objects that can be assigned to parameters of that type.
+        """
+        objects_and_consts = {**domain.constants, **observed_objects}
+        return domain.type_hierarchy.group_objects_by_type(objects_and_consts.values())
+
+    @staticmethod
+    def _get_parameters_candidates(
+        objects_by_type: Dict[str, List[PDDLObject]], signature: Dict[str, PDDLType]
+    ) -> List[List[PDDLObject]]:
+        """Returns the objects that can be assigned to each of the parameters of the signature.
+
+        :param objects_by_type: mapping between the type names and the objects of that type.
+        :param signature: the lifted signature of the predicate or action.
+        :return: the candidate objects of each of the parameters.
+        """
+        return [objects_by_type.get(parameter_type.name, []) for parameter_type in signature.values()]
+
+    def iter_grounded_predicate_vocabulary(
         self, domain: Domain, observed_objects: Dict[str, PDDLObject]
-    ) -> Dict[str, Set[GroundedPredicate]]:
-        """Create a vocabulary of random combinations of the predicates parameters and objects.
+    ) -> Iterator[GroundedPredicate]:
+        """Lazily create the grounded predicates with the different combinations of objects matching their types.
 
         :param domain: the domain containing the predicates and the action signatures.
         :param observed_objects: the objects that were observed in the trajectory.
-        :return: list containing all the predicates with the different combinations of parameters.
+        :return: an iterator over the grounded predicates.
         """
-        vocabulary = defaultdict(set)
-        possible_objects_str = list(observed_objects.keys()) + list(domain.constants.keys())
-        objects_and_consts = list(observed_objects.values()) + list(domain.constants.values())
+        objects_by_type = self._group_objects_by_type(domain, observed_objects)
         for predicate in domain.predicates.values():
-            predicate_name = predicate.name
-            signature_permutations = choose_objects_subset(possible_objects_str, len(predicate.signature))
-            for signature_permutation in signature_permutations:
-                grounded_signature = {
-                    object_name: objects_and_consts[possible_objects_str.index(object_name)].type
-                    for object_name in signature_permutation
-                }
-                if not self._validate_type_matching(grounded_signature, predicate):
+            candidate_objects = self._get_parameters_candidates(objects_by_type, predicate.signature)
+            for signature_option in itertools.product(*candidate_objects):
+                object_names = [pddl_object.name for pddl_object in signature_option]
+                if len(set(object_names)) != len(object_names):
                     continue
 
-                matching_grounded_type_hierarchy_signature = {
-                    parameter_name: objects_and_consts[possible_objects_str.index(object_name)].type
-                    for object_name, parameter_name in zip(grounded_signature, predicate.signature)
-                }
-                grounded_predicate = GroundedPredicate(
-                    name=predicate_name,
-                    signature=matching_grounded_type_hierarchy_signature,
+                yield GroundedPredicate(
+                    name=predicate.name,
+                    signature={
+                        parameter_name: pddl_object.type
+                        for pddl_object, parameter_name in zip(signature_option, predicate.signature)
+                    },
                     object_mapping={
                         parameter_name: object_name
-                        for object_name, parameter_name in zip(grounded_signature, predicate.signature)
+                        for object_name, parameter_name in zip(object_names, predicate.signature)
                     },
                 )
-                vocabulary[predicate.untyped_representation].add(grounded_predicate)
+
+    def create_grounded_predicate_vocabulary(
+        self, domain: Domain, observed_objects: Dict[str, PDDLObject]
+    ) -> Dict[str, Set[GroundedPredicate]]:
+        """Create a vocabulary of random combinations of the predicates parameters and objects.
+
+        :param domain: the domain containing the predicates and the action signatures.
+        :param observed_objects: the objects that were observed in the trajectory.
+        :return: list containing all the predicates with the different combinations of parameters.
+        """
+        vocabulary = defaultdict(set)
+        for grounded_predicate in self.iter_grounded_predicate_vocabulary(domain, observed_objects):
+            vocabulary[grounded_predicate.lifted_untyped_representation].add(grounded_predicate)
 
         return vocabulary
 
+    def count_grounded_predicate_vocabulary(self, domain: Domain, observed_objects: Dict[str, PDDLObject]) -> int:
+        """Counts the grounded predicates in the vocabulary without creating them.
+
+        :param domain: the domain containing the predicates and the action signatures.
+        :param observed_objects: the objects that were observed in the trajectory.
+        :return: the number of grounded predicates in the vocabulary.
+        """
+        objects_by_type = self._group_objects_by_type(domain, observed_objects)
+        return sum(
+            count_distinct_assignments(self._get_parameters_candidates(objects_by_type, predicate.signature))
+            for predicate in domain.predicates.values()
+        )
+
     def create_lifted_functions_vocabulary(
         self, domain: Domain, possible_parameters: Dict[str, PDDLType], must_be_parameter: Optional[str] = None
     ) -> Dict[str, PDDLFunction]:
@@ -106,20 +202,22 @@ class VocabularyCreator:
         :param must_be_parameter: the parameter that must be in the function signature.
         :return: the vocabulary of functions.
         """
-        self.logger.debug(f"Creating a function vocabulary from {possible_parameters}")
+        self.logger.debug("Creating a function vocabulary from %s", possible_parameters)
+
         vocabulary = {}
         possible_parameters_names = list(possible_parameters.keys()) + list(domain.constants.keys())
         parameter_types = list(possible_parameters.values()) + [const.type for const in domain.constants.values()]
+        type_hierarchy = domain.type_hierarchy
         for predicate in domain.functions.values():
             function_name = predicate.name
-            signature_permutations = choose_objects_subset(possible_parameters_names, len(predicate.signature))
+            signature_permutations = iter_objects_subset(possible_parameters_names, len(predicate.signature))
             for signature_permutation in signature_permutations:
                 bounded_lifted_signature = {
                     param_name: parameter_types[possible_parameters_names.index(param_name)]
                     for param_name in signature_permutation
                 }
 
-                if not self._validate_type_matching(bounded_lifted_signature, predicate):
+                if not self._validate_type_matching(bounded_lifted_signature, predicate, type_hierarchy):
                     continue
 
                 if must_be_parameter and must_be_parameter not in bounded_lifted_signature:
@@ -141,20 +239,22 @@ class VocabularyCreator:
         :param must_be_parameter: if not None, the vocabulary will only contain predicates that have this parameter.
         :return: list containing all the predicates with the different combinations of parameters.
         """
-        self.logger.debug(f"Creating predicates vocabulary from {possible_parameters}")
+        self.logger.debug("Creating predicates vocabulary from %s", possible_parameters)
+
         vocabulary = set()
         possible_parameters_names = list(possible_parameters.keys()) + list(domain.constants.keys())
         parameter_types = list(possible_parameters.values()) + [const.type for const in domain.constants.values()]
+        type_hierarchy = domain.type_hierarchy
         for predicate in domain.predicates.values():
             predicate_name = predicate.name
-            signature_permutations = choose_objects_subset(possible_parameters_names, len(predicate.signature))
+            signature_permutations = iter_objects_subset(possible_parameters_names, len(predicate.signature))
             for signature_permutation in signature_permutations:
                 bounded_lifted_signature = {
                     param_name: parameter_types[possible_parameters_names.index(param_name)]
                     for param_name in signature_permutation
                 }
 
-                if not self._validate_type_matching(bounded_lifted_signature, predicate):
+                if not self._validate_type_matching(bounded_lifted_signature, predicate, type_hierarchy):
                     continue
 
                 if must_be_parameter and must_be_parameter not in bounded_lifted_signature:
@@ -168,28 +268,66 @@ class VocabularyCreator:
         self.logger.debug(f"Created vocabulary of size {len(vocabulary)}")
         return vocabulary
 
-    def create_grounded_actions_vocabulary(
+    def iter_grounded_actions_vocabulary(
         self, domain: Domain, observed_objects: Dict[str, PDDLObject]
-    ) -> Set[ActionCall]:
-        """Create a vocabulary of random combinations of the actions parameters and objects.
+    ) -> Iterator[ActionCall]:
+        """Lazily create the action calls with the different combinations of objects matching their types.
 
         :param domain: the domain containing the actions and the action signatures.
         :param observed_objects: the objects that were observed in the trajectory.
-        :return: list containing all the actions with the different combinations of parameters.
+        :return: an iterator over the grounded actions.
         """
-        vocabulary = set()
-        objects_and_consts = list(observed_objects.values()) + list(domain.constants.values())
+        objects_by_type = self._group_objects_by_type(domain, observed_objects)
         for action_name, action in domain.actions.items():
-            possible_objects_for_parameters = {
-                parameter_name: [obj for obj in objects_and_consts if obj.type.is_sub_type(parameter_type)]
-                for parameter_name, parameter_type in action.signature.items()
-            }
-            signature_options = list(itertools.product(*possible_objects_for_parameters.values()))
-            for signature_option in signature_options:
+            candidate_objects = self._get_parameters_candidates(objects_by_type, action.signature)
+            for signature_option in itertools.product(*candidate_objects):
                 grounded_action = ActionCall(
                     name=action_name, grounded_parameters=[obj.name for obj in signature_option]
                 )
-                self.logger.debug(f"Created grounded action {str(grounded_action)}")
-                vocabulary.add(grounded_action)
+                self.logger.debug("Created grounded action %s", grounded_action)
 
-        return vocabulary
+                yield grounded_action
+
+    def create_grounded_actions_vocabulary(
+        self, domain: Domain, observed_objects: Dict[str, PDDLObject]
+    ) -> Set[ActionCall]:
+        """Create a vocabulary of random combinations of the actions parameters and objects.
+
+        :param domain: the domain containing the actions and the action signatures.
+        :param observed_objects: the objects that were observed in the trajectory.
+        :return: list containing all the actions with the different combinations of parameters.
+        """
+        return set(self.iter_grounded_actions_vocabulary(domain, observed_objects))
+
+    def create_reachable_grounded_actions_vocabulary(self, domain: Domain, problem: Problem) -> Set[ActionCall]:
+        """Create the vocabulary of grounded actions whose preconditions are reachable from the initial state.
+
+        Note: the reachability is computed on the delete relaxation of the problem with interval bounds for the
+            numeric fluents, so the vocabulary may still contain actions that cannot be applied in any reachable state.
+
+        :param domain: the domain containing the actions and the action signatures.
+        :param problem: the problem containing the objects and the initial state.
+        :return: the grounded actions that are relaxed reachable.
+        """
+        reachability_analysis = RelaxedReachabilityAnalysis(domain, problem)
+        return set(
+            reachability_analysis.filter_reachable_actions(
+                self.iter_grounded_actions_vocabulary(domain, problem.objects)
+            )
+        )
+
+    def count_grounded_actions_vocabulary(self, domain: Domain, observed_objects: Dict[str, PDDLObject]) -> int:
+        """Counts the grounded actions in the vocabulary without creating them.
+
+        :param domain: the domain containing the actions and the action signatures.
+        :param observed_objects: the objects that were observed in the trajectory.
+        :return: the number of grounded actions in the vocabulary.
+        """
+        objects_by_type = self._group_objects_by_type(domain, observed_objects)
+        return sum(
+            math.prod(
+                len(parameter_candidates)
+                for parameter_candidates in self._get_parameters_candidates(objects_by_type, action.signature)
+            )
+            for action in domain.actions.values()
+        )
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pddl_plus_parser.models import (
     Problem,
@@ -6,6 +6,7 @@ from pddl_plus_parser.models import (
     ActionCall,
     Domain,
     Operator,
+    OperatorCache,
     NOP_ACTION,
 )
 
@@ -25,11 +26,32 @@ def create_initial_state(problem: Problem) -> State:
     )
 
 
+def _get_operator(
+    domain: Domain, action_call: ActionCall, operator_cache: Optional[OperatorCache]
+) -> Operator:
+    """Returns the operator of the action call, from the cache if one is given.
+
+    :param domain: the domain with the action scheme.
+    :param action_call: the grounded action call.
+    :param operator_cache: the cache of the domain's operators.
+    :return: the operator of the action call.
+    """
+    if operator_cache is not None:
+        return operator_cache.get_operator(action_call.name, action_call.parameters)
+
+    return Operator(
+        action=domain.actions[action_call.name],
+        domain=domain,
+        grounded_action_call=action_call.parameters,
+    )
+
+
 def apply_actions(
     domain: Domain,
     current_state: State,
     joint_action: List[ActionCall],
     allow_inapplicable_actions: bool = False,
+    operator_cache: Optional[OperatorCache] = None,
 ) -> State:
     """
 
@@ -37,27 +59,22 @@ def apply_actions(
     :param current_state: the current state that the action is being applied on.
     :param joint_action: the executable actions of the agents.
     :param allow_inapplicable_actions: whether to allow inapplicable actions.
+    :param operator_cache: the cache of the domain's operators, if not given the operators are created and grounded
+        on every call.
     :return: The state resulting from applying the actions.
     """
     if len(joint_action) == 1:
-        action_call = joint_action[0]
-        action = domain.actions[action_call.name]
-        return Operator(
-            action=action, domain=domain, grounded_action_call=action_call.parameters
-        ).apply(
+        return _get_operator(domain, joint_action[0], operator_cache).apply(
             previous_state=current_state,
             allow_inapplicable_actions=allow_inapplicable_actions,
         )
 
-    accumulative_changed_state = current_state.copy()
+    accumulative_changed_state = current_state.create_successor()
     for action_call in joint_action:
         if action_call.name == NOP_ACTION:
             continue
 
-        action = domain.actions[action_call.name]
-        operator = Operator(
-            action=action, domain=domain, grounded_action_call=action_call.parameters
-        )
+        operator = _get_operator(domain, action_call, operator_cache)
         if operator.is_applicable(current_state) or allow_inapplicable_actions:
             accumulative_changed_state = operator.apply(
                 accumulative_changed_state, allow_inapplicable_actions=True
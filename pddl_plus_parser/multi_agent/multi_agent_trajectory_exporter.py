@@ -14,6 +14,8 @@ from pddl_plus_parser.models import (
     NOP_ACTION,
     NOPOperator,
     PDDLObject,
+    OperatorCache,
+    DEFAULT_OPERATOR_CACHE_SIZE,
 )
 from pddl_plus_parser.multi_agent.common import create_initial_state, apply_actions
 
@@ -64,11 +66,18 @@ class MultiAgentTrajectoryExporter:
 
     domain: Domain
     allow_invalid_actions: bool
+    operator_cache: OperatorCache
     logger: logging.Logger
 
-    def __init__(self, domain: Domain, allow_invalid_actions: bool = False):
+    def __init__(
+        self,
+        domain: Domain,
+        allow_invalid_actions: bool = False,
+        operator_cache_size: Optional[int] = DEFAULT_OPERATOR_CACHE_SIZE,
+    ):
         self.domain = domain
         self.allow_invalid_actions = allow_invalid_actions
+        self.operator_cache = OperatorCache(domain, max_size=operator_cache_size)
         self.logger = logging.getLogger(__name__)
 
     def _read_plan(self, plan_file_path: Path) -> List[str]:
@@ -96,9 +105,11 @@ class MultiAgentTrajectoryExporter:
         :param allow_inapplicable_actions: whether to allow inapplicable actions.
         :return: the new triplet containing (s,<a1, a2,..., am>,s').
         """
-        self.logger.info(
-            f"Trying to apply the action - {action_call} on the state - {previous_state.serialize()}"
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                f"Trying to apply the action - {action_call} on the state - {previous_state.serialize()}"
+            )
+
         joint_action = parse_action_call(action_call)
         executed_actions = [
             ActionCall(name=op.name, grounded_parameters=op.parameters)
@@ -124,6 +135,7 @@ class MultiAgentTrajectoryExporter:
             previous_state,
             executed_actions,
             allow_inapplicable_actions=allow_inapplicable_actions,
+            operator_cache=self.operator_cache,
         )
         return MultiAgentTrajectoryTriplet(
             previous_state=previous_state, ops=operators, next_state=next_state
@@ -2,7 +2,7 @@
 import logging
 import re
 from pathlib import Path
-from typing import List, Tuple, Set
+from typing import List, Tuple, Set, Optional
 
 from pddl_plus_parser.models import (
     Domain,
@@ -14,6 +14,8 @@ from pddl_plus_parser.models import (
     State,
     GroundedPredicate,
     NumericalExpressionTree,
+    OperatorCache,
+    DEFAULT_OPERATOR_CACHE_SIZE,
 )
 from pddl_plus_parser.multi_agent.common import create_initial_state, apply_actions
 
@@ -24,10 +26,12 @@ class PlanConverter:
     """Class that converts single agent plans to multi-agent plans with joint actions."""
 
     ma_domain: Domain
+    operator_cache: OperatorCache
     logger: logging.Logger
 
-    def __init__(self, ma_domain: Domain):
+    def __init__(self, ma_domain: Domain, operator_cache_size: Optional[int] = DEFAULT_OPERATOR_CACHE_SIZE):
         self.ma_domain = ma_domain
+        self.operator_cache = OperatorCache(ma_domain, max_size=operator_cache_size)
         self.logger = logging.getLogger(__name__)
 
     def _extract_plan_actions(
@@ -39,12 +43,15 @@ class PlanConverter:
         :param agent_names: the names of the agents.
         :return: the list tuples containing the action and the agent that executes it.
         """
-        self.logger.info(f"Extracting the actions from the multi-agent plan:\n{plan}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Extracting the actions from the multi-agent plan:\n{plan}")
+
         matches = re.finditer(PLAN_COMPONENT_REGEX, plan, re.MULTILINE)
         plan_seq = []
         for match in matches:
             action_sequence = match.group(1)
-            self.logger.debug(f"action sequence - {action_sequence}")
+            self.logger.debug("action sequence - %s", action_sequence)
+
             action_components = action_sequence.lower().split()
             action_name = action_components[0]
             action_parameters = action_components[1:]
@@ -135,12 +142,10 @@ class PlanConverter:
             if action_call.name == NOP_ACTION:
                 continue
 
-            op = Operator(
-                self.ma_domain.actions[action_call.name],
-                self.ma_domain,
-                action_call.parameters,
-            )
-            op.ground()
+            op = self.operator_cache.get_operator(action_call.name, action_call.parameters)
+            if not op.grounded:
+                op.ground()
+
             (
                 action_add_effect,
                 action_del_effect,
@@ -222,9 +227,8 @@ class PlanConverter:
         :param should_validate_concurrency_constraint: whether to validate the concurrency constraint.
         :return: whether the joint action with the new action is well-defined.
         """
-        self.logger.info(
-            f"Validating the joint action with the new action {str(next_action)}"
-        )
+        self.logger.info("Validating the joint action with the new action %s", next_action)
+
         next_agent_action_index = agent_names.index(next_executing_agent)
         if combined_actions[next_agent_action_index].name != NOP_ACTION:
             self.logger.debug(
@@ -245,12 +249,10 @@ class PlanConverter:
             self.logger.debug("The new action violates the concurrency constraint!")
             return False
 
-        next_action_op = Operator(
-            self.ma_domain.actions[next_action.name],
-            self.ma_domain,
-            next_action.parameters,
-        )
-        next_action_op.ground()
+        next_action_op = self.operator_cache.get_operator(next_action.name, next_action.parameters)
+        if not next_action_op.grounded:
+            next_action_op.ground()
+
         if not next_action_op.is_applicable(current_state):
             return False
 
@@ -302,13 +304,14 @@ class PlanConverter:
                     agent_names.index(next_executing_agent)
                 ] = plan_actions.pop(0)[0]
 
-            self.logger.debug(
-                f"Created the joint action {[str(action) for action in joint_action]}"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Created the joint action {[str(action) for action in joint_action]}")
+
             current_state = apply_actions(
                 self.ma_domain,
                 current_state,
                 [action for action in joint_action if action.name != NOP_ACTION],
+                operator_cache=self.operator_cache,
             )
             joint_actions.append(JointActionCall(joint_action))
 
@@ -1,16 +1,21 @@
+import re
 from distutils.core import setup
 from setuptools import find_packages
 
 with open("README.md") as f:
     long_description = f.read()
 
+# The version is defined only in the package so that it cannot drift from the version used to invalidate its caches.
+with open("pddl_plus_parser/__init__.py") as f:
+    version = re.search(r'^__version__ = "([^"]+)"', f.read(), re.MULTILINE).group(1)
+
 setup(
     name="pddl-plus-parser",
-    version="3.17.0",
+    version=version,
     python_requires=">=3.8",
     description="Parser of PDDL+ domains and problems for learning purposes",
     long_description=long_description,
     long_description_content_type="text/markdown",
     author="Argaman Mordoch",
-    packages=find_packages(exclude=["tests"]),
+    packages=find_packages(exclude=["tests", "benchmarks"]),
 )
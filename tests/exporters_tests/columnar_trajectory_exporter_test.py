@@ -0,0 +1,139 @@
+"""Module test for the columnar trajectory exporter."""
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+from pytest import fixture
+
+from pddl_plus_parser.exporters import (
+    ColumnarTrajectory,
+    ColumnarTrajectoryExporter,
+    TrajectoryExporter,
+    TrajectoryTriplet,
+    MISSING_PARAMETER_CODE,
+)
+from pddl_plus_parser.lisp_parsers import DomainParser, ProblemParser, TrajectoryParser
+from pddl_plus_parser.models import Domain, Problem
+from .consts import TEST_NUMERIC_DOMAIN_PATH, TEST_NUMERIC_PROBLEM_PATH, TEST_NUMERIC_PLAN_PATH
+
+
+@fixture()
+def numeric_domain() -> Domain:
+    return DomainParser(TEST_NUMERIC_DOMAIN_PATH).parse_domain()
+
+
+@fixture()
+def numeric_problem(numeric_domain: Domain) -> Problem:
+    return ProblemParser(problem_path=TEST_NUMERIC_PROBLEM_PATH, domain=numeric_domain).parse_problem()
+
+
+@fixture()
+def numeric_triplets(numeric_domain: Domain, numeric_problem: Problem) -> List[TrajectoryTriplet]:
+    return TrajectoryExporter(domain=numeric_domain).parse_plan(numeric_problem, TEST_NUMERIC_PLAN_PATH)
+
+
+@fixture()
+def columnar_trajectory(numeric_triplets: List[TrajectoryTriplet]) -> ColumnarTrajectory:
+    return ColumnarTrajectoryExporter().export_triplets(numeric_triplets)
+
+
+def test_export_triplets_creates_arrays_with_a_row_per_transition_and_sorted_vocabularies(
+    numeric_triplets: List[TrajectoryTriplet], columnar_trajectory: ColumnarTrajectory
+):
+    assert len(columnar_trajectory) == len(numeric_triplets)
+    assert columnar_trajectory.fluent_names == sorted(columnar_trajectory.fluent_names)
+    assert columnar_trajectory.fact_names == sorted(columnar_trajectory.fact_names)
+    assert columnar_trajectory.previous_fluents.shape == (
+        len(numeric_triplets),
+        len(columnar_trajectory.fluent_names),
+    )
+    assert columnar_trajectory.previous_fluents.dtype == np.float64
+    assert columnar_trajectory.next_facts.shape == (len(numeric_triplets), len(columnar_trajectory.fact_names))
+    assert columnar_trajectory.next_facts.dtype == np.bool_
+    assert columnar_trajectory.is_successful.all()
+
+
+def test_export_triplets_encodes_the_states_and_actions_of_the_triplets(
+    numeric_triplets: List[TrajectoryTriplet], columnar_trajectory: ColumnarTrajectory
+):
+    for row, triplet in enumerate(numeric_triplets):
+        action_name, parameters = columnar_trajectory.get_action_call(row)
+        assert action_name == triplet.operator.name
+        assert parameters == triplet.operator.grounded_call_objects
+        for column, fluent_name in enumerate(columnar_trajectory.fluent_names):
+            assert columnar_trajectory.next_fluents[row, column] == triplet.next_state.state_fluents[fluent_name].value
+
+        next_facts = {
+            columnar_trajectory.fact_names[column] for column in np.flatnonzero(columnar_trajectory.next_facts[row])
+        }
+        assert next_facts == {
+            predicate.untyped_representation
+            for predicates in triplet.next_state.state_predicates.values()
+            for predicate in predicates
+        }
+
+
+def test_export_triplets_pads_the_parameters_of_actions_with_smaller_arity(columnar_trajectory: ColumnarTrajectory):
+    arities = (columnar_trajectory.action_parameters != MISSING_PARAMETER_CODE).sum(axis=1)
+    assert columnar_trajectory.action_parameters.shape[1] == arities.max()
+    assert arities.min() < arities.max()
+
+
+def test_export_observation_creates_same_arrays_as_the_exported_triplets(
+    numeric_domain: Domain,
+    numeric_problem: Problem,
+    numeric_triplets: List[TrajectoryTriplet],
+    columnar_trajectory: ColumnarTrajectory,
+):
+    trajectory_string = "".join(TrajectoryExporter.export(numeric_triplets))
+    observation = TrajectoryParser(numeric_domain, numeric_problem).parse_trajectory(
+        trajectory_string=trajectory_string
+    )
+    exported_observation = ColumnarTrajectoryExporter().export_observation(observation)
+    assert exported_observation.fact_names == columnar_trajectory.fact_names
+    assert np.array_equal(exported_observation.next_facts, columnar_trajectory.next_facts)
+    assert np.array_equal(exported_observation.previous_fluents, columnar_trajectory.previous_fluents)
+    assert np.array_equal(exported_observation.action_parameters, columnar_trajectory.action_parameters)
+
+
+def test_export_triplets_with_given_vocabulary_uses_the_given_columns(
+    numeric_triplets: List[TrajectoryTriplet], columnar_trajectory: ColumnarTrajectory
+):
+    fluent_names = list(reversed(columnar_trajectory.fluent_names))
+    exported_trajectory = ColumnarTrajectoryExporter(fluent_names=fluent_names).export_triplets(numeric_triplets)
+    assert exported_trajectory.fluent_names == fluent_names
+    assert np.array_equal(exported_trajectory.next_fluents, columnar_trajectory.next_fluents[:, ::-1])
+
+
+def test_export_triplets_with_given_vocabulary_missing_observed_fact_raises_value_error(
+    numeric_triplets: List[TrajectoryTriplet], columnar_trajectory: ColumnarTrajectory
+):
+    with pytest.raises(ValueError):
+        ColumnarTrajectoryExporter(fact_names=columnar_trajectory.fact_names[1:]).export_triplets(numeric_triplets)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_load_saved_trajectory_returns_the_same_arrays(
+    columnar_trajectory: ColumnarTrajectory, tmp_path: Path, compress: bool
+):
+    output_path = tmp_path / "trajectory.npz"
+    columnar_trajectory.save(output_path, compress=compress)
+    for memory_map in [True, False]:
+        loaded_trajectory = ColumnarTrajectory.load(output_path, memory_map=memory_map)
+        assert loaded_trajectory.fluent_names == columnar_trajectory.fluent_names
+        assert loaded_trajectory.fact_names == columnar_trajectory.fact_names
+        assert loaded_trajectory.action_names == columnar_trajectory.action_names
+        assert loaded_trajectory.object_names == columnar_trajectory.object_names
+        assert np.array_equal(loaded_trajectory.previous_fluents, columnar_trajectory.previous_fluents)
+        assert np.array_equal(loaded_trajectory.next_facts, columnar_trajectory.next_facts)
+        assert np.array_equal(loaded_trajectory.action_parameters, columnar_trajectory.action_parameters)
+        assert loaded_trajectory.get_action_call(3) == columnar_trajectory.get_action_call(3)
+
+
+def test_load_with_memory_map_returns_memory_mapped_arrays(columnar_trajectory: ColumnarTrajectory, tmp_path: Path):
+    output_path = tmp_path / "trajectory.npz"
+    columnar_trajectory.save(output_path)
+    loaded_trajectory = ColumnarTrajectory.load(output_path)
+    assert isinstance(loaded_trajectory.next_fluents, np.memmap)
+    assert isinstance(loaded_trajectory.previous_facts, np.memmap)
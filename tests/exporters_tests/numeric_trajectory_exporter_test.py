@@ -1,13 +1,16 @@
 """Module test for the numeric trajectory exporter functionality."""
 
+import logging
 from collections import defaultdict
 from typing import List
 
 import pytest
-from pytest import fixture
+from pytest import fixture, LogCaptureFixture
 
+from pddl_plus_parser import set_library_log_level, configure_library_logging_from_environment
+from pddl_plus_parser.logging_utils import LIBRARY_LOGGER_NAME, LOG_LEVEL_ENVIRONMENT_VARIABLE
 from pddl_plus_parser.exporters import TrajectoryExporter
-from pddl_plus_parser.lisp_parsers import DomainParser, ProblemParser
+from pddl_plus_parser.lisp_parsers import DomainParser, ProblemParser, TrajectoryParser
 from pddl_plus_parser.models import Domain, State, Problem
 from .consts import (
     TEST_DISCRETE_DOMAIN_PATH,
@@ -196,6 +199,43 @@ def test_export_numeric_trajectory(numeric_trajectory_exporter: TrajectoryExport
         trajectory_file.writelines(exportable_triplets)
 
 
+def test_export_with_delta_encoding_serializes_only_the_changes_after_the_initial_state(
+    numeric_trajectory_exporter: TrajectoryExporter, numeric_problem: Problem
+):
+    triplets = numeric_trajectory_exporter.parse_plan(numeric_problem, TEST_NUMERIC_PLAN_PATH)
+    full_trajectory = numeric_trajectory_exporter.export(triplets)
+    delta_trajectory = numeric_trajectory_exporter.export(triplets, delta_encoding=True)
+    assert delta_trajectory[0] == full_trajectory[0]
+    assert all(line.startswith("(:delta") for line in delta_trajectory[2::2])
+    assert len("".join(delta_trajectory)) < len("".join(full_trajectory)) / 2
+
+
+def test_export_with_delta_encoding_parsed_by_trajectory_parser_creates_same_states_as_the_triplets(
+    numeric_domain: Domain, numeric_trajectory_exporter: TrajectoryExporter, numeric_problem: Problem
+):
+    triplets = numeric_trajectory_exporter.parse_plan(numeric_problem, TEST_NUMERIC_PLAN_PATH)
+    delta_trajectory = "".join(numeric_trajectory_exporter.export(triplets, delta_encoding=True))
+    observation = TrajectoryParser(numeric_domain, numeric_problem).parse_trajectory(
+        trajectory_string=delta_trajectory
+    )
+    assert len(observation) == len(triplets)
+    for component, triplet in zip(observation.components, triplets):
+        assert str(component.grounded_action_call) == str(triplet.operator)
+        assert component.previous_state == triplet.previous_state
+        assert component.next_state == triplet.next_state
+
+
+def test_export_with_delta_encoding_of_universal_effects_parsed_by_trajectory_parser_creates_same_states(
+    miconic_domain: Domain, miconic_trajectory_exporter: TrajectoryExporter, miconic_problem: Problem
+):
+    triplets = miconic_trajectory_exporter.parse_plan(miconic_problem, TEST_MICONIC_PLAN_PATH)
+    delta_trajectory = "".join(miconic_trajectory_exporter.export(triplets, delta_encoding=True))
+    trajectory_parser = TrajectoryParser(miconic_domain, miconic_problem)
+    components = list(trajectory_parser.iter_trajectory(trajectory_string=delta_trajectory))
+    assert len(components) == len(triplets)
+    assert all(component.next_state == triplet.next_state for component, triplet in zip(components, triplets))
+
+
 def test_export_trajectory_with_universal_effects_applies_universal_effects_only_when_all_the_conditions_apply(
     miconic_trajectory_exporter: TrajectoryExporter, miconic_problem: Problem
 ):
@@ -208,3 +248,54 @@ def test_export_trajectory_with_universal_effects_applies_universal_effects_only
             print(str(triplet.operator))
             print(triplet.next_state.serialize())
             print()
+
+
+def test_create_single_triplet_when_library_logging_is_disabled_does_not_serialize_the_state(
+    numeric_trajectory_exporter: TrajectoryExporter, numeric_problem: Problem, caplog: LogCaptureFixture
+):
+    state = State(predicates=numeric_problem.initial_state_predicates, fluents=numeric_problem.initial_state_fluents)
+
+    def fail_serialization() -> str:
+        raise AssertionError("The state should not be serialized when the log level is disabled.")
+
+    state.serialize = fail_serialization
+    caplog.set_level(logging.DEBUG)
+    set_library_log_level("warning")
+    try:
+        numeric_trajectory_exporter.create_single_triplet(
+            state, "(DRIVE TRUCK0 DEPOT0 DISTRIBUTOR0)", numeric_problem.objects
+        )
+
+    finally:
+        set_library_log_level(None)
+
+    assert len(caplog.records) == 0
+
+
+def test_create_single_triplet_when_library_logging_is_enabled_logs_the_serialized_state(
+    numeric_trajectory_exporter: TrajectoryExporter, numeric_problem: Problem, caplog: LogCaptureFixture
+):
+    state = State(predicates=numeric_problem.initial_state_predicates, fluents=numeric_problem.initial_state_fluents)
+    caplog.set_level(logging.INFO, logger="pddl_plus_parser")
+    numeric_trajectory_exporter.create_single_triplet(
+        state, "(DRIVE TRUCK0 DEPOT0 DISTRIBUTOR0)", numeric_problem.objects
+    )
+    assert state.serialize() in caplog.text
+
+
+def test_set_library_log_level_with_unknown_level_name_raises_value_error():
+    with pytest.raises(ValueError):
+        set_library_log_level("verbose")
+
+
+def test_configure_library_logging_from_environment_with_unknown_level_name_logs_a_warning_and_ignores_the_level(
+    monkeypatch: pytest.MonkeyPatch, caplog: LogCaptureFixture
+):
+    monkeypatch.setenv(LOG_LEVEL_ENVIRONMENT_VARIABLE, "verbose")
+    library_logger = logging.getLogger(LIBRARY_LOGGER_NAME)
+    previous_level = library_logger.level
+    with caplog.at_level(logging.WARNING, logger=LIBRARY_LOGGER_NAME):
+        configure_library_logging_from_environment()
+
+    assert library_logger.level == previous_level
+    assert "verbose" in caplog.text
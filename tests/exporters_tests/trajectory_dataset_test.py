@@ -0,0 +1,95 @@
+"""Module test for the packed trajectory dataset."""
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+from pytest import fixture
+
+from pddl_plus_parser.exporters import ColumnarTrajectoryExporter, TrajectoryDataset, TrajectoryExporter
+from pddl_plus_parser.lisp_parsers import DomainParser, ProblemParser, TrajectoryParser
+from pddl_plus_parser.models import Domain, Problem, Observation
+from .consts import TEST_NUMERIC_DOMAIN_PATH, TEST_NUMERIC_PROBLEM_PATH, TEST_NUMERIC_PLAN_PATH
+
+
+@fixture()
+def numeric_domain() -> Domain:
+    return DomainParser(TEST_NUMERIC_DOMAIN_PATH).parse_domain()
+
+
+@fixture()
+def numeric_problem(numeric_domain: Domain) -> Problem:
+    return ProblemParser(problem_path=TEST_NUMERIC_PROBLEM_PATH, domain=numeric_domain).parse_problem()
+
+
+@fixture()
+def observations(numeric_domain: Domain, numeric_problem: Problem) -> List[Observation]:
+    triplets = TrajectoryExporter(domain=numeric_domain).parse_plan(numeric_problem, TEST_NUMERIC_PLAN_PATH)
+    trajectory_parser = TrajectoryParser(numeric_domain, numeric_problem)
+    full_observation = trajectory_parser.parse_trajectory(
+        trajectory_string="".join(TrajectoryExporter.export(triplets))
+    )
+    partial_observation = trajectory_parser.parse_trajectory(
+        trajectory_string="".join(TrajectoryExporter.export(triplets[:4]))
+    )
+    return [full_observation, Observation(), partial_observation]
+
+
+@fixture()
+def dataset(observations: List[Observation], tmp_path: Path) -> TrajectoryDataset:
+    return TrajectoryDataset.create(tmp_path / "dataset", observations, ["full", "empty", "partial"])
+
+
+def test_create_stores_the_offsets_of_the_trajectories(observations: List[Observation], dataset: TrajectoryDataset):
+    assert len(dataset) == 3
+    assert dataset.trajectory_names == ["full", "empty", "partial"]
+    assert [dataset.get_num_transitions(index) for index in range(3)] == [len(obs) for obs in observations]
+
+
+def test_get_trajectory_returns_same_arrays_as_the_columnar_exporter_with_the_dataset_vocabularies(
+    observations: List[Observation], dataset: TrajectoryDataset
+):
+    columnar_exporter = ColumnarTrajectoryExporter(
+        dataset.fluent_names, dataset.fact_names, dataset.action_names, dataset.object_names
+    )
+    for trajectory_index in [0, 2]:
+        expected_trajectory = columnar_exporter.export_observation(observations[trajectory_index])
+        trajectory = dataset.get_trajectory(trajectory_index)
+        assert np.array_equal(trajectory.previous_fluents, expected_trajectory.previous_fluents)
+        assert np.array_equal(trajectory.next_fluents, expected_trajectory.next_fluents)
+        assert np.array_equal(trajectory.previous_facts, expected_trajectory.previous_facts)
+        assert np.array_equal(trajectory.next_facts, expected_trajectory.next_facts)
+        assert np.array_equal(trajectory.actions, expected_trajectory.actions)
+
+
+def test_get_transition_returns_the_requested_transition(observations: List[Observation], dataset: TrajectoryDataset):
+    component = observations[2].components[3]
+    transition = dataset.get_transition(2, 3)
+    assert len(transition) == 1
+    assert transition.get_action_call(0) == (
+        component.grounded_action_call.name,
+        component.grounded_action_call.parameters,
+    )
+    next_facts = {dataset.fact_names[column] for column in np.flatnonzero(transition.next_facts[0])}
+    assert next_facts == {
+        predicate.untyped_representation
+        for predicates in component.next_state.state_predicates.values()
+        for predicate in predicates
+    }
+
+
+def test_get_transition_with_index_out_of_the_trajectory_raises_index_error(dataset: TrajectoryDataset):
+    with pytest.raises(IndexError):
+        dataset.get_transition(2, 4)
+
+
+def test_reopened_dataset_uses_memory_mapped_arrays(dataset: TrajectoryDataset):
+    reopened_dataset = TrajectoryDataset(dataset.dataset_directory)
+    assert reopened_dataset.fact_names == dataset.fact_names
+    assert isinstance(reopened_dataset.get_trajectory(0).next_fluents, np.memmap)
+    assert np.array_equal(reopened_dataset.get_trajectory(0).next_facts, dataset.get_trajectory(0).next_facts)
+
+
+def test_create_with_wrong_number_of_names_raises_value_error(observations: List[Observation], tmp_path: Path):
+    with pytest.raises(ValueError):
+        TrajectoryDataset.create(tmp_path / "dataset", observations, ["full"])
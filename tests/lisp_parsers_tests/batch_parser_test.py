@@ -0,0 +1,149 @@
+import os
+import pickle
+import shutil
+from pathlib import Path
+
+from pytest import fixture, MonkeyPatch
+
+from pddl_plus_parser.lisp_parsers import BatchParser, DomainParser, TrajectoryParser, ProblemParser
+from pddl_plus_parser.lisp_parsers import batch_parser as batch_parser_module
+from pddl_plus_parser.models import Domain, Problem, Observation
+from tests.lisp_parsers_tests.consts import (
+    TEST_NUMERIC_DEPOT_DOMAIN,
+    TEST_NUMERIC_DEPOT_PROBLEM,
+    TEST_NUMERIC_DEPOT_TRAJECTORY,
+)
+
+
+def _parse_problem_file_or_crash(problem_path: Path):
+    if problem_path.name == "pfile1.pddl":
+        os._exit(1)
+
+    return batch_parser_module._parse_problem_file(problem_path)
+
+
+@fixture()
+def depot_domain() -> Domain:
+    return DomainParser(TEST_NUMERIC_DEPOT_DOMAIN).parse_domain()
+
+
+@fixture()
+def batch_parser(depot_domain: Domain) -> BatchParser:
+    return BatchParser(depot_domain, max_workers=2)
+
+
+@fixture()
+def problems_directory(tmp_path: Path) -> Path:
+    for index in range(3):
+        shutil.copy(TEST_NUMERIC_DEPOT_PROBLEM, tmp_path / f"pfile{index}.pddl")
+
+    return tmp_path
+
+
+def test_parse_problems_with_directory_returns_problems_in_sorted_order(
+    batch_parser: BatchParser, problems_directory: Path
+):
+    results = batch_parser.parse_problems(problems_directory)
+    assert [result.file_path.name for result in results] == ["pfile0.pddl", "pfile1.pddl", "pfile2.pddl"]
+    assert all(result.is_successful for result in results)
+    assert all(isinstance(result.result, Problem) for result in results)
+
+
+def test_parse_problems_with_list_of_files_returns_results_in_input_order(
+    batch_parser: BatchParser, problems_directory: Path
+):
+    problem_paths = [problems_directory / "pfile2.pddl", problems_directory / "pfile0.pddl"]
+    results = batch_parser.parse_problems(problem_paths)
+    assert [result.file_path for result in results] == problem_paths
+
+
+def test_parse_problems_with_glob_pattern_returns_matching_problems(
+    batch_parser: BatchParser, problems_directory: Path
+):
+    results = batch_parser.parse_problems(str(problems_directory / "pfile[12].pddl"))
+    assert [result.file_path.name for result in results] == ["pfile1.pddl", "pfile2.pddl"]
+
+
+def test_parse_problems_returns_problems_referencing_the_input_domain(
+    batch_parser: BatchParser, depot_domain: Domain, problems_directory: Path
+):
+    problem = batch_parser.parse_problems(problems_directory)[0].result
+    assert problem.domain is depot_domain
+    for problem_object in problem.objects.values():
+        assert problem_object.type is depot_domain.types[problem_object.type.name]
+
+
+def test_parse_problems_returns_same_problem_as_sequential_parsing(
+    batch_parser: BatchParser, depot_domain: Domain, problems_directory: Path
+):
+    parsed_problem = ProblemParser(TEST_NUMERIC_DEPOT_PROBLEM, depot_domain).parse_problem()
+    problem = batch_parser.parse_problems(problems_directory)[0].result
+    assert problem.objects.keys() == parsed_problem.objects.keys()
+    assert {name: fluent.value for name, fluent in problem.initial_state_fluents.items()} == {
+        name: fluent.value for name, fluent in parsed_problem.initial_state_fluents.items()
+    }
+
+
+def test_parse_problems_when_a_file_is_invalid_reports_the_error_and_parses_the_other_files(
+    batch_parser: BatchParser, problems_directory: Path
+):
+    (problems_directory / "pfile1.pddl").write_text("(define (problem broken) (:domain depot)")
+    results = batch_parser.parse_problems(problems_directory)
+    assert [result.is_successful for result in results] == [True, False, True]
+    assert results[1].result is None
+    assert results[1].error is not None
+
+
+def test_parse_problems_when_a_result_cannot_be_deserialized_reports_the_error_and_keeps_the_other_files(
+    batch_parser: BatchParser, problems_directory: Path, monkeypatch: MonkeyPatch
+):
+    original_load = batch_parser_module.load_with_domain_references
+    loaded_results = []
+
+    def load_or_fail(serialized_object: bytes, domain: Domain):
+        loaded_results.append(serialized_object)
+        if len(loaded_results) == 2:
+            raise pickle.UnpicklingError("corrupted result")
+
+        return original_load(serialized_object, domain)
+
+    monkeypatch.setattr(batch_parser_module, "load_with_domain_references", load_or_fail)
+    results = batch_parser.parse_problems(problems_directory)
+    assert len(results) == 3
+    assert [result.is_successful for result in results].count(False) == 1
+    failed_result = next(result for result in results if not result.is_successful)
+    assert "UnpicklingError" in failed_result.error
+    assert all(isinstance(result.result, Problem) for result in results if result.is_successful)
+
+
+def test_parse_problems_when_a_worker_crashes_reports_the_error_for_every_unparsed_file(
+    depot_domain: Domain, problems_directory: Path, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setattr(batch_parser_module, "_parse_problem_file", _parse_problem_file_or_crash)
+    results = BatchParser(depot_domain, max_workers=1).parse_problems(problems_directory)
+    assert [result.file_path.name for result in results] == ["pfile0.pddl", "pfile1.pddl", "pfile2.pddl"]
+    assert not results[1].is_successful
+    assert "BrokenProcessPool" in results[1].error
+    assert all(isinstance(result.result, Problem) or result.error is not None for result in results)
+
+
+def test_parse_trajectories_with_problems_directory_returns_observations(
+    batch_parser: BatchParser, depot_domain: Domain, tmp_path: Path
+):
+    shutil.copy(TEST_NUMERIC_DEPOT_PROBLEM, tmp_path / "pfile2.pddl")
+    shutil.copy(TEST_NUMERIC_DEPOT_TRAJECTORY, tmp_path / "pfile2.trajectory")
+    problem = ProblemParser(TEST_NUMERIC_DEPOT_PROBLEM, depot_domain).parse_problem()
+    expected_observation = TrajectoryParser(depot_domain, problem).parse_trajectory(TEST_NUMERIC_DEPOT_TRAJECTORY)
+    results = batch_parser.parse_trajectories(tmp_path, problems_directory=tmp_path)
+    assert len(results) == 1
+    observation = results[0].result
+    assert isinstance(observation, Observation)
+    assert len(observation.components) == len(expected_observation.components)
+    assert observation.grounded_objects.keys() == expected_observation.grounded_objects.keys()
+
+
+def test_parse_trajectories_when_problem_is_missing_reports_the_error(batch_parser: BatchParser, tmp_path: Path):
+    shutil.copy(TEST_NUMERIC_DEPOT_TRAJECTORY, tmp_path / "pfile2.trajectory")
+    results = batch_parser.parse_trajectories(tmp_path, problems_directory=tmp_path / "missing")
+    assert not results[0].is_successful
+    assert "FileNotFoundError" in results[0].error
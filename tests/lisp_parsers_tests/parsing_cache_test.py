@@ -0,0 +1,101 @@
+import pickle
+from pathlib import Path
+
+from pytest import fixture
+
+from pddl_plus_parser.lisp_parsers import ParsingCache, DomainParser, ProblemParser
+from pddl_plus_parser.models import Domain, PDDLType
+from tests.lisp_parsers_tests.consts import TEST_NUMERIC_DEPOT_DOMAIN, TEST_NUMERIC_DEPOT_PROBLEM
+
+
+@fixture()
+def parsing_cache(tmp_path: Path) -> ParsingCache:
+    return ParsingCache(tmp_path / "cache")
+
+
+@fixture()
+def depot_domain() -> Domain:
+    return DomainParser(TEST_NUMERIC_DEPOT_DOMAIN).parse_domain()
+
+
+def test_parse_domain_when_domain_is_not_cached_creates_cache_entry(parsing_cache: ParsingCache):
+    parsing_cache.parse_domain(TEST_NUMERIC_DEPOT_DOMAIN)
+    assert len(list(parsing_cache.cache_directory.glob("domain-*.pkl"))) == 1
+
+
+def test_parse_domain_when_domain_is_cached_returns_equivalent_domain_without_parsing(
+    parsing_cache: ParsingCache, depot_domain: Domain
+):
+    parsing_cache.parse_domain(TEST_NUMERIC_DEPOT_DOMAIN)
+    cached_domain = parsing_cache.parse_domain(TEST_NUMERIC_DEPOT_DOMAIN)
+    assert cached_domain.to_pddl() == depot_domain.to_pddl()
+    assert len(list(parsing_cache.cache_directory.glob("domain-*.pkl"))) == 1
+
+
+def test_parse_domain_when_file_content_changes_creates_new_cache_entry(parsing_cache: ParsingCache, tmp_path: Path):
+    domain_path = tmp_path / "domain.pddl"
+    domain_path.write_text(TEST_NUMERIC_DEPOT_DOMAIN.read_text())
+    parsing_cache.parse_domain(domain_path)
+    domain_path.write_text(TEST_NUMERIC_DEPOT_DOMAIN.read_text().replace("(:action Drive", "(:action Move"))
+    changed_domain = parsing_cache.parse_domain(domain_path)
+    assert "move" in changed_domain.actions
+    assert "drive" not in changed_domain.actions
+    assert len(list(parsing_cache.cache_directory.glob("domain-*.pkl"))) == 2
+
+
+def test_parse_domain_when_cache_entry_is_corrupted_parses_the_domain_again(
+    parsing_cache: ParsingCache, depot_domain: Domain
+):
+    parsing_cache.parse_domain(TEST_NUMERIC_DEPOT_DOMAIN)
+    cache_path = next(parsing_cache.cache_directory.glob("domain-*.pkl"))
+    cache_path.write_bytes(b"corrupted")
+    domain = parsing_cache.parse_domain(TEST_NUMERIC_DEPOT_DOMAIN)
+    assert domain.to_pddl() == depot_domain.to_pddl()
+    with open(cache_path, "rb") as cache_file:
+        assert isinstance(pickle.load(cache_file), Domain)
+
+
+def test_parse_problem_when_problem_is_cached_returns_problem_referencing_the_input_domain(
+    parsing_cache: ParsingCache, depot_domain: Domain
+):
+    parsing_cache.parse_problem(TEST_NUMERIC_DEPOT_PROBLEM, depot_domain)
+    cached_problem = parsing_cache.parse_problem(TEST_NUMERIC_DEPOT_PROBLEM, depot_domain)
+    assert cached_problem.domain is depot_domain
+    for problem_object in cached_problem.objects.values():
+        assert problem_object.type is depot_domain.types[problem_object.type.name]
+
+
+def test_parse_problem_when_problem_is_cached_returns_equivalent_problem(
+    parsing_cache: ParsingCache, depot_domain: Domain
+):
+    parsed_problem = ProblemParser(TEST_NUMERIC_DEPOT_PROBLEM, depot_domain).parse_problem()
+    parsing_cache.parse_problem(TEST_NUMERIC_DEPOT_PROBLEM, depot_domain)
+    cached_problem = parsing_cache.parse_problem(TEST_NUMERIC_DEPOT_PROBLEM, depot_domain)
+    assert cached_problem.objects.keys() == parsed_problem.objects.keys()
+    assert {
+        name: {predicate.untyped_representation for predicate in predicates}
+        for name, predicates in cached_problem.initial_state_predicates.items()
+    } == {
+        name: {predicate.untyped_representation for predicate in predicates}
+        for name, predicates in parsed_problem.initial_state_predicates.items()
+    }
+    assert {name: fluent.value for name, fluent in cached_problem.initial_state_fluents.items()} == {
+        name: fluent.value for name, fluent in parsed_problem.initial_state_fluents.items()
+    }
+
+
+def test_parse_problem_with_different_domain_creates_new_cache_entry(
+    parsing_cache: ParsingCache, depot_domain: Domain
+):
+    parsing_cache.parse_problem(TEST_NUMERIC_DEPOT_PROBLEM, depot_domain)
+    extended_domain = DomainParser(TEST_NUMERIC_DEPOT_DOMAIN).parse_domain()
+    extended_domain.types["pallet_jack"] = PDDLType(name="pallet_jack", parent=extended_domain.types["object"])
+    parsing_cache.parse_problem(TEST_NUMERIC_DEPOT_PROBLEM, extended_domain)
+    assert len(list(parsing_cache.cache_directory.glob("problem-*.pkl"))) == 2
+
+
+def test_clear_removes_all_cache_entries(parsing_cache: ParsingCache, depot_domain: Domain):
+    parsing_cache.parse_domain(TEST_NUMERIC_DEPOT_DOMAIN)
+    parsing_cache.parse_problem(TEST_NUMERIC_DEPOT_PROBLEM, depot_domain)
+    parsing_cache.clear()
+    assert list(parsing_cache.cache_directory.iterdir()) == []
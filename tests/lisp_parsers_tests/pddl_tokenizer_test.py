@@ -1,3 +1,5 @@
+import pytest
+
 from pddl_plus_parser.lisp_parsers import PDDLTokenizer
 from tests.lisp_parsers_tests.consts import TEST_NUMERIC_PROBLEM
 
@@ -76,3 +78,80 @@ def test_parse_simple_existential_expression():
 def test_parse_problem():
     test_problem_tokenizer = PDDLTokenizer(file_path=TEST_NUMERIC_PROBLEM)
     print(test_problem_tokenizer.parse())
+
+
+def test_streaming_parse_returns_same_expression_as_regular_parse_for_pddl_string():
+    test_action_str = """(do-spray-varnish ; a comment that should be ignored
+    	:parameters   (?m - spray-varnisher ?x - part)
+    ; a full comment line
+    	:precondition (AND (available ?x) (has-colour ?m ?newcolour))
+    	:effect       (and (treatment ?x varnished)))"""
+    expected_tokens = PDDLTokenizer(pddl_str=test_action_str).parse()
+    streamed_tokens = PDDLTokenizer(pddl_str=test_action_str, streaming=True).parse()
+    assert streamed_tokens == expected_tokens
+
+
+def test_streaming_parse_returns_same_expression_as_regular_parse_for_problem_file():
+    expected_tokens = PDDLTokenizer(file_path=TEST_NUMERIC_PROBLEM).parse()
+    streamed_tokens = PDDLTokenizer(file_path=TEST_NUMERIC_PROBLEM, streaming=True).parse()
+    assert streamed_tokens == expected_tokens
+
+
+def test_streaming_tokenizer_does_not_read_the_file_on_initialization():
+    tokenizer = PDDLTokenizer(file_path=TEST_NUMERIC_PROBLEM, streaming=True)
+    assert tokenizer.pddl_file_content is None
+
+
+def test_iter_tokens_returns_same_tokens_as_tokenize():
+    tokenizer = PDDLTokenizer(file_path=TEST_NUMERIC_PROBLEM)
+    assert list(tokenizer.iter_tokens()) == list(tokenizer.tokenize())
+
+
+def test_streaming_parse_with_unbalanced_parentheses_raises_syntax_error():
+    with pytest.raises(SyntaxError):
+        PDDLTokenizer(pddl_str="(and (at ?x)", streaming=True).parse()
+
+
+def test_streaming_parse_with_empty_content_raises_syntax_error():
+    with pytest.raises(SyntaxError):
+        PDDLTokenizer(pddl_str="; only a comment", streaming=True).parse()
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_parse_deeply_nested_expression_does_not_raise_recursion_error(streaming: bool):
+    nesting_depth = 100000
+    test_expression = "(+ " * nesting_depth + "1" + ")" * nesting_depth
+    expression = PDDLTokenizer(pddl_str=test_expression, streaming=streaming).parse()
+    for _ in range(nesting_depth - 1):
+        assert expression[0] == "+"
+        expression = expression[1]
+
+    assert expression == ["+", "1"]
+
+
+def test_read_from_tokens_consumes_only_the_first_expression():
+    tokenizer = PDDLTokenizer(pddl_str="(at ?x) (clear ?y)")
+    tokens = tokenizer.tokenize()
+    assert tokenizer.read_from_tokens(tokens) == ["at", "?x"]
+    assert list(tokens) == ["(", "clear", "?y", ")"]
+
+
+def test_read_from_tokens_with_unexpected_closing_parenthesis_raises_syntax_error():
+    tokenizer = PDDLTokenizer(pddl_str=") (at ?x)")
+    with pytest.raises(SyntaxError):
+        tokenizer.parse()
+
+
+def test_iter_expressions_returns_the_sub_expressions_of_the_outermost_expression():
+    test_trajectory = """((:init (at a b) (= (fuel t1) 1.0))
+    (operator: (move a b c))
+    (:state (at a c)))"""
+    expressions = PDDLTokenizer(pddl_str=test_trajectory, streaming=True).iter_expressions()
+    assert list(expressions) == PDDLTokenizer(pddl_str=test_trajectory).parse()
+
+
+def test_iter_expressions_with_missing_closing_parenthesis_raises_syntax_error():
+    expressions = PDDLTokenizer(pddl_str="((:init (at a b))", streaming=True).iter_expressions()
+    assert next(expressions) == [":init", ["at", "a", "b"]]
+    with pytest.raises(SyntaxError):
+        next(expressions)
@@ -4,7 +4,7 @@ import pytest
 from pytest import fixture
 
 from pddl_plus_parser.lisp_parsers import DomainParser, ProblemParser, TrajectoryParser
-from pddl_plus_parser.models import Domain, Problem, MultiAgentObservation
+from pddl_plus_parser.models import Domain, Problem, MultiAgentObservation, ObservedComponent, MultiAgentComponent
 from tests.lisp_parsers_tests.consts import (
     TEST_NUMERIC_DEPOT_DOMAIN,
     TEST_NUMERIC_DEPOT_PROBLEM,
@@ -252,3 +252,104 @@ def test_parse_trajectory_when_supplied_trajectory_string_parses_correctly(traje
     )
     assert observation is not None
     assert len(observation.components) == 1
+
+
+def test_iter_trajectory_yields_the_same_components_as_parse_trajectory(trajectory_parser: TrajectoryParser):
+    observation = trajectory_parser.parse_trajectory(TEST_NUMERIC_DEPOT_TRAJECTORY)
+    streamed_components = list(trajectory_parser.iter_trajectory(TEST_NUMERIC_DEPOT_TRAJECTORY))
+    assert len(streamed_components) == len(observation.components)
+    for streamed_component, component in zip(streamed_components, observation.components):
+        assert isinstance(streamed_component, ObservedComponent)
+        assert streamed_component.previous_state == component.previous_state
+        assert str(streamed_component.grounded_action_call) == str(component.grounded_action_call)
+        assert streamed_component.next_state == component.next_state
+
+
+def test_iter_trajectory_is_lazy_and_yields_the_first_component_before_reading_the_rest(
+    trajectory_parser: TrajectoryParser,
+):
+    components_iterator = trajectory_parser.iter_trajectory(TEST_NUMERIC_DEPOT_TRAJECTORY)
+    first_component = next(components_iterator)
+    assert str(first_component.grounded_action_call) == "(drive truck0 depot0 distributor0)"
+
+
+def test_iter_trajectory_with_transition_labels_yields_components_with_transition_statuses(domain: Domain):
+    depot_trajectory_parser = TrajectoryParser(domain)
+    components = list(
+        depot_trajectory_parser.iter_trajectory(
+            TEST_NUMERIC_DEPOT_TRAJECTORY_WITH_LABELS, contain_transitions_status=True
+        )
+    )
+    assert components[0].is_successful
+    assert not components[1].is_successful
+
+
+def test_iter_trajectory_with_executing_agents_yields_multi_agent_components(
+    ma_trajectory_parser: TrajectoryParser,
+):
+    components = list(
+        ma_trajectory_parser.iter_trajectory(
+            WOODWORKING_COMBINED_TRAJECTORY_PATH, executing_agents=WOODWORKING_AGENT_NAMES
+        )
+    )
+    assert len(components) == 4
+    assert all(isinstance(component, MultiAgentComponent) for component in components)
+
+
+def test_iter_trajectory_when_trajectory_is_missing_the_last_state_raises_syntax_error(
+    trajectory_parser: TrajectoryParser,
+):
+    trajectory_string = "((:init (at truck0 depot0)) (operator: (drive truck0 depot0 distributor0)))"
+    components_iterator = trajectory_parser.iter_trajectory(trajectory_string=trajectory_string)
+    with pytest.raises(SyntaxError):
+        next(components_iterator)
+
+
+def test_parse_trajectory_shares_interned_grounded_predicates_between_parsed_states(
+    trajectory_parser: TrajectoryParser,
+):
+    observation = trajectory_parser.parse_trajectory(TEST_NUMERIC_DEPOT_TRAJECTORY)
+    first_state_facts = {
+        predicate.untyped_representation: predicate
+        for predicates in observation.components[0].next_state.state_predicates.values()
+        for predicate in predicates
+    }
+    for predicates in observation.components[1].next_state.state_predicates.values():
+        for predicate in predicates:
+            if predicate.untyped_representation in first_state_facts:
+                assert predicate is first_state_facts[predicate.untyped_representation]
+
+
+def test_parse_trajectory_with_delta_encoded_states_applies_the_changes_on_the_previous_state(
+    trajectory_parser: TrajectoryParser,
+):
+    trajectory_string = (
+        "((:init (= (current_load truck0) 0.0) (= (fuel-cost ) 0.0) (at truck0 depot0) (at crate0 depot0) "
+        "(clear crate0))"
+        "(operator: (drive truck0 depot0 distributor0))"
+        "(:delta (:add (at truck0 distributor0)) (:delete (at truck0 depot0)) (:fluents (= (fuel-cost ) 10.0)))"
+        "(operator: (drive truck0 distributor0 depot0))"
+        "(:delta (:add (at truck0 depot0)) (:delete (at truck0 distributor0)) (:fluents (= (fuel-cost ) 20.0))))"
+    )
+    observation = trajectory_parser.parse_trajectory(trajectory_string=trajectory_string)
+    assert len(observation) == 2
+    first_state = observation.components[0].next_state
+    second_state = observation.components[1].next_state
+    assert "(at truck0 distributor0)" in first_state.serialize()
+    assert "(at truck0 depot0)" not in first_state.serialize()
+    assert first_state.state_fluents["(fuel-cost )"].value == 10.0
+    assert observation.components[1].previous_state == first_state
+    assert "(at truck0 depot0)" in second_state.serialize()
+    assert "(at truck0 distributor0)" not in second_state.serialize()
+    assert second_state.state_fluents["(fuel-cost )"].value == 20.0
+    assert observation.components[0].previous_state.state_fluents["(fuel-cost )"].value == 0.0
+
+
+def test_parse_trajectory_with_illegal_delta_section_raises_syntax_error(trajectory_parser: TrajectoryParser):
+    trajectory_string = (
+        "((:init (at truck0 depot0))"
+        "(operator: (drive truck0 depot0 distributor0))"
+        "(:delta (:replace (at truck0 distributor0))))"
+    )
+    with pytest.raises(SyntaxError):
+        trajectory_parser.parse_trajectory(trajectory_string=trajectory_string)
@@ -0,0 +1,86 @@
+import numpy as np
+from anytree import AnyNode
+
+from pddl_plus_parser.models import construct_expression_tree, PDDLFunction, PDDLType, evaluate_expression, \
+    NumericalExpressionTree, State, create_fluents_matrix, compile_batch_expression, evaluate_batch
+
+COMPLEX_EXPRESSION = ['>=', ['-', ['capacity', '?jug2'], ['amount', '?jug2']], ['amount', '?jug1']]
+ASSIGNMENT_EXPRESSION = ['increase', ['amount', '?jug1'], ['*', ['amount', '?jug2'], '2']]
+TEST_FLUENT_NAMES = ["(capacity ?jug2)", "(amount ?jug2)", "(amount ?jug1)"]
+
+TEST_DOMAIN_FUNCTIONS = {
+    "capacity": PDDLFunction(name="capacity", signature={"?jug": PDDLType(name="jug")}),
+    "amount": PDDLFunction(name="amount", signature={"?jug": PDDLType(name="jug")})
+}
+
+
+def _evaluate_single_state(expression_node: AnyNode, fluent_values: np.ndarray) -> float:
+    for node in NumericalExpressionTree(expression_node):
+        if node.is_leaf and isinstance(node.value, PDDLFunction):
+            node.value.set_value(fluent_values[TEST_FLUENT_NAMES.index(node.value.untyped_representation)])
+
+    return evaluate_expression(expression_node)
+
+
+def test_evaluate_batch_with_comparison_returns_same_values_as_single_state_evaluation():
+    expression_node = construct_expression_tree(COMPLEX_EXPRESSION, TEST_DOMAIN_FUNCTIONS)
+    fluents_matrix = np.random.default_rng(42).uniform(-10, 10, size=(200, len(TEST_FLUENT_NAMES)))
+    batch_values = evaluate_batch(expression_node, fluents_matrix, TEST_FLUENT_NAMES)
+    assert batch_values.dtype == bool
+    assert batch_values.tolist() == [_evaluate_single_state(expression_node, row) for row in fluents_matrix]
+
+
+def test_evaluate_batch_with_comparison_uses_epsilon_semantics():
+    expression_node = construct_expression_tree(COMPLEX_EXPRESSION, TEST_DOMAIN_FUNCTIONS)
+    fluents_matrix = np.array([[10.0, 5.0, 5.00001], [10.0, 5.0, 5.1], [10.0, 5.0, 4.9]])
+    batch_values = evaluate_batch(expression_node, fluents_matrix, TEST_FLUENT_NAMES)
+    assert batch_values.tolist() == [True, False, True]
+
+
+def test_evaluate_batch_with_missing_fluent_values_returns_false():
+    equality_node = construct_expression_tree(["!=", ["amount", "?jug1"], ["amount", "?jug2"]], TEST_DOMAIN_FUNCTIONS)
+    fluents_matrix = np.array([[1.0, 2.0, np.nan], [1.0, 2.0, 3.0]])
+    batch_values = evaluate_batch(equality_node, fluents_matrix, TEST_FLUENT_NAMES)
+    assert batch_values.tolist() == [False, True]
+
+
+def test_evaluate_batch_with_calculation_returns_calculated_values():
+    expression_node = construct_expression_tree(COMPLEX_EXPRESSION, TEST_DOMAIN_FUNCTIONS)
+    fluents_matrix = np.array([[10.0, 5.0, 1.0], [7.0, 2.5, 1.0]])
+    batch_values = evaluate_batch(expression_node.children[0], fluents_matrix, TEST_FLUENT_NAMES)
+    assert batch_values.tolist() == [5.0, 4.5]
+
+
+def test_evaluate_batch_with_assignment_returns_the_assigned_values():
+    expression_node = construct_expression_tree(ASSIGNMENT_EXPRESSION, TEST_DOMAIN_FUNCTIONS)
+    fluents_matrix = np.array([[0.0, 2.0, 1.0], [0.0, -1.0, 3.0]])
+    batch_values = evaluate_batch(expression_node, fluents_matrix, TEST_FLUENT_NAMES)
+    expected_values = []
+    for row in fluents_matrix:
+        expected_values.append(_evaluate_single_state(expression_node, row).value)
+
+    assert batch_values.tolist() == expected_values
+
+
+def test_compile_batch_expression_can_be_reused_on_multiple_matrices():
+    expression_node = construct_expression_tree(COMPLEX_EXPRESSION, TEST_DOMAIN_FUNCTIONS)
+    compiled_expression = compile_batch_expression(NumericalExpressionTree(expression_node), TEST_FLUENT_NAMES)
+    assert compiled_expression(np.array([[10.0, 5.0, 1.0]])).tolist() == [True]
+    assert compiled_expression(np.array([[10.0, 5.0, 6.0], [1.0, 1.0, -1.0]])).tolist() == [False, True]
+
+
+def test_create_fluents_matrix_extracts_fluent_values_and_marks_missing_fluents_as_nan():
+    jug_type = PDDLType(name="jug")
+    amount_jug1 = PDDLFunction(name="amount", signature={"jug1": jug_type})
+    amount_jug1.set_value(3.0)
+    amount_jug2 = PDDLFunction(name="amount", signature={"jug2": jug_type})
+    amount_jug2.set_value(4.0)
+    states = [
+        State(predicates={}, fluents={"(amount jug1)": amount_jug1, "(amount jug2)": amount_jug2}),
+        State(predicates={}, fluents={"(amount jug1)": amount_jug1}),
+    ]
+    fluents_matrix = create_fluents_matrix(states, ["(amount jug1)", "(amount jug2)"])
+    assert fluents_matrix.shape == (2, 2)
+    assert fluents_matrix[0].tolist() == [3.0, 4.0]
+    assert fluents_matrix[1, 0] == 3.0
+    assert np.isnan(fluents_matrix[1, 1])
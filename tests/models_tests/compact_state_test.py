@@ -0,0 +1,125 @@
+from pytest import fixture, raises
+
+from pddl_plus_parser.lisp_parsers import ProblemParser, DomainParser
+from pddl_plus_parser.models import Domain, Problem, State, FactIndex, CompactState
+from tests.models_tests.consts import TEST_NUMERIC_DOMAIN, TEST_NUMERIC_PROBLEM
+
+
+@fixture()
+def agricola_domain() -> Domain:
+    domain_parser = DomainParser(TEST_NUMERIC_DOMAIN)
+    return domain_parser.parse_domain()
+
+
+@fixture()
+def agricola_problem(agricola_domain: Domain) -> Problem:
+    return ProblemParser(problem_path=TEST_NUMERIC_PROBLEM, domain=agricola_domain).parse_problem()
+
+
+@fixture()
+def agricola_initial_state(agricola_problem: Problem) -> State:
+    return State(
+        predicates=agricola_problem.initial_state_predicates, fluents=agricola_problem.initial_state_fluents,
+        is_init=True)
+
+
+@fixture()
+def fact_index(agricola_problem: Problem) -> FactIndex:
+    return FactIndex.from_problem(agricola_problem)
+
+
+def test_from_problem_indexes_all_initial_state_facts_and_fluents(agricola_problem: Problem, fact_index: FactIndex):
+    num_initial_facts = sum(len(predicates) for predicates in agricola_problem.initial_state_predicates.values())
+    assert fact_index.num_facts >= num_initial_facts
+    assert fact_index.num_fluents == len(agricola_problem.initial_state_fluents)
+
+
+def test_to_state_after_from_state_returns_state_equal_to_the_original_state(
+        agricola_initial_state: State, fact_index: FactIndex):
+    compact_state = CompactState.from_state(agricola_initial_state, fact_index)
+    converted_state = compact_state.to_state()
+    assert converted_state == agricola_initial_state
+
+
+def test_holds_returns_true_only_for_facts_in_the_state(agricola_initial_state: State, fact_index: FactIndex):
+    compact_state = CompactState.from_state(agricola_initial_state, fact_index)
+    predicate = next(iter(agricola_initial_state.state_predicates["(next_round ?r1 ?r2)"]))
+    assert compact_state.holds(predicate)
+
+    compact_state.remove_fact(predicate)
+    assert not compact_state.holds(predicate)
+    assert len(compact_state) == sum(
+        len(predicates) for predicates in agricola_initial_state.state_predicates.values()) - 1
+
+
+def test_copy_does_not_change_the_original_state_when_modifying_the_copy(
+        agricola_initial_state: State, fact_index: FactIndex):
+    compact_state = CompactState.from_state(agricola_initial_state, fact_index)
+    copied_state = compact_state.copy()
+    assert copied_state == compact_state
+    assert hash(copied_state) == hash(compact_state)
+
+    predicate = next(iter(agricola_initial_state.state_predicates["(next_round ?r1 ?r2)"]))
+    fluent = next(iter(agricola_initial_state.state_fluents.values()))
+    copied_state.remove_fact(predicate)
+    copied_state.set_fluent_value(fluent, fluent.value + 1)
+    assert copied_state != compact_state
+    assert compact_state.holds(predicate)
+    assert compact_state.get_fluent_value(fluent) == fluent.value
+
+
+def test_states_are_equal_after_the_index_grows(agricola_initial_state: State, fact_index: FactIndex):
+    first_state = CompactState.from_state(agricola_initial_state, fact_index)
+    second_state = CompactState.from_state(agricola_initial_state, fact_index)
+    predicate = next(iter(agricola_initial_state.state_predicates["(next_round ?r1 ?r2)"]))
+    new_predicate = predicate.copy()
+    new_predicate.name = "new_fact"
+    second_state.add_fact(new_predicate)
+    assert first_state != second_state
+
+    second_state.remove_fact(new_predicate)
+    assert first_state == second_state
+    assert hash(first_state) == hash(second_state)
+
+
+def test_state_is_found_in_set_after_another_state_grows_the_index(
+        agricola_initial_state: State, fact_index: FactIndex):
+    compact_state = CompactState.from_state(agricola_initial_state, fact_index)
+    states = {compact_state}
+    original_facts = bytes(compact_state.facts)
+    other_state = compact_state.copy()
+    predicate = next(iter(agricola_initial_state.state_predicates["(next_round ?r1 ?r2)"]))
+    for fact_number in range(16):
+        new_predicate = predicate.copy()
+        new_predicate.name = f"new_fact_{fact_number}"
+        other_state.add_fact(new_predicate)
+
+    assert compact_state in states
+    assert compact_state.copy() in states
+    assert bytes(compact_state.facts) == original_facts
+
+
+def test_get_fluent_value_raises_key_error_when_fluent_is_missing_from_state(
+        agricola_problem: Problem, fact_index: FactIndex):
+    compact_state = CompactState(fact_index)
+    fluent = next(iter(agricola_problem.initial_state_fluents.values()))
+    with raises(KeyError):
+        compact_state.get_fluent_value(fluent)
+
+    assert compact_state.to_state().state_fluents == {}
+
+
+def test_states_using_indices_built_in_different_orders_are_not_equal_but_are_equal_as_regular_states(
+        agricola_initial_state: State, fact_index: FactIndex):
+    reversed_fact_index = FactIndex()
+    for predicate in reversed(fact_index.predicates):
+        reversed_fact_index.fact_id(predicate)
+
+    for fluent in reversed(fact_index.fluents):
+        reversed_fact_index.fluent_slot(fluent)
+
+    compact_state = CompactState.from_state(agricola_initial_state, fact_index)
+    reversed_compact_state = CompactState.from_state(agricola_initial_state, reversed_fact_index)
+    assert compact_state != reversed_compact_state
+    assert len({compact_state, reversed_compact_state}) == 2
+    assert compact_state.to_state() == reversed_compact_state.to_state()
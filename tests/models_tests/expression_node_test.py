@@ -0,0 +1,70 @@
+"""Module test for the compact expression node."""
+from anytree import AnyNode, PreOrderIter, RenderTree
+
+from pddl_plus_parser.models import ExpressionNode, NumericalExpressionTree, calculate
+
+
+def create_expression() -> ExpressionNode:
+    return ExpressionNode(id="*", value="*", children=[
+        ExpressionNode(id="+", value="+", children=[ExpressionNode(id="2", value=2), ExpressionNode(id="3", value=3)]),
+        ExpressionNode(id="4", value=4),
+    ])
+
+
+def test_expression_node_sets_the_parent_of_its_children():
+    root = create_expression()
+    assert root.is_root
+    assert all(child.parent is root for child in root.children)
+    assert root.children[0].children[1].root is root
+    assert root.children[0].children[1].depth == 2
+    assert root.height == 2
+
+
+def test_expression_node_can_be_iterated_and_rendered_using_anytree():
+    root = create_expression()
+    assert [node.id for node in PreOrderIter(root)] == ["*", "+", "2", "3", "4"]
+    assert [node.id for node in root.descendants] == ["+", "2", "3", "4"]
+    assert [node.id for _, _, node in RenderTree(root)] == ["*", "+", "2", "3", "4"]
+    assert calculate(root) == 20
+
+
+def test_assigning_children_detaches_the_previous_children_and_moves_the_new_children():
+    root = create_expression()
+    sum_node, number_node = root.children
+    new_root = ExpressionNode(id="-", value="-", children=[number_node])
+    assert number_node.parent is new_root
+    assert root.children == (sum_node,)
+    root.children = [ExpressionNode(id="1", value=1)]
+    assert sum_node.parent is None
+    assert root.is_leaf is False
+
+
+def test_numerical_expression_tree_keeps_any_node_root_as_is():
+    any_node_root = AnyNode(id="+", value="+", children=[AnyNode(id="2", value=2), AnyNode(id="3", value=3)])
+    tree = NumericalExpressionTree(any_node_root)
+    assert tree.root is any_node_root
+    any_node_root.children[1].value = 4
+    assert calculate(tree.root) == 6
+
+
+def test_from_anynode_creates_compact_copy_of_any_node_tree():
+    any_node_root = AnyNode(id="+", value="+", children=[AnyNode(id="2", value=2), AnyNode(id="3", value=3)])
+    tree = NumericalExpressionTree.from_anynode(any_node_root)
+    assert isinstance(tree.root, ExpressionNode)
+    assert [node.id for node in tree] == ["+", "2", "3"]
+    assert str(tree) == str(NumericalExpressionTree(any_node_root))
+    any_node_root.children[1].value = 4
+    assert calculate(tree.root) == 5
+
+
+def test_locate_and_replace_in_any_node_tree_replaces_the_expression_with_any_nodes():
+    any_node_root = AnyNode(id="*", value="*", children=[
+        AnyNode(id="+", value="+", children=[AnyNode(id="2", value=2), AnyNode(id="3", value=3)]),
+        AnyNode(id="4", value=4),
+    ])
+    tree = NumericalExpressionTree(any_node_root)
+    tree.locate_and_replace(
+        NumericalExpressionTree(AnyNode(id="3", value=3)), NumericalExpressionTree(ExpressionNode(id="5", value=5)))
+    assert tree.root is any_node_root
+    assert all(isinstance(node, AnyNode) for node in tree)
+    assert calculate(tree.root) == 28
\ No newline at end of file
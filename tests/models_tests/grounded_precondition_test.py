@@ -670,8 +670,7 @@ def test_is_condition_applicable_when_and_or_combination_then_short_circuits_cor
     gp = GroundedPrecondition(compound, domain, action)
     gp._grounded_precondition = compound
 
-    state = MagicMock()
-    state.serialize.return_value = {pred_true.untyped_representation}
+    state = State(predicates={pred_true.lifted_untyped_representation: {pred_true}}, fluents={})
 
     assert gp.is_applicable(state) is False
 
@@ -698,8 +697,7 @@ def test_is_condition_applicable_when_or_and_combination_then_short_circuits_cor
     gp = GroundedPrecondition(compound, domain, action)
     gp._grounded_precondition = compound
 
-    state = MagicMock()
-    state.serialize.return_value = {pred_true.untyped_representation}
+    state = State(predicates={pred_true.lifted_untyped_representation: {pred_true}}, fluents={})
 
     assert gp.is_applicable(state) is True
 
@@ -726,7 +724,6 @@ def test_is_condition_applicable_when_nested_and_or_conditions_then_short_circui
     gp = GroundedPrecondition(compound, domain, action)
     gp._grounded_precondition = compound
 
-    state = MagicMock()
-    state.serialize.return_value = {pred_true.untyped_representation}
+    state = State(predicates={pred_true.lifted_untyped_representation: {pred_true}}, fluents={})
 
     assert gp.is_applicable(state) is False
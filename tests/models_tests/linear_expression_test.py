@@ -0,0 +1,105 @@
+"""Module test for the linear expression fast path."""
+import pytest
+from pytest import fixture
+
+from pddl_plus_parser.lisp_parsers import PDDLTokenizer, DomainParser
+from pddl_plus_parser.models import construct_expression_tree, Domain, LinearExpression, NumericalExpressionTree
+from pddl_plus_parser.models.numeric_symbolic_operations import simplify_complex_numeric_expression
+from tests.models_tests.consts import DEPOT_NUMERIC_DOMAIN_PATH
+
+
+@fixture()
+def depot_domain() -> Domain:
+    return DomainParser(domain_path=DEPOT_NUMERIC_DOMAIN_PATH).parse_domain()
+
+
+def create_expression_tree(pddl_expression: str, domain: Domain) -> NumericalExpressionTree:
+    return NumericalExpressionTree(
+        construct_expression_tree(PDDLTokenizer(pddl_str=pddl_expression).parse(), domain.functions)
+    )
+
+
+def test_from_expression_node_merges_the_coefficients_of_the_same_function(depot_domain: Domain):
+    tree = create_expression_tree("(+ (* (load_limit ?x) 2) (- (* 3 (load_limit ?x)) (/ (fuel-cost ) 4)))", depot_domain)
+    linear_expression = LinearExpression.from_expression_node(tree.root)
+    assert linear_expression.coefficients == {"(load_limit ?x)": 5.0, "(fuel-cost )": -0.25}
+    assert linear_expression.constant == 0
+
+
+def test_from_expression_node_with_product_of_functions_returns_none(depot_domain: Domain):
+    tree = create_expression_tree("(+ (* (load_limit ?x) (current_load ?x)) 2)", depot_domain)
+    assert LinearExpression.from_expression_node(tree.root) is None
+
+
+def test_from_expression_node_with_division_by_function_returns_none(depot_domain: Domain):
+    tree = create_expression_tree("(/ 2 (current_load ?x))", depot_domain)
+    assert LinearExpression.from_expression_node(tree.root) is None
+
+
+def test_to_pddl_removes_cancelled_functions_and_coefficients_of_one(depot_domain: Domain):
+    tree = create_expression_tree("(- (+ (* (load_limit ?x) 2) (current_load ?x)) (* (load_limit ?x) 2))", depot_domain)
+    assert LinearExpression.from_expression_node(tree.root).to_pddl(decimal_digits=2) == "(current_load ?x)"
+
+
+def test_to_pddl_with_constant_only_returns_the_formatted_constant(depot_domain: Domain):
+    tree = create_expression_tree("(- (+ (load_limit ?x) 2.5) (load_limit ?x))", depot_domain)
+    assert LinearExpression.from_expression_node(tree.root).to_pddl(decimal_digits=2) == "2.50"
+
+
+def test_to_pddl_returns_expression_equivalent_to_the_symbolic_simplification(depot_domain: Domain):
+    expression = "(+ (* (- (load_limit ?x) 12.5) -0.5) (* (+ (current_load ?x) (* (fuel-cost ) 2)) 0.25))"
+    tree = create_expression_tree(expression, depot_domain)
+    linear_expression = LinearExpression.from_expression_node(tree.root)
+    symbolic_expression = create_expression_tree(
+        simplify_complex_numeric_expression(tree.to_mathematical(), decimal_digits=4), depot_domain
+    )
+    assert LinearExpression.from_expression_node(symbolic_expression.root) == linear_expression.normalize(4)
+
+
+def test_simplify_complex_numerical_pddl_expression_with_non_linear_expression_uses_the_symbolic_fallback(
+    depot_domain: Domain,
+):
+    tree = create_expression_tree("(<= (* (load_limit ?x) (* 1.0 (current_load ?x))) 10)", depot_domain)
+    simplified_expression = tree.simplify_complex_numerical_pddl_expression(decimal_digits=2)
+    left_side = NumericalExpressionTree(tree.root.children[0]).to_mathematical()
+    assert simplified_expression == f"(<= {simplify_complex_numeric_expression(left_side, decimal_digits=2)} 10)"
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "(+ (load_limit ?x) (current_load ?x))",
+        "(+ (current_load ?x) (load_limit ?x))",
+        "(+ (fuel-cost ) (+ (current_load ?x) (load_limit ?x)))",
+        "(+ (+ (load_limit ?x) (fuel-cost )) (current_load ?x))",
+        "(+ (+ (current_load ?x) 8.018079) (load_limit ?x))",
+        "(- (+ (load_limit ?x) 2) (current_load ?x))",
+        "(+ (* 2 (load_limit ?x)) (current_load ?x))",
+        "(+ (* 0.00001 (fuel-cost )) 2)",
+        "(+ 2 (* 0.00001 (fuel-cost )))",
+        "(+ (* 0.001 (current_load ?x)) (load_limit ?x))",
+        "(+ (load_limit ?x) 0.00001)",
+        "(* (+ (current_load ?x) 1.0) 9.555)",
+        "(* 0.00001 (- (load_limit ?x) (fuel-cost )))",
+        "(/ (- (load_limit ?x) (fuel-cost )) -0.25)",
+        "(- (* -5.201 (fuel-cost )) (weight ?y))",
+        "(- (+ (+ 3 4) (load_limit ?x)) (* (* (load_limit ?x) 0.25) (- 0.25 0.25)))",
+        "(+ (* (- (load_limit ?x) (load_limit ?x)) 0.5) (load_limit ?x))",
+    ],
+)
+def test_simplify_complex_numerical_pddl_expression_with_linear_expression_matches_the_symbolic_simplification(
+    depot_domain: Domain, expression: str
+):
+    tree = create_expression_tree(f"(<= {expression} 10)", depot_domain)
+    left_side = NumericalExpressionTree(tree.root.children[0]).to_mathematical()
+    symbolic_simplification = simplify_complex_numeric_expression(left_side, decimal_digits=4)
+    assert tree.simplify_complex_numerical_pddl_expression(decimal_digits=4) == f"(<= {symbolic_simplification} 10)"
+
+
+def test_to_pddl_prints_equal_expressions_written_in_different_orders_the_same(depot_domain: Domain):
+    first_tree = create_expression_tree("(+ (* (load_limit ?x) 2) (+ (current_load ?x) (fuel-cost )))", depot_domain)
+    second_tree = create_expression_tree("(+ (fuel-cost ) (+ (current_load ?x) (* 2 (load_limit ?x))))", depot_domain)
+    assert (
+        LinearExpression.from_expression_node(first_tree.root).to_pddl()
+        == LinearExpression.from_expression_node(second_tree.root).to_pddl()
+    )
@@ -3,7 +3,7 @@ from anytree import RenderTree, PreOrderIter, AnyNode
 
 from pddl_plus_parser.lisp_parsers import PDDLTokenizer, DomainParser
 from pddl_plus_parser.models import construct_expression_tree, PDDLFunction, PDDLType, calculate, evaluate_expression, \
-    NumericalExpressionTree
+    NumericalExpressionTree, evaluate, calculate_value
 from pddl_plus_parser.models.numerical_expression import COMPARISON_OPERATORS
 from tests.models_tests.consts import ZENO_DOMAIN_PATH, DEPOT_NUMERIC_DOMAIN_PATH
 
@@ -407,3 +407,49 @@ def test_change_signature_changes_the_parameter_names_correctly_and_returns_the_
     tree.change_signature(old_to_new_signature)
     assert "(<= (+ (+ (+ (* (load_limit ?param_0) -0.71) (* (current_load ?param_0) -0.71)) (* (fuel-cost ) 0.01)) 58.22) 3657.14)" == tree.to_pddl(
         decimal_digits=2)
+
+
+def test_evaluate_with_comparison_returns_correct_result_and_does_not_change_tree_leaves():
+    node_tree = construct_expression_tree(COMPLEX_EXPRESSION, TEST_DOMAIN_FUNCTIONS)
+    fluent_values = {"(capacity ?jug2)": 10.0, "(amount ?jug2)": 5.0, "(amount ?jug1)": 4.0}
+    assert evaluate(node_tree, fluent_values)
+    assert not evaluate(NumericalExpressionTree(node_tree), {**fluent_values, "(amount ?jug1)": 6.0})
+    assert all(node.value.value == 0 for node in PreOrderIter(node_tree)
+               if node.is_leaf and isinstance(node.value, PDDLFunction))
+
+
+def test_evaluate_with_assignment_returns_new_value_without_changing_the_assigned_fluent():
+    node_tree = construct_expression_tree(
+        ['increase', ['amount', '?jug1'], ['amount', '?jug2']], TEST_DOMAIN_FUNCTIONS)
+    amount_jug1 = PDDLFunction(name="amount", signature={"?jug1": PDDLType(name="jug")})
+    amount_jug1.set_value(2.0)
+    assert evaluate(node_tree, {"(amount ?jug1)": amount_jug1, "(amount ?jug2)": 3.5}) == 5.5
+    assert amount_jug1.value == 2.0
+    assert node_tree.children[0].value.value == 0
+
+
+def test_evaluate_with_array_of_values_uses_the_fluent_indices():
+    node_tree = construct_expression_tree(COMPLEX_EXPRESSION, TEST_DOMAIN_FUNCTIONS)
+    fluent_indices = {"(capacity ?jug2)": 0, "(amount ?jug2)": 1, "(amount ?jug1)": 2}
+    assert evaluate(node_tree.children[0], [10.0, 4.0, 1.0], fluent_indices) == 6.0
+    assert evaluate(node_tree, [10.0, 4.0, 6.0], fluent_indices)
+    assert calculate_value(node_tree.children[0], [3.0, 1.0, 0.0], fluent_indices) == 2.0
+
+
+def test_evaluate_raises_key_error_when_a_fluent_value_is_missing():
+    node_tree = construct_expression_tree(COMPLEX_EXPRESSION, TEST_DOMAIN_FUNCTIONS)
+    with pytest.raises(KeyError):
+        evaluate(node_tree, {"(capacity ?jug2)": 10.0, "(amount ?jug2)": 5.0})
+
+
+def test_key_of_copied_expression_equals_the_key_of_the_original_expression():
+    tree = NumericalExpressionTree(construct_expression_tree(COMPLEX_EXPRESSION, TEST_DOMAIN_FUNCTIONS))
+    assert tree.key == (">=", ("-", ("capacity", ("?jug2",)), ("amount", ("?jug2",))), ("amount", ("?jug1",)))
+    assert tree.__copy__().key == tree.key
+
+
+def test_key_is_reset_when_changing_the_signature_of_the_expression():
+    tree = NumericalExpressionTree(construct_expression_tree(SIMPLE_EXPRESSION, TEST_DOMAIN_FUNCTIONS))
+    assert tree.key == ("assign", ("amount", ("?jug1",)), 0.0)
+    tree.change_signature({"?jug1": "?param_0"})
+    assert tree.key == ("assign", ("amount", ("?param_0",)), 0.0)
@@ -0,0 +1,90 @@
+"""Module test for the operator cache."""
+from pytest import fixture
+
+from pddl_plus_parser.lisp_parsers import DomainParser, ProblemParser
+from pddl_plus_parser.models import Domain, Problem, Operator, OperatorCache, State
+from tests.models_tests.consts import NURIKABE_DOMAIN_PATH, NURIKABE_PROBLEM_PATH
+
+NURIKABE_START_PAINTING_CALL = ["pos-0-0", "g0", "n1", "n0"]
+NURIKABE_MOVE_PAINTING_CALL = ["pos-2-0", "pos-3-0", "g1", "n1", "n0"]
+
+
+@fixture()
+def nurikabe_domain() -> Domain:
+    return DomainParser(NURIKABE_DOMAIN_PATH).parse_domain()
+
+
+@fixture()
+def nurikabe_problem(nurikabe_domain: Domain) -> Problem:
+    return ProblemParser(problem_path=NURIKABE_PROBLEM_PATH, domain=nurikabe_domain).parse_problem()
+
+
+@fixture()
+def operator_cache(nurikabe_domain: Domain, nurikabe_problem: Problem) -> OperatorCache:
+    return OperatorCache(nurikabe_domain, problem_objects=nurikabe_problem.objects, max_size=2)
+
+
+def test_get_operator_returns_same_operator_when_called_twice_with_the_same_action(operator_cache: OperatorCache):
+    first_operator = operator_cache.get_operator("start-painting", NURIKABE_START_PAINTING_CALL)
+    second_operator = operator_cache.get_operator("start-painting", list(NURIKABE_START_PAINTING_CALL))
+    assert first_operator is second_operator
+    assert operator_cache.hits == 1
+    assert operator_cache.misses == 1
+    assert len(operator_cache) == 1
+
+
+def test_get_operator_returns_different_operators_for_different_parameters(operator_cache: OperatorCache):
+    first_operator = operator_cache.get_operator("start-painting", NURIKABE_START_PAINTING_CALL)
+    second_operator = operator_cache.get_operator("start-painting", ["pos-0-1", "g0", "n1", "n0"])
+    assert first_operator is not second_operator
+    assert second_operator.grounded_call_objects == ["pos-0-1", "g0", "n1", "n0"]
+    assert operator_cache.misses == 2
+
+
+def test_get_operator_evicts_least_recently_used_operator_when_cache_is_full(operator_cache: OperatorCache):
+    first_operator = operator_cache.get_operator("start-painting", NURIKABE_START_PAINTING_CALL)
+    operator_cache.get_operator("move-painting", NURIKABE_MOVE_PAINTING_CALL)
+    operator_cache.get_operator("start-painting", NURIKABE_START_PAINTING_CALL)
+    operator_cache.get_operator("start-painting", ["pos-0-1", "g0", "n1", "n0"])
+    assert len(operator_cache) == 2
+    assert operator_cache.get_operator("start-painting", NURIKABE_START_PAINTING_CALL) is first_operator
+    operator_cache.get_operator("move-painting", NURIKABE_MOVE_PAINTING_CALL)
+    assert operator_cache.misses == 4
+
+
+def test_get_operator_does_not_store_operators_when_max_size_is_zero(nurikabe_domain: Domain):
+    operator_cache = OperatorCache(nurikabe_domain, max_size=0)
+    first_operator = operator_cache.get_operator("start-painting", NURIKABE_START_PAINTING_CALL)
+    second_operator = operator_cache.get_operator("start-painting", NURIKABE_START_PAINTING_CALL)
+    assert first_operator is not second_operator
+    assert len(operator_cache) == 0
+    assert operator_cache.misses == 2
+
+
+def test_get_operator_stores_all_operators_when_max_size_is_none(nurikabe_domain: Domain):
+    operator_cache = OperatorCache(nurikabe_domain, max_size=None)
+    for index in range(5):
+        operator_cache.get_operator("start-painting", [f"pos-0-{index}", "g0", "n1", "n0"])
+
+    assert len(operator_cache) == 5
+
+
+def test_clear_removes_operators_and_resets_statistics(operator_cache: OperatorCache):
+    operator_cache.get_operator("start-painting", NURIKABE_START_PAINTING_CALL)
+    operator_cache.get_operator("start-painting", NURIKABE_START_PAINTING_CALL)
+    operator_cache.clear()
+    assert len(operator_cache) == 0
+    assert operator_cache.hits == 0
+    assert operator_cache.misses == 0
+
+
+def test_cached_operator_applied_repeatedly_creates_same_state_as_new_operator(
+        nurikabe_domain: Domain, nurikabe_problem: Problem, operator_cache: OperatorCache):
+    initial_state = State(nurikabe_problem.initial_state_predicates, nurikabe_problem.initial_state_fluents)
+    new_operator = Operator(nurikabe_domain.actions["move-painting"], nurikabe_domain, NURIKABE_MOVE_PAINTING_CALL,
+                            problem_objects=nurikabe_problem.objects)
+    expected_state = new_operator.apply(initial_state, allow_inapplicable_actions=True)
+    for _ in range(2):
+        cached_operator = operator_cache.get_operator("move-painting", NURIKABE_MOVE_PAINTING_CALL)
+        next_state = cached_operator.apply(initial_state, allow_inapplicable_actions=True)
+        assert next_state.serialize() == expected_state.serialize()
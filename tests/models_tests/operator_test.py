@@ -1,4 +1,5 @@
 """Module test for the grounded operator class."""
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Set
 
 from pytest import fixture, fail
@@ -397,3 +398,96 @@ def test_apply_with_action_with_universal_quantifier_applies_effects_on_all_obje
     assert "(part-of pos-4-0 g1)" not in serialized_state
     assert "(blocked pos-2-0)" in serialized_state
     assert "(blocked pos-4-0)" in serialized_state
+
+
+def test_ground_compiles_the_preconditions_and_effects_of_the_operator(operator: Operator):
+    operator.ground()
+    assert operator.grounded_preconditions._compiled_precondition is not None
+    assert all(effect._compiled_effect is not None for effect in operator.grounded_effects)
+
+
+def test_is_applicable_with_compiled_preconditions_returns_same_result_as_interpreted_preconditions(
+        operator: Operator, valid_previous_state: State, previous_state_with_missing_numeric_fluent: State):
+    operator.ground()
+    grounded_precondition_root = operator.grounded_preconditions._grounded_precondition.root
+    for state in [valid_previous_state, previous_state_with_missing_numeric_fluent]:
+        assert operator.is_applicable(state) == operator.grounded_preconditions._is_condition_applicable(
+            grounded_precondition_root, state)
+
+    valid_previous_state.state_predicates.pop("(calibrated ?i)")
+    assert not operator.is_applicable(valid_previous_state)
+    assert not operator.grounded_preconditions._is_condition_applicable(
+        grounded_precondition_root, valid_previous_state)
+
+
+def test_apply_with_compiled_effects_returns_same_state_as_interpreted_effects(
+        spider_domain: Domain, spider_problem: Problem):
+    initial_state = State(spider_problem.initial_state_predicates, spider_problem.initial_state_fluents)
+    states = []
+    for compile_effects in [True, False]:
+        start_dealing_operator = Operator(spider_domain.actions["start-dealing"], spider_domain,
+                                          SPIDER_START_DEALING_CALL)
+        deal_card_operator = Operator(spider_domain.actions["deal-card"], spider_domain, SPIDER_DEAL_CARD_CALL)
+        for test_operator in [start_dealing_operator, deal_card_operator]:
+            test_operator.ground()
+            if not compile_effects:
+                for effect in test_operator.grounded_effects:
+                    effect._compiled_effect = None
+
+        second_state = start_dealing_operator.apply(initial_state.copy())
+        states.append(deal_card_operator.apply(second_state))
+
+    assert states[0] == states[1]
+
+
+def test_apply_same_operator_twice_does_not_change_the_intermediate_state(
+        domain: Domain, operator: Operator, valid_previous_state: State):
+    next_state = operator.apply(valid_previous_state)
+    data_stored_value = next_state.state_fluents["(data-stored )"].value
+    operator.apply(next_state, allow_inapplicable_actions=True)
+    assert next_state.state_fluents["(data-stored )"].value == data_stored_value
+
+
+def test_apply_does_not_change_the_previous_state_and_shares_its_unchanged_facts(
+        nurikabe_move_painting_operator: Operator, nurikabe_problem: Problem):
+    initial_state = State(nurikabe_problem.initial_state_predicates, nurikabe_problem.initial_state_fluents)
+    initial_state_copy = initial_state.copy()
+    new_state = nurikabe_move_painting_operator.apply(initial_state, allow_inapplicable_actions=True)
+    assert initial_state == initial_state_copy
+    assert new_state != initial_state
+    assert new_state.state_predicates["(blocked ?x)"] is not initial_state.state_predicates["(blocked ?x)"]
+    unchanged_predicates = [
+        lifted_predicate_str for lifted_predicate_str, grounded_predicates in new_state.state_predicates.items()
+        if grounded_predicates is initial_state.state_predicates.get(lifted_predicate_str)]
+    assert len(unchanged_predicates) > 0
+
+
+def test_apply_with_universal_effects_does_not_change_the_lifted_action_signature(
+        nurikabe_move_painting_operator: Operator, nurikabe_problem: Problem):
+    original_signature = dict(nurikabe_move_painting_operator.action.signature)
+    initial_state = State(nurikabe_problem.initial_state_predicates, nurikabe_problem.initial_state_fluents)
+    nurikabe_move_painting_operator.apply(initial_state, allow_inapplicable_actions=True)
+    assert nurikabe_move_painting_operator.action.signature == original_signature
+
+
+def test_is_applicable_when_operator_is_shared_between_threads_returns_correct_results(
+        domain: Domain, operator: Operator, complete_state_predicates: Dict[str, Set[GroundedPredicate]]):
+    states = []
+    for data_value in range(20):
+        data_capacity_function = PDDLFunction(name="data_capacity", signature={"s1": domain.types["satellite"]})
+        data_capacity_function.set_value(10)
+        data_function = PDDLFunction(name="data", signature={
+            "test_direction": domain.types["direction"],
+            "test_mode": domain.types["mode"]
+        })
+        data_function.set_value(data_value)
+        states.append(State(predicates=complete_state_predicates, fluents={
+            data_capacity_function.untyped_representation: data_capacity_function,
+            data_function.untyped_representation: data_function,
+        }))
+
+    operator.ground()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(operator.is_applicable, states * 10))
+
+    assert results == [data_value <= 10 for data_value in range(20)] * 10
@@ -209,3 +209,112 @@ def test_contains_when_item_inside_a_nested_precondition_returns_true(
     test_inner_precondition.add_condition(tested_predicate)
     simple_precondition.add_condition(test_inner_precondition)
     assert tested_predicate in simple_precondition
+
+
+def test_add_condition_with_check_duplications_does_not_add_structurally_equal_numeric_expression(
+    simple_precondition: Precondition, domain: Domain
+):
+    numeric_condition_expression = [">=", ["fuel", "?s"], ["slew_time", "?d_new", "?d_prev"]]
+    for _ in range(2):
+        simple_precondition.add_condition(
+            NumericalExpressionTree(construct_expression_tree(numeric_condition_expression, domain.functions)),
+            check_duplications=True,
+        )
+
+    assert len(simple_precondition.operands) == 1
+
+
+def test_remove_condition_removes_structurally_equal_numeric_expression_from_nested_precondition(
+    simple_precondition: Precondition, domain: Domain
+):
+    numeric_condition_expression = [">=", ["fuel", "?s"], ["slew_time", "?d_new", "?d_prev"]]
+    inner_precondition = Precondition("or")
+    inner_precondition.add_condition(
+        NumericalExpressionTree(construct_expression_tree(numeric_condition_expression, domain.functions))
+    )
+    simple_precondition.add_condition(inner_precondition)
+    equal_expression = NumericalExpressionTree(construct_expression_tree(numeric_condition_expression, domain.functions))
+    assert equal_expression in simple_precondition
+    assert simple_precondition.remove_condition(equal_expression)
+    assert equal_expression not in simple_precondition
+    assert len(inner_precondition.operands) == 0
+
+
+def test_change_signature_updates_the_keys_of_the_operands(simple_precondition: Precondition, domain: Domain):
+    test_predicate = domain.predicates["on_board"].copy()
+    simple_precondition.add_condition(test_predicate)
+    simple_precondition.change_signature({"?i": "?param_0", "?s": "?param_1"})
+    renamed_predicate = Predicate(name="on_board", signature=test_predicate.signature.copy())
+    assert renamed_predicate in simple_precondition
+    assert simple_precondition.remove_condition(renamed_predicate)
+    assert len(simple_precondition.operands) == 0
+
+
+def test_hash_of_equal_preconditions_is_equal(simple_precondition: Precondition, domain: Domain):
+    other_precondition = Precondition("and")
+    for precondition in [simple_precondition, other_precondition]:
+        precondition.add_condition(domain.predicates["on_board"])
+        precondition.add_condition(domain.predicates["power_avail"])
+
+    assert simple_precondition == other_precondition
+    assert hash(simple_precondition) == hash(other_precondition)
+    other_precondition.add_condition(domain.predicates["power_on"])
+    assert simple_precondition.key != other_precondition.key
+
+
+def test_contains_returns_false_after_popping_the_operand_directly_from_the_operands(
+    simple_precondition: Precondition, domain: Domain
+):
+    test_predicate = domain.predicates["on_board"]
+    simple_precondition.add_condition(test_predicate)
+    assert test_predicate in simple_precondition
+
+    simple_precondition.operands.pop()
+    assert test_predicate not in simple_precondition
+    simple_precondition.add_condition(test_predicate, check_duplications=True)
+    assert len(simple_precondition.operands) == 1
+
+
+def test_add_condition_with_check_duplications_uses_operands_that_were_replaced_in_the_operands_directly(
+    simple_precondition: Precondition, domain: Domain
+):
+    simple_precondition.add_condition(domain.predicates["on_board"])
+    simple_precondition.operands.discard(domain.predicates["on_board"])
+    simple_precondition.operands.add(domain.predicates["power_avail"])
+
+    simple_precondition.add_condition(domain.predicates["power_avail"], check_duplications=True)
+    simple_precondition.add_condition(domain.predicates["on_board"], check_duplications=True)
+    assert len(simple_precondition.operands) == 2
+    assert simple_precondition.remove_condition(domain.predicates["power_avail"])
+    assert str(simple_precondition) == "(and (on_board ?i ?s))"
+
+
+def test_add_condition_adds_a_nested_precondition_that_is_equal_to_a_precondition_inside_a_disjunction(
+    simple_precondition: Precondition, domain: Domain
+):
+    inner_conjunction = Precondition("and")
+    inner_conjunction.add_condition(domain.predicates["power_on"])
+    inner_conjunction.add_condition(domain.predicates["calibrated"])
+    disjunction = Precondition("or")
+    disjunction.add_condition(domain.predicates["power_avail"])
+    disjunction.add_condition(inner_conjunction)
+    simple_precondition.add_condition(disjunction)
+
+    required_conjunction = Precondition("and")
+    required_conjunction.add_condition(domain.predicates["power_on"])
+    required_conjunction.add_condition(domain.predicates["calibrated"])
+    simple_precondition.add_condition(required_conjunction)
+    assert len(simple_precondition.operands) == 2
+    assert required_conjunction in simple_precondition.operands
+
+
+def test_add_condition_does_not_add_a_nested_precondition_that_is_equal_to_a_direct_nested_precondition(
+    simple_precondition: Precondition, domain: Domain
+):
+    for _ in range(2):
+        nested_precondition = Precondition("or")
+        nested_precondition.add_condition(domain.predicates["power_on"])
+        nested_precondition.add_condition(domain.predicates["calibrated"])
+        simple_precondition.add_condition(nested_precondition)
+
+    assert len(simple_precondition.operands) == 1
@@ -1,7 +1,7 @@
 from pytest import fixture
 
 from pddl_plus_parser.lisp_parsers import ProblemParser, DomainParser
-from pddl_plus_parser.models import Domain, Problem, State
+from pddl_plus_parser.models import Domain, Problem, State, GroundedPredicate, GroundedPredicateSet, ObjectType
 from tests.models_tests.consts import TEST_NUMERIC_DOMAIN, TEST_NUMERIC_PROBLEM, SPIDER_DOMAIN_PATH, SPIDER_PROBLEM_PATH
 
 
@@ -91,3 +91,121 @@ def test_get_state_objects_extract_all_objects_from_state(spider_first_state: St
     assert len([obj for obj in objects.keys() if obj.startswith("card")]) == 24
     assert len([obj for obj in objects.keys() if obj.startswith("pile")]) == 4
     assert len([obj for obj in objects.keys() if obj.startswith("deal")]) == 3
+
+
+def test_holds_returns_true_for_fact_in_the_state(spider_first_state: State):
+    predicate = next(iter(spider_first_state.state_predicates["(clear ?c)"]))
+    assert spider_first_state.holds(predicate)
+
+
+def test_holds_returns_false_after_fact_is_removed_from_the_state(spider_first_state: State):
+    state = spider_first_state.copy()
+    predicate = state.state_predicates["(clear ?c)"].pop()
+    assert not state.holds(predicate)
+
+
+def test_holds_does_not_match_fact_whose_representation_is_contained_in_a_fluent(agricola_problem: Problem):
+    state = State(predicates={}, fluents=agricola_problem.initial_state_fluents)
+    fluent = state.state_fluents["(group_worker_cost worker2)"]
+    predicate = GroundedPredicate(
+        name=fluent.name, signature=fluent.signature, object_mapping={param: param for param in fluent.signature})
+    assert predicate.untyped_representation in state.serialize()
+    assert not state.holds(predicate)
+
+
+def test_holds_returns_correct_result_after_fact_is_added_to_the_state_after_the_first_lookup(
+        spider_first_state: State):
+    state = spider_first_state.copy()
+    predicate = state.state_predicates["(clear ?c)"].pop()
+    assert not state.holds(predicate)
+
+    state.state_predicates["(clear ?c)"].add(predicate)
+    assert state.holds(predicate)
+
+
+def test_holds_returns_correct_result_after_same_size_in_place_change_of_the_groundings(spider_first_state: State):
+    state = spider_first_state.copy()
+    grounded_predicates = state.state_predicates["(clear ?c)"]
+    removed_predicate = next(iter(grounded_predicates))
+    assert state.holds(removed_predicate)
+
+    added_predicate = GroundedPredicate(
+        name="clear", signature=removed_predicate.signature, object_mapping={
+            parameter_name: "new-card" for parameter_name in removed_predicate.signature})
+    grounded_predicates.discard(removed_predicate)
+    grounded_predicates.add(added_predicate)
+    assert not state.holds(removed_predicate)
+    assert state.holds(added_predicate)
+
+
+def test_holds_searches_groundings_stored_in_a_regular_set(spider_first_state: State):
+    state = State(
+        predicates={name: set(predicates) for name, predicates in spider_first_state.state_predicates.items()},
+        fluents=spider_first_state.state_fluents)
+    predicate = state.state_predicates["(clear ?c)"].pop()
+    assert not state.holds(predicate)
+
+    state.state_predicates["(clear ?c)"].add(predicate)
+    assert state.holds(predicate)
+
+
+def test_holds_matches_facts_whose_parameter_types_differ_from_the_state_facts(spider_first_state: State):
+    predicate = next(iter(spider_first_state.state_predicates["(clear ?c)"]))
+    differently_typed_predicate = GroundedPredicate(
+        name=predicate.name, signature={parameter_name: ObjectType for parameter_name in predicate.signature},
+        object_mapping=predicate.object_mapping)
+    assert isinstance(spider_first_state.state_predicates["(clear ?c)"], GroundedPredicateSet)
+    assert spider_first_state.holds(differently_typed_predicate)
+
+
+def test_create_successor_shares_the_groundings_and_fluents_with_the_state(agricola_problem: Problem):
+    state = State(agricola_problem.initial_state_predicates, agricola_problem.initial_state_fluents)
+    successor = state.create_successor()
+    assert successor == state
+    assert successor.state_predicates is not state.state_predicates
+    for lifted_predicate_str, grounded_predicates in state.state_predicates.items():
+        assert successor.state_predicates[lifted_predicate_str] is grounded_predicates
+
+    for fluent_name, fluent in state.state_fluents.items():
+        assert successor.state_fluents[fluent_name] is fluent
+
+
+def test_get_mutable_groundings_copies_shared_groundings_only_once(spider_first_state: State):
+    successor = spider_first_state.create_successor()
+    shared_predicates = spider_first_state.state_predicates["(clear ?c)"]
+    predicate = next(iter(shared_predicates))
+    successor.get_mutable_groundings("(clear ?c)").discard(predicate)
+    assert not successor.holds(predicate)
+    assert spider_first_state.holds(predicate)
+    assert successor.get_mutable_groundings("(clear ?c)") is successor.state_predicates["(clear ?c)"]
+    assert successor.state_predicates["(clear ?c)"] is not shared_predicates
+
+
+def test_get_mutable_groundings_on_the_predecessor_does_not_change_the_successor(spider_first_state: State):
+    successor = spider_first_state.create_successor()
+    predicate = next(iter(spider_first_state.state_predicates["(clear ?c)"]))
+    spider_first_state.get_mutable_groundings("(clear ?c)").discard(predicate)
+    assert not spider_first_state.holds(predicate)
+    assert successor.holds(predicate)
+
+
+def test_get_mutable_groundings_creates_groundings_set_for_missing_predicate(spider_first_state: State):
+    successor = spider_first_state.create_successor()
+    grounded_predicates = successor.get_mutable_groundings("(missing ?c)")
+    assert grounded_predicates == set()
+    assert successor.state_predicates["(missing ?c)"] is grounded_predicates
+    assert "(missing ?c)" not in spider_first_state.state_predicates
+
+
+def test_copy_shares_the_grounded_predicates_but_not_their_sets(spider_first_state: State):
+    copied_state = spider_first_state.copy()
+    original_predicates = spider_first_state.state_predicates["(clear ?c)"]
+    copied_predicates = copied_state.state_predicates["(clear ?c)"]
+    assert copied_predicates is not original_predicates
+    assert isinstance(copied_predicates, GroundedPredicateSet)
+    assert {id(predicate) for predicate in copied_predicates} == {id(predicate) for predicate in original_predicates}
+
+    predicate = next(iter(copied_predicates))
+    copied_predicates.discard(predicate)
+    assert not copied_state.holds(predicate)
+    assert spider_first_state.holds(predicate)
@@ -1,7 +1,7 @@
 """Contains some tests for the functionality in the PDDL domain class."""
 import networkx as nx
 
-from pddl_plus_parser.models import PDDLType
+from pddl_plus_parser.models import PDDLType, PDDLObject, TypeHierarchyIndex, Domain
 from pddl_plus_parser.models.pddl_type import create_type_hierarchy_graph
 
 t1 = PDDLType("object")
@@ -74,4 +74,59 @@ def test_create_type_hierarchy_graph_creates_correct_graph_from_input_data_also_
     type_hierarchy_graph = create_type_hierarchy_graph(types_dict)
     root = find_root_nodes(type_hierarchy_graph)
     hierarchy_with_parents = [(child, parent) for parent, child in nx.bfs_edges(type_hierarchy_graph, root)]
-    print(hierarchy_with_parents)
\ No newline at end of file
+    print(hierarchy_with_parents)
+
+
+TEST_TYPES = {
+    "object": t1,
+    "vehicle": t2,
+    "car": t3,
+    "truck": t4,
+    "sedan": t5,
+    "hatchback": t6,
+    "pickup": t7,
+    "bus": t8
+}
+
+
+def test_type_hierarchy_index_is_sub_type_returns_same_result_as_pddl_type_is_sub_type():
+    type_hierarchy = TypeHierarchyIndex(TEST_TYPES)
+    for my_type in TEST_TYPES.values():
+        for other_type in TEST_TYPES.values():
+            assert type_hierarchy.is_sub_type(my_type, other_type) == my_type.is_sub_type(other_type)
+
+
+def test_type_hierarchy_index_is_sub_type_with_type_not_in_index_falls_back_to_parent_chain():
+    type_hierarchy = TypeHierarchyIndex(TEST_TYPES)
+    limousine_type = PDDLType("limousine", t5)
+    assert type_hierarchy.is_sub_type(limousine_type, t2)
+    assert not type_hierarchy.is_sub_type(limousine_type, t4)
+
+
+def test_type_hierarchy_index_get_sub_types_returns_the_type_and_all_its_descendants():
+    type_hierarchy = TypeHierarchyIndex(TEST_TYPES)
+    assert type_hierarchy.get_sub_types(t3) == {"car", "sedan", "hatchback"}
+    assert type_hierarchy.get_sub_types("bus") == {"bus"}
+    assert type_hierarchy.get_sub_types("object") == set(TEST_TYPES.keys())
+
+
+def test_type_hierarchy_index_group_objects_by_type_maps_every_ancestor_type_to_its_objects():
+    type_hierarchy = TypeHierarchyIndex(TEST_TYPES)
+    sedan = PDDLObject(name="sedan1", type=t5)
+    pickup = PDDLObject(name="pickup1", type=t7)
+    bus = PDDLObject(name="bus1", type=t8)
+    objects_by_type = type_hierarchy.group_objects_by_type([sedan, pickup, bus])
+    assert objects_by_type["vehicle"] == [sedan, pickup, bus]
+    assert objects_by_type["car"] == [sedan]
+    assert objects_by_type["truck"] == [pickup]
+    assert "hatchback" not in objects_by_type
+
+
+def test_domain_type_hierarchy_is_rebuilt_when_types_are_added():
+    domain = Domain()
+    domain.types = {"object": t1, "vehicle": t2}
+    first_index = domain.type_hierarchy
+    assert domain.type_hierarchy is first_index
+    domain.types["car"] = t3
+    assert domain.type_hierarchy is not first_index
+    assert domain.type_hierarchy.is_sub_type(t3, t2)
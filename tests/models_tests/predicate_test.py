@@ -1,5 +1,9 @@
 """Tests some basic functionality of the Predicate class."""
-from pddl_plus_parser.models import Predicate, PDDLType
+import pickle
+
+import pytest
+
+from pddl_plus_parser.models import Predicate, PDDLType, GroundedPredicate, GroundedPredicatePool
 
 
 def test_predicate_copy_with_negated_option_false_returns_the_previous_predicate_with_its_own_is_positive_value():
@@ -120,3 +124,166 @@ def test_change_signature_returns_correct_form_of_predicate_with_signature_chang
     )
     predicate.change_signature({"?truck": "?param_0", "?driver": "?param_1"})
     assert predicate == expected_predicate_output
+
+
+def test_grounded_predicate_representations_are_computed_at_construction():
+    # Arrange
+    object_type = PDDLType("object")
+    grounded_predicate = GroundedPredicate(
+        name="at",
+        signature={"?x": object_type, "?y": object_type},
+        object_mapping={"?x": "truck1", "?y": "depot0"},
+        is_positive=False,
+    )
+
+    # Assert
+    assert grounded_predicate.untyped_representation == "(not (at truck1 depot0))"
+    assert grounded_predicate.lifted_untyped_representation == "(not (at ?x ?y))"
+    assert str(grounded_predicate) == "(not (at truck1 - object depot0 - object))"
+    assert hash(grounded_predicate) == hash("(not (at truck1 - object depot0 - object))")
+
+
+def test_grounded_predicate_representations_are_updated_when_is_positive_is_changed():
+    # Arrange
+    grounded_predicate = GroundedPredicate(
+        name="at", signature={"?x": PDDLType("object")}, object_mapping={"?x": "truck1"}, is_positive=False
+    )
+
+    # Act
+    grounded_predicate.is_positive = True
+
+    # Assert
+    assert grounded_predicate.untyped_representation == "(at truck1)"
+    assert hash(grounded_predicate) == hash("(at truck1 - object)")
+
+
+def test_grounded_predicate_copy_with_negated_option_returns_predicate_with_negated_representation():
+    # Arrange
+    grounded_predicate = GroundedPredicate(
+        name="at", signature={"?x": PDDLType("object")}, object_mapping={"?x": "truck1"}, is_positive=False
+    )
+
+    # Act
+    result = grounded_predicate.copy(is_negated=True)
+
+    # Assert
+    assert result.untyped_representation == "(at truck1)"
+    assert grounded_predicate.untyped_representation == "(not (at truck1))"
+
+
+def test_grounded_predicate_change_signature_updates_the_lifted_representation_and_keeps_the_grounded_objects():
+    # Arrange
+    grounded_predicate = GroundedPredicate(
+        name="at", signature={"?x": PDDLType("object")}, object_mapping={"?x": "truck1"}
+    )
+
+    # Act
+    grounded_predicate.change_signature({"?x": "?param_0"})
+
+    # Assert
+    assert grounded_predicate.lifted_untyped_representation == "(at ?param_0)"
+    assert grounded_predicate.untyped_representation == "(at truck1)"
+
+
+def test_grounded_predicate_object_mapping_and_signature_cannot_be_changed_inline():
+    # Arrange
+    object_mapping = {"?x": "truck1"}
+    grounded_predicate = GroundedPredicate(
+        name="at", signature={"?x": PDDLType("object")}, object_mapping=object_mapping
+    )
+
+    # Act
+    object_mapping["?x"] = "truck2"
+
+    # Assert
+    assert grounded_predicate.untyped_representation == "(at truck1)"
+    with pytest.raises(TypeError):
+        grounded_predicate.object_mapping["?x"] = "truck2"
+
+    with pytest.raises(TypeError):
+        grounded_predicate.signature["?y"] = PDDLType("object")
+
+
+def test_grounded_predicate_is_equal_to_itself_after_pickling():
+    # Arrange
+    grounded_predicate = GroundedPredicate(
+        name="at", signature={"?x": PDDLType("object")}, object_mapping={"?x": "truck1"}, is_positive=False
+    )
+
+    # Act
+    result = pickle.loads(pickle.dumps(grounded_predicate))
+
+    # Assert
+    assert result == grounded_predicate
+    assert hash(result) == hash(grounded_predicate)
+    assert result.untyped_representation == "(not (at truck1))"
+
+
+def test_grounded_predicate_pool_returns_the_same_object_for_the_same_fact():
+    # Arrange
+    pool = GroundedPredicatePool()
+    object_type = PDDLType("object")
+
+    # Act
+    first_predicate = pool.get_or_create("at", {"?x": object_type}, {"?x": "truck1"})
+    second_predicate = pool.get_or_create("at", {"?x": object_type}, {"?x": "truck1"})
+    other_predicate = pool.get_or_create("at", {"?x": object_type}, {"?x": "truck2"})
+
+    # Assert
+    assert first_predicate is second_predicate
+    assert first_predicate is not other_predicate
+    assert len(pool) == 2
+
+
+def test_grounded_predicate_pool_returns_different_objects_for_different_polarities():
+    # Arrange
+    pool = GroundedPredicatePool()
+    object_type = PDDLType("object")
+
+    # Act
+    positive_predicate = pool.get_or_create("at", {"?x": object_type}, {"?x": "truck1"})
+    negative_predicate = pool.get_or_create("at", {"?x": object_type}, {"?x": "truck1"}, is_positive=False)
+
+    # Assert
+    assert positive_predicate is not negative_predicate
+    assert positive_predicate != negative_predicate
+
+
+def test_key_is_reset_when_the_signature_or_the_positivity_of_the_predicate_change():
+    # Arrange
+    predicate = Predicate(name="at", signature={"?x": PDDLType("object"), "?y": PDDLType("object")})
+    assert predicate.key == ("at", ("?x", "?y"), True)
+
+    # Act
+    predicate.change_signature({"?x": "?param_0", "?y": "?param_1"})
+    predicate.is_positive = False
+
+    # Assert
+    assert predicate.key == ("at", ("?param_0", "?param_1"), False)
+
+
+def test_key_matches_the_signature_after_changing_the_signature_inline():
+    # Arrange
+    predicate = Predicate(name="at", signature={"?x": PDDLType("object")})
+    assert predicate.key == ("at", ("?x",), True)
+
+    # Act
+    predicate.signature["?y"] = PDDLType("object")
+
+    # Assert
+    assert predicate.key == ("at", ("?x", "?y"), True)
+
+
+def test_grounded_predicate_key_contains_the_grounded_objects():
+    # Arrange
+    object_type = PDDLType("object")
+    grounded_predicate = GroundedPredicate(
+        name="at",
+        signature={"?x": object_type, "?y": object_type},
+        object_mapping={"?x": "truck1", "?y": "depot0"},
+    )
+
+    # Assert
+    assert grounded_predicate.key == ("at", ("truck1", "depot0"), True)
+    grounded_predicate.is_positive = False
+    assert grounded_predicate.key == ("at", ("truck1", "depot0"), False)
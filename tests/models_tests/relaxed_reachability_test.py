@@ -0,0 +1,172 @@
+from pathlib import Path
+
+from pytest import fixture
+
+from pddl_plus_parser.lisp_parsers import DomainParser, ProblemParser, TrajectoryParser
+from pddl_plus_parser.models import (
+    Domain,
+    Problem,
+    VocabularyCreator,
+    RelaxedReachabilityAnalysis,
+    ActionCall,
+    PDDLFunction,
+    PDDLType,
+    calculate_interval,
+    construct_expression_tree,
+)
+from tests.models_tests.consts import (
+    MICONIC_NESTED_DOMAIN_PATH,
+    MICONIC_NESTED_PROBLEM_PATH,
+    MICONIC_TRAJECTORY_PATH,
+    DEPOTS_NUMERIC_DOMAIN_PATH,
+    DEPOTS_NUMERIC_PROBLEM_PATH,
+)
+
+JUGS_DOMAIN = """(define (domain jugs)
+(:requirements :strips :typing :numeric-fluents)
+(:types jug)
+(:predicates (open ?j - jug) (has-key))
+(:functions (amount ?j - jug))
+(:action open-jug
+    :parameters (?j - jug)
+    :precondition (and (has-key))
+    :effect (and (open ?j)))
+(:action empty
+    :parameters (?j - jug)
+    :precondition (and (> (amount ?j) 0))
+    :effect (and (decrease (amount ?j) 1)))
+(:action overflow
+    :parameters (?j - jug)
+    :precondition (and (> (amount ?j) 100))
+    :effect (and (assign (amount ?j) 0)))
+)
+"""
+
+JUGS_PROBLEM = """(define (problem jugs-problem) (:domain jugs)
+(:objects jug1 jug2 - jug)
+(:init (= (amount jug1) 5) (= (amount jug2) 0))
+(:goal (and (open jug1))))
+"""
+
+ROOMS_DOMAIN = """(define (domain rooms)
+(:requirements :strips :typing :numeric-fluents)
+(:types room)
+(:predicates (at ?r - room) (connected ?from - room ?to - room) (charger ?r - room))
+(:functions (battery))
+(:action move
+    :parameters (?from - room ?to - room)
+    :precondition (and (at ?from) (connected ?from ?to))
+    :effect (and (at ?to) (decrease (battery) 1)))
+(:action recharge
+    :parameters (?r - room)
+    :precondition (and (at ?r) (charger ?r))
+    :effect (and (increase (battery) 10)))
+(:action teleport
+    :parameters (?r - room)
+    :precondition (and (>= (battery) 5))
+    :effect (and (at ?r)))
+)
+"""
+
+ROOMS_PROBLEM = """(define (problem rooms-problem) (:domain rooms)
+(:objects r1 r2 r3 - room)
+(:init (at r1) (connected r1 r2) (connected r2 r3) (charger r3) (= (battery) 2))
+(:goal (and (at r3))))
+"""
+
+TEST_DOMAIN_FUNCTIONS = {"amount": PDDLFunction(name="amount", signature={"?jug": PDDLType(name="jug")})}
+
+
+@fixture()
+def jugs_domain() -> Domain:
+    return DomainParser(domain_str=JUGS_DOMAIN).parse_domain()
+
+
+@fixture()
+def jugs_problem(jugs_domain: Domain, tmp_path: Path) -> Problem:
+    problem_path = tmp_path / "jugs_problem.pddl"
+    problem_path.write_text(JUGS_PROBLEM)
+    return ProblemParser(problem_path=problem_path, domain=jugs_domain).parse_problem()
+
+
+def test_calculate_interval_calculates_interval_of_expression_with_fluents():
+    expression_node = construct_expression_tree(["-", ["*", ["amount", "?jug"], "2"], "1"], TEST_DOMAIN_FUNCTIONS)
+    assert calculate_interval(expression_node, {"(amount ?jug)": (1.0, 3.0)}) == (1.0, 5.0)
+
+
+def test_calculate_interval_when_fluent_is_not_defined_returns_none():
+    expression_node = construct_expression_tree(["+", ["amount", "?jug"], "2"], TEST_DOMAIN_FUNCTIONS)
+    assert calculate_interval(expression_node, {}) is None
+
+
+def test_calculate_interval_when_dividing_by_interval_containing_zero_returns_unbounded_interval():
+    expression_node = construct_expression_tree(["/", "1", ["amount", "?jug"]], TEST_DOMAIN_FUNCTIONS)
+    assert calculate_interval(expression_node, {"(amount ?jug)": (-1.0, 1.0)}) == (float("-inf"), float("inf"))
+
+
+def test_filter_reachable_actions_removes_actions_with_unreachable_facts_and_numeric_conditions(
+    jugs_domain: Domain, jugs_problem: Problem
+):
+    action_calls = VocabularyCreator().create_grounded_actions_vocabulary(jugs_domain, jugs_problem.objects)
+    reachable_actions = RelaxedReachabilityAnalysis(jugs_domain, jugs_problem).filter_reachable_actions(action_calls)
+    assert {str(action_call) for action_call in reachable_actions} == {"(empty jug1)"}
+
+
+def test_filter_reachable_actions_widens_intervals_of_repeatedly_changed_fluents(
+    jugs_domain: Domain, jugs_problem: Problem
+):
+    reachability_analysis = RelaxedReachabilityAnalysis(jugs_domain, jugs_problem)
+    reachability_analysis.filter_reachable_actions([ActionCall("empty", ["jug1"])])
+    assert reachability_analysis.fluent_intervals["(amount jug1)"] == (float("-inf"), 5.0)
+    assert reachability_analysis.fluent_intervals["(amount jug2)"] == (0.0, 0.0)
+
+
+def test_filter_reachable_actions_returns_actions_in_input_order(jugs_domain: Domain, jugs_problem: Problem):
+    action_calls = [ActionCall("overflow", ["jug1"]), ActionCall("empty", ["jug1"]), ActionCall("empty", ["jug2"])]
+    reachable_actions = RelaxedReachabilityAnalysis(jugs_domain, jugs_problem).filter_reachable_actions(action_calls)
+    assert reachable_actions == [ActionCall("empty", ["jug1"])]
+
+
+def test_filter_reachable_actions_with_lazy_action_calls_reaches_actions_that_depend_on_later_action_calls(
+    tmp_path: Path,
+):
+    domain = DomainParser(domain_str=ROOMS_DOMAIN).parse_domain()
+    problem_path = tmp_path / "rooms_problem.pddl"
+    problem_path.write_text(ROOMS_PROBLEM)
+    problem = ProblemParser(problem_path=problem_path, domain=domain).parse_problem()
+    action_calls = [
+        ActionCall("teleport", ["r1"]),
+        ActionCall("recharge", ["r3"]),
+        ActionCall("move", ["r2", "r3"]),
+        ActionCall("recharge", ["r1"]),
+        ActionCall("move", ["r3", "r1"]),
+        ActionCall("move", ["r1", "r2"]),
+    ]
+    reachable_actions = RelaxedReachabilityAnalysis(domain, problem).filter_reachable_actions(
+        action_call for action_call in action_calls
+    )
+    assert reachable_actions == [
+        ActionCall("teleport", ["r1"]),
+        ActionCall("recharge", ["r3"]),
+        ActionCall("move", ["r2", "r3"]),
+        ActionCall("move", ["r1", "r2"]),
+    ]
+
+
+def test_create_reachable_grounded_actions_vocabulary_contains_all_the_actions_of_a_valid_plan():
+    domain = DomainParser(MICONIC_NESTED_DOMAIN_PATH).parse_domain()
+    problem = ProblemParser(problem_path=MICONIC_NESTED_PROBLEM_PATH, domain=domain).parse_problem()
+    observation = TrajectoryParser(domain, problem).parse_trajectory(MICONIC_TRAJECTORY_PATH)
+    reachable_actions = VocabularyCreator().create_reachable_grounded_actions_vocabulary(domain, problem)
+    for component in observation.components:
+        assert component.grounded_action_call in reachable_actions
+
+
+def test_create_reachable_grounded_actions_vocabulary_returns_subset_of_all_grounded_actions():
+    domain = DomainParser(DEPOTS_NUMERIC_DOMAIN_PATH).parse_domain()
+    problem = ProblemParser(problem_path=DEPOTS_NUMERIC_PROBLEM_PATH, domain=domain).parse_problem()
+    vocabulary_creator = VocabularyCreator()
+    all_actions = vocabulary_creator.create_grounded_actions_vocabulary(domain, problem.objects)
+    reachable_actions = vocabulary_creator.create_reachable_grounded_actions_vocabulary(domain, problem)
+    assert reachable_actions.issubset(all_actions)
+    assert len(reachable_actions) < len(all_actions)
@@ -0,0 +1,98 @@
+"""Module test for the simplification cache."""
+import json
+from pathlib import Path
+
+import pytest
+
+from pddl_plus_parser.models import SimplificationCache, SIMPLIFICATION_CACHE
+from pddl_plus_parser.models.numeric_symbolic_operations import simplify_inequality, simplify_equality
+
+TEST_INEQUALITY = "((capacity ?a) + (2 * (capacity ?a)) <= 10)"
+
+
+def test_get_or_compute_computes_result_only_once_for_the_same_key():
+    simplification_cache = SimplificationCache()
+    computations = []
+    for _ in range(3):
+        result = simplification_cache.get_or_compute(("inequality", "x <= 1", 4), lambda: computations.append(1) or "r")
+        assert result == "r"
+
+    assert len(computations) == 1
+    assert simplification_cache.statistics == {"hits": 2, "misses": 1, "evictions": 0, "size": 1}
+
+
+def test_get_or_compute_caches_none_results():
+    simplification_cache = SimplificationCache()
+    simplification_cache.get_or_compute(("equality", "x = x", 4), lambda: None)
+    assert simplification_cache.get_or_compute(("equality", "x = x", 4), lambda: "wrong") is None
+    assert simplification_cache.hits == 1
+
+
+def test_get_or_compute_evicts_least_recently_used_results_when_the_cache_is_full():
+    simplification_cache = SimplificationCache(max_size=2)
+    simplification_cache.get_or_compute(("a",), lambda: "a")
+    simplification_cache.get_or_compute(("b",), lambda: "b")
+    simplification_cache.get_or_compute(("a",), lambda: "a")
+    simplification_cache.get_or_compute(("c",), lambda: "c")
+    assert simplification_cache.evictions == 1
+    assert simplification_cache.get_or_compute(("a",), lambda: "new a") == "a"
+    assert simplification_cache.get_or_compute(("b",), lambda: "new b") == "new b"
+
+
+def test_get_or_compute_does_not_cache_results_of_failed_computations():
+    simplification_cache = SimplificationCache()
+
+    def fail():
+        raise ValueError("Cannot simplify the expression")
+
+    with pytest.raises(ValueError):
+        simplification_cache.get_or_compute(("a",), fail)
+
+    assert len(simplification_cache) == 0
+    assert simplification_cache.get_or_compute(("a",), lambda: "a") == "a"
+
+
+def test_load_saved_cache_restores_the_cached_results(tmp_path: Path):
+    simplification_cache = SimplificationCache()
+    simplification_cache.get_or_compute(("inequality", "x <= 1", "<=", ("x = y",), 4), lambda: "(<= x 1)")
+    simplification_cache.save(tmp_path / "cache.json")
+    loaded_cache = SimplificationCache()
+    loaded_cache.load(tmp_path / "cache.json")
+    assert loaded_cache.get_or_compute(("inequality", "x <= 1", "<=", ("x = y",), 4), lambda: "wrong") == "(<= x 1)"
+    assert loaded_cache.hits == 1
+
+
+def test_load_cache_saved_by_another_version_ignores_the_results(tmp_path: Path):
+    cache_path = tmp_path / "cache.json"
+    with open(cache_path, "wt") as cache_file:
+        json.dump({"version": "0.0.0", "results": [[["a"], "a"]]}, cache_file)
+
+    simplification_cache = SimplificationCache()
+    simplification_cache.load(cache_path)
+    assert len(simplification_cache) == 0
+
+
+def test_load_corrupted_cache_file_does_not_raise_error(tmp_path: Path):
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_text("not a json file")
+    simplification_cache = SimplificationCache()
+    simplification_cache.load(cache_path)
+    assert len(simplification_cache) == 0
+
+
+def test_simplify_inequality_with_same_expression_uses_the_process_wide_cache():
+    SIMPLIFICATION_CACHE.clear()
+    first_result = simplify_inequality(TEST_INEQUALITY, "<=")
+    second_result = simplify_inequality(TEST_INEQUALITY.replace(" + ", "  +  "), "<=")
+    assert first_result == second_result
+    assert SIMPLIFICATION_CACHE.hits == 1
+    simplify_inequality(TEST_INEQUALITY, "<=", decimal_digits=2)
+    assert SIMPLIFICATION_CACHE.misses == 2
+
+
+def test_simplify_equality_with_trivial_equality_caches_the_none_result():
+    SIMPLIFICATION_CACHE.clear()
+    equality = "((capacity ?a) - 54) = ((capacity ?a) - 54)"
+    assert simplify_equality(equality) is None
+    assert simplify_equality(equality) is None
+    assert SIMPLIFICATION_CACHE.hits == 1
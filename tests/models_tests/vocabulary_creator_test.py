@@ -1,9 +1,12 @@
 """Module test for the vocabulary_creator module."""
+import itertools
+from typing import Iterator
 
 from pytest import fixture
 
 from pddl_plus_parser.lisp_parsers import DomainParser, ProblemParser
-from pddl_plus_parser.models import Domain, Problem, VocabularyCreator
+from pddl_plus_parser.models import Domain, Problem, VocabularyCreator, PDDLType, PDDLObject
+from pddl_plus_parser.models.vocabulary_creator import count_distinct_assignments
 from tests.models_tests.consts import (
     ELEVATORS_DOMAIN_PATH,
     ELEVATORS_PROBLEM_PATH,
@@ -153,3 +156,82 @@ def test_create_grounded_actions_vocabulary_creates_actions_that_are_applicable_
     )
     action_signatures = {str(action) for action in vocabulary_actions}
     assert "(tp_to cell15 cell0)" in action_signatures
+
+
+def test_create_grounded_predicate_vocabulary_creates_same_predicates_as_filtering_all_permutations(
+    depot_domain: Domain, vocabulary_creator: VocabularyCreator, depot_problem: Problem
+):
+    objects_and_consts = {**depot_domain.constants, **depot_problem.objects}
+    vocabulary_predicates = vocabulary_creator.create_grounded_predicate_vocabulary(
+        domain=depot_domain, observed_objects=depot_problem.objects
+    )
+    for predicate in depot_domain.predicates.values():
+        expected_groundings = {
+            f"({predicate.name} {' '.join(object_names)})".replace(" )", ")")
+            for object_names in itertools.permutations(objects_and_consts, len(predicate.signature))
+            if all(
+                objects_and_consts[object_name].type.is_sub_type(parameter_type)
+                for object_name, parameter_type in zip(object_names, predicate.signature.values())
+            )
+        }
+        assert {
+            grounded_predicate.untyped_representation
+            for grounded_predicate in vocabulary_predicates.get(predicate.untyped_representation, set())
+        } == expected_groundings
+
+
+def test_iter_grounded_predicate_vocabulary_is_lazy_and_yields_the_vocabulary_predicates(
+    depot_domain: Domain, vocabulary_creator: VocabularyCreator, depot_problem: Problem
+):
+    predicates_iterator = vocabulary_creator.iter_grounded_predicate_vocabulary(depot_domain, depot_problem.objects)
+    assert isinstance(predicates_iterator, Iterator)
+    vocabulary_predicates = vocabulary_creator.create_grounded_predicate_vocabulary(
+        domain=depot_domain, observed_objects=depot_problem.objects
+    )
+    assert {predicate.untyped_representation for predicate in predicates_iterator} == {
+        predicate.untyped_representation for predicates in vocabulary_predicates.values() for predicate in predicates
+    }
+
+
+def test_iter_grounded_actions_vocabulary_yields_the_vocabulary_actions(
+    depot_domain: Domain, vocabulary_creator: VocabularyCreator, depot_problem: Problem
+):
+    first_actions = list(
+        itertools.islice(vocabulary_creator.iter_grounded_actions_vocabulary(depot_domain, depot_problem.objects), 5)
+    )
+    assert len(first_actions) == 5
+    vocabulary_actions = vocabulary_creator.create_grounded_actions_vocabulary(depot_domain, depot_problem.objects)
+    assert {str(action) for action in first_actions}.issubset({str(action) for action in vocabulary_actions})
+
+
+def test_count_grounded_predicate_vocabulary_returns_the_size_of_the_vocabulary(
+    depot_domain: Domain,
+    vocabulary_creator: VocabularyCreator,
+    depot_problem: Problem,
+    woodworking_domain: Domain,
+    woodworking_problem: Problem,
+):
+    for domain, problem in [(depot_domain, depot_problem), (woodworking_domain, woodworking_problem)]:
+        vocabulary_predicates = vocabulary_creator.create_grounded_predicate_vocabulary(domain, problem.objects)
+        assert vocabulary_creator.count_grounded_predicate_vocabulary(domain, problem.objects) == sum(
+            len(predicates) for predicates in vocabulary_predicates.values()
+        )
+
+
+def test_count_grounded_actions_vocabulary_returns_the_size_of_the_vocabulary(
+    depot_domain: Domain, vocabulary_creator: VocabularyCreator, depot_problem: Problem
+):
+    vocabulary_actions = vocabulary_creator.create_grounded_actions_vocabulary(depot_domain, depot_problem.objects)
+    assert vocabulary_creator.count_grounded_actions_vocabulary(depot_domain, depot_problem.objects) == len(
+        vocabulary_actions
+    )
+
+
+def test_count_distinct_assignments_does_not_count_assignments_with_repeating_objects():
+    shared_type = PDDLType("block")
+    objects = [PDDLObject(name=f"b{index}", type=shared_type) for index in range(4)]
+    assert count_distinct_assignments([objects, objects]) == 12
+    assert count_distinct_assignments([objects[:2], objects]) == 6
+    assert count_distinct_assignments([objects[:2], objects[2:]]) == 4
+    assert count_distinct_assignments([objects, []]) == 0
+    assert count_distinct_assignments([]) == 1